@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Tool Catalog Benchmark
+
+Measures, for the full and compact tool catalogs, the size of the tools/list
+response and the latency of a client handshake (initialize + tools/list)
+against an in-memory server.
+
+Usage:
+    python benchmark_catalog.py --runs 20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from fastmcp import Client, FastMCP
+
+from tools import TOOL_CATALOGS, register_tool_catalog
+
+
+async def _handshake(mcp: FastMCP) -> bytes:
+    async with Client(mcp) as client:
+        result = await client.list_tools_mcp()
+    return result.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+
+
+async def measure(catalog: str, runs: int, base_url: str) -> Dict[str, Any]:
+    """
+    Measure the tools/list payload and handshake latency of a catalog.
+
+    Args:
+        catalog: Tool catalog name ("full" or "compact")
+        runs: Number of measured handshakes
+        base_url: BV-BRC API base URL passed to the tools
+
+    Returns:
+        Dictionary with tool count, payload bytes and handshake latencies
+    """
+    mcp = FastMCP(f"BV-BRC Catalog Benchmark ({catalog})")
+    register_tool_catalog(mcp, base_url, catalog)
+
+    # The first handshake warms FastMCP's schema caches
+    payload = await _handshake(mcp)
+    samples: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await _handshake(mcp)
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "tools": len(json.loads(payload)["tools"]),
+        "tools_list_bytes": len(payload),
+        "handshake_median_ms": round(statistics.median(samples) * 1000, 2),
+        "handshake_min_ms": round(min(samples) * 1000, 2),
+        "handshake_max_ms": round(max(samples) * 1000, 2),
+    }
+
+
+def main() -> int:
+    """Command line entry point for the catalog benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark BV-BRC MCP tool catalogs")
+    parser.add_argument("--runs", type=int, default=20, help="Measured handshakes per catalog")
+    parser.add_argument("--base-url", default="https://www.bv-brc.org/api-bulk",
+                        help="BV-BRC API base URL passed to the tools")
+    args = parser.parse_args()
+
+    results = {
+        catalog: asyncio.run(measure(catalog, args.runs, args.base_url))
+        for catalog in TOOL_CATALOGS
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
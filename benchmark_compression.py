@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Compression Benchmark
+
+Measures the CPU-versus-bytes tradeoff of every available response encoding
+and level on representative tool result payloads: JSON result envelopes built
+from recorded cassettes, from a JSON file, or from synthetic genome feature
+records shaped like bvbrc_genome_feature_get_by_genome_id results.
+
+Usage:
+    python benchmark_compression.py --synthetic 20000
+    python benchmark_compression.py --cassette-dir cassettes
+    python benchmark_compression.py --payload result.json --json
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from compression import available_encodings, compress_bytes, zstandard, brotli
+
+LEVELS = {"gzip": (1, 6, 9), "zstd": (1, 3, 9), "br": (1, 4, 9)}
+
+
+def synthetic_features(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Generate genome feature records with realistic field repetition."""
+    rng = random.Random(seed)
+    products = ["hypothetical protein", "ABC transporter ATP-binding protein",
+                "DNA-directed RNA polymerase beta subunit", "Transcriptional regulator, LysR family",
+                "50S ribosomal protein L2", "Outer membrane protein A precursor"]
+    records = []
+    position = 1
+    for i in range(count):
+        length = rng.randint(150, 3000)
+        records.append({
+            "feature_id": f"PATRIC.511145.12.NC_000913.CDS.{position}.{position + length}.fwd",
+            "patric_id": f"fig|511145.12.peg.{i + 1}",
+            "genome_id": "511145.12",
+            "genome_name": "Escherichia coli str. K-12 substr. MG1655",
+            "accession": "NC_000913",
+            "annotation": "PATRIC",
+            "feature_type": "CDS",
+            "start": position,
+            "end": position + length,
+            "strand": rng.choice("+-"),
+            "na_length": length,
+            "aa_length": length // 3,
+            "product": rng.choice(products),
+            "gene": rng.choice(["", "rpoB", "ompA", "rplB", "lysR"]),
+            "aa_sequence_md5": "%032x" % rng.getrandbits(128),
+            "taxon_id": 511145,
+        })
+        position += length + rng.randint(1, 300)
+    return records
+
+
+def _envelope(records: List[Dict[str, Any]]) -> bytes:
+    return json.dumps({"count": len(records), "results": records}, indent=2).encode("utf-8")
+
+
+def load_payloads(args: argparse.Namespace) -> List[Tuple[str, bytes]]:
+    """Collect the payloads to measure as (label, bytes) pairs."""
+    payloads = []
+    if args.payload:
+        with open(args.payload, "rb") as f:
+            payloads.append((os.path.basename(args.payload), f.read()))
+    if args.cassette_dir:
+        paths = sorted(glob.glob(os.path.join(args.cassette_dir, "*", "*.json")),
+                       key=os.path.getsize, reverse=True)
+        for path in paths[:args.cassettes]:
+            with open(path, "r") as f:
+                cassette = json.load(f)
+            if "docs" in cassette:
+                label = f"{cassette['core']}:{os.path.basename(path)[:8]}"
+                payloads.append((label, _envelope(cassette["docs"])))
+    if args.synthetic or not payloads:
+        count = args.synthetic or 20000
+        payloads.append((f"synthetic genome_feature x{count}", _envelope(synthetic_features(count))))
+    return payloads
+
+
+def _decompressor(encoding: str) -> Callable[[bytes], bytes]:
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().decompressobj().decompress
+    if encoding == "br":
+        return brotli.decompress
+    return gzip.decompress
+
+
+def measure(data: bytes, encoding: str, level: int, runs: int) -> Dict[str, Any]:
+    """
+    Measure one encoding and level on a payload.
+
+    Args:
+        data: Uncompressed payload
+        encoding: Content encoding
+        level: Compression level
+        runs: Timed repetitions (the median is reported)
+
+    Returns:
+        Dictionary with compressed size, ratio and compression/decompression speed
+    """
+    compress_times, decompress_times = [], []
+    compressed = b""
+    for _ in range(runs):
+        start = time.perf_counter()
+        compressed = compress_bytes(data, encoding, level)
+        compress_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        restored = _decompressor(encoding)(compressed)
+        decompress_times.append(time.perf_counter() - start)
+    if restored != data:
+        raise RuntimeError(f"{encoding} level {level} did not round-trip")
+
+    compress_s = statistics.median(compress_times)
+    return {
+        "encoding": encoding,
+        "level": level,
+        "bytes": len(compressed),
+        "ratio": round(len(data) / len(compressed), 2),
+        "compress_ms": round(compress_s * 1000, 2),
+        "compress_mb_s": round(len(data) / compress_s / 1e6, 1),
+        "decompress_ms": round(statistics.median(decompress_times) * 1000, 2),
+    }
+
+
+def main() -> int:
+    """Command line entry point for the compression benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark BV-BRC response compression")
+    parser.add_argument("--payload", help="JSON file holding a tool result to measure")
+    parser.add_argument("--cassette-dir", help="Measure the largest recorded cassettes in this directory")
+    parser.add_argument("--cassettes", type=int, default=3, help="Number of cassettes to measure")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Measure a synthetic genome feature result with this many records")
+    parser.add_argument("--runs", type=int, default=3, help="Timed repetitions per level")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for label, data in load_payloads(args):
+        rows = [measure(data, encoding, level, args.runs)
+                for encoding in available_encodings() for level in LEVELS[encoding]]
+        results.append({"payload": label, "bytes": len(data), "results": rows})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    for payload in results:
+        print(f"{payload['payload']}: {payload['bytes']:,} bytes")
+        print(f"  {'encoding':<8} {'level':>5} {'bytes':>12} {'ratio':>7} "
+              f"{'comp ms':>9} {'MB/s':>8} {'decomp ms':>10}")
+        for row in payload["results"]:
+            print(f"  {row['encoding']:<8} {row['level']:>5} {row['bytes']:>12,} {row['ratio']:>7} "
+                  f"{row['compress_ms']:>9} {row['compress_mb_s']:>8} {row['decompress_ms']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
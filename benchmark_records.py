@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Typed Record Benchmark
+
+Measures decode time and retained memory of a raw genome_feature docs array
+decoded as dictionaries (json.loads) and as typed records (decode_records),
+using synthetic records shaped like bvbrc_genome_feature_get_by_genome_id
+results.
+
+Usage:
+    python benchmark_records.py --records 50000
+    python benchmark_records.py --records 20000 --select feature_id,start,end,product --json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from benchmark_compression import synthetic_features
+from data_functions.record_functions import decode_records, msgspec
+
+
+def measure(decode: Callable[[], List[Any]], runs: int) -> Dict[str, Any]:
+    """
+    Measure one decoder.
+
+    Args:
+        decode: Function decoding the payload
+        runs: Timed repetitions (the median is reported)
+
+    Returns:
+        Dictionary with decode milliseconds and retained bytes per record
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decode()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    records = decode()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "decode_ms": round(statistics.median(times) * 1000, 2),
+        "bytes_per_record": round(retained / len(records), 1),
+    }
+
+
+def main() -> int:
+    """Command line entry point for the typed record benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark BV-BRC typed record decoding")
+    parser.add_argument("--records", type=int, default=50000, help="Number of synthetic records")
+    parser.add_argument("--select", help="Comma-separated fields to keep (like the select option)")
+    parser.add_argument("--runs", type=int, default=5, help="Timed repetitions per decoder")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    docs = synthetic_features(args.records)
+    fields = args.select.split(",") if args.select else None
+    if fields:
+        docs = [{field: doc[field] for field in fields if field in doc} for doc in docs]
+    data = json.dumps(docs).encode("utf-8")
+
+    results = {
+        "records": args.records,
+        "payload_bytes": len(data),
+        "msgspec": msgspec is not None,
+        "dict": measure(lambda: json.loads(data), args.runs),
+        "typed": measure(lambda: decode_records("genome_feature", data, fields), args.runs),
+    }
+    if decode_records("genome_feature", data, fields) != docs:
+        raise RuntimeError("typed records do not match the decoded documents")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    backend = "msgspec" if results["msgspec"] else "__slots__"
+    print(f"{args.records:,} genome_feature records, {len(data):,} bytes ({backend} records)")
+    print(f"  {'decoder':<8} {'decode ms':>10} {'bytes/record':>13}")
+    for name in ("dict", "typed"):
+        row = results[name]
+        print(f"  {name:<8} {row['decode_ms']:>10} {row['bytes_per_record']:>13}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Startup Benchmark
+
+Measures the time for a fresh interpreter to import stdio_server.py and have
+every tool registered, with lazy and eager tool registration. Exits non-zero
+when the lazy startup median exceeds the budget.
+
+Usage:
+    python benchmark_startup.py --runs 5 --budget 1.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_PROBE = (
+    "import time, json, asyncio\n"
+    "t = time.perf_counter()\n"
+    "import stdio_server\n"
+    "elapsed = time.perf_counter() - t\n"
+    "tools = asyncio.run(stdio_server.mcp.get_tools())\n"
+    "print(json.dumps({'seconds': elapsed, 'tools': len(tools)}))\n"
+)
+
+
+def measure(lazy: bool, runs: int) -> Dict[str, float]:
+    """
+    Measure stdio_server startup in fresh interpreters.
+
+    Args:
+        lazy: Use lazy tool registration
+        runs: Number of measured runs
+
+    Returns:
+        Dictionary with median, min and max seconds and the tool count
+    """
+    env = dict(os.environ, BVBRC_LAZY_TOOLS="1" if lazy else "0")
+    samples: List[float] = []
+    tools = 0
+    # The first run warms the OS file cache and, in lazy mode, the tool manifest
+    for i in range(runs + 1):
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE],
+            cwd=_ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        tools = result["tools"]
+        if i > 0:
+            samples.append(result["seconds"])
+    return {
+        "median_s": round(statistics.median(samples), 4),
+        "min_s": round(min(samples), 4),
+        "max_s": round(max(samples), 4),
+        "tools": tools,
+    }
+
+
+def main() -> int:
+    """Command line entry point for the startup benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark BV-BRC MCP server startup")
+    parser.add_argument("--runs", type=int, default=5, help="Measured runs per mode")
+    parser.add_argument("--budget", type=float, default=1.5,
+                        help="Maximum allowed lazy startup median in seconds")
+    args = parser.parse_args()
+
+    results = {
+        "lazy": measure(True, args.runs),
+        "eager": measure(False, args.runs),
+    }
+    print(json.dumps(results, indent=2))
+
+    if results["lazy"]["tools"] != results["eager"]["tools"]:
+        print("Lazy and eager registration expose different tool counts", file=sys.stderr)
+        return 1
+    if results["lazy"]["median_s"] > args.budget:
+        print(f"Lazy startup {results['lazy']['median_s']}s exceeds budget {args.budget}s",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Tool Catalog Builder
+
+Serializes the full tool catalog of every register_*_tools module (names,
+descriptions and JSON schemas) to the versioned tools/tool_catalog.json
+artifact that the servers load at boot. With --check, nothing is written and
+the exit status is non-zero when the artifact has drifted from the code.
+
+Usage:
+    python build_tool_catalog.py
+    python build_tool_catalog.py --check
+"""
+
+import argparse
+import sys
+
+from tools import build_tool_manifest, check_tool_manifest, write_tool_manifest
+
+
+def main() -> int:
+    """Command line entry point for the tool catalog builder."""
+    parser = argparse.ArgumentParser(description="Build the BV-BRC MCP tool catalog artifact")
+    parser.add_argument("--check", action="store_true",
+                        help="Fail if the artifact differs from the code instead of writing it")
+    parser.add_argument("--output", default=None,
+                        help="Artifact path (default tools/tool_catalog.json)")
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_tool_manifest(args.output)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        if problems:
+            print("Tool catalog is out of date; run python build_tool_catalog.py", file=sys.stderr)
+            return 1
+        print("Tool catalog is up to date")
+        return 0
+
+    manifest = build_tool_manifest()
+    path = write_tool_manifest(manifest, args.output)
+    print(f"Wrote {len(manifest['tools'])} tools to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
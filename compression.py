@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Response Compression
+
+ASGI middleware that compresses HTTP responses with the best encoding the
+client accepts among zstd, brotli and gzip. zstd and brotli are used only
+when the optional zstandard and brotli packages are installed; gzip is always
+available.
+
+Complete responses are compressed when they reach a size threshold. Streamed
+responses (the SSE streams of MCP tool calls) are compressed chunk by chunk
+with a flush after each chunk, so every event reaches the client as soon as
+it is sent. Large chunks are compressed in a worker thread to keep the event
+loop responsive.
+"""
+
+import zlib
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Fast levels: on large tool results (see benchmark_compression.py) higher
+# levels cost several times the CPU for 10-40% fewer bytes
+DEFAULT_LEVELS = {"zstd": 1, "br": 1, "gzip": 1}
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Chunks at least this large are compressed off the event loop
+THREAD_THRESHOLD = 256 * 1024
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+def available_encodings() -> tuple:
+    """Return the supported content encodings, most preferred first."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return tuple(encodings)
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self._obj = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+_COMPRESSORS = {"gzip": _GzipCompressor, "zstd": _ZstdCompressor, "br": _BrotliCompressor}
+
+
+def make_compressor(encoding: str, level: int = None) -> Any:
+    """
+    Create a streaming compressor.
+
+    Args:
+        encoding: Content encoding ("gzip", "zstd" or "br")
+        level: Compression level (optional, DEFAULT_LEVELS otherwise)
+
+    Returns:
+        Compressor with compress(data) (flushed output) and finish() methods
+    """
+    return _COMPRESSORS[encoding](DEFAULT_LEVELS[encoding] if level is None else level)
+
+
+def compress_bytes(data: bytes, encoding: str, level: int = None) -> bytes:
+    """Compress a complete payload in one call."""
+    compressor = make_compressor(encoding, level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def negotiate_encoding(accept_encoding: str, supported: Sequence[str]) -> Optional[str]:
+    """
+    Choose a content encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+        supported: Supported encodings, most preferred first
+
+    Returns:
+        Encoding with the highest client quality (server preference breaks
+        ties), or None when the client accepts none of them
+    """
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in supported:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """ASGI middleware negotiating zstd, brotli or gzip response compression."""
+
+    def __init__(self, app: Callable, encodings: Sequence[str] = None,
+                 minimum_size: int = DEFAULT_MINIMUM_SIZE, levels: Dict[str, int] = None,
+                 streams: bool = True):
+        """
+        Args:
+            app: ASGI application
+            encodings: Encodings to offer, most preferred first (optional,
+                every available encoding otherwise)
+            minimum_size: Smallest complete response that is compressed, in bytes
+            levels: Compression level per encoding (optional)
+            streams: Also compress streamed (SSE) responses
+        """
+        self.app = app
+        available = available_encodings()
+        self.encodings = tuple(e for e in (encodings or available) if e in available)
+        self.minimum_size = minimum_size
+        self.levels = dict(DEFAULT_LEVELS, **(levels or {}))
+        self.streams = streams
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Callable):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[Dict[str, Any]] = None
+        self._compressor = None
+        self._passthrough = False
+
+    async def _compress(self, data: bytes, finish: bool) -> bytes:
+        def run() -> bytes:
+            out = self._compressor.compress(data) if data else b""
+            return out + self._compressor.finish() if finish else out
+        if len(data) >= THREAD_THRESHOLD:
+            return await anyio.to_thread.run_sync(run)
+        return run()
+
+    async def send(self, message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            headers = MutableHeaders(raw=start["headers"])
+            content_type = headers.get("content-type", "")
+            compressible = (
+                "content-encoding" not in headers
+                and content_type.startswith(COMPRESSIBLE_TYPES)
+                and (more_body and self.middleware.streams
+                     or not more_body and len(body) >= self.middleware.minimum_size)
+            )
+            if not compressible:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._compressor = make_compressor(self.encoding, self.middleware.levels.get(self.encoding))
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            body = await self._compress(body, not more_body)
+            if more_body:
+                if "content-length" in headers:
+                    del headers["content-length"]
+            else:
+                headers["Content-Length"] = str(len(body))
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        if self._passthrough:
+            await self._send(message)
+            return
+        body = await self._compress(body, not more_body)
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
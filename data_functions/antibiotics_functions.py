@@ -4,548 +4,47 @@ BV-BRC Antibiotics Functions
 This module provides antibiotics querying functions for the BV-BRC Solr API.
 """
 
-from typing import Any, Dict, List, Tuple
-from .common_functions import create_bvbrc_client
-
-
-def query_antibiotics_by_pubchem_cid(pubchem_cid: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by PubChem CID using cursor-based streaming.
-    
-    Args:
-        pubchem_cid: The PubChem CID to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for pubchem_cid (use q_expr instead of fq)
-    q_expr = f"pubchem_cid:{pubchem_cid}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_filters(filters: Dict[str, Any], options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by custom filters using cursor-based streaming.
-    
-    Args:
-        filters: Dictionary of filter criteria
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression from the filters dict
-    # For multiple filters, we need to combine them with AND logic
-    filter_parts = []
-    for key, value in filters.items():
-        if isinstance(value, str):
-            filter_parts.append(f'{key}:"{value}"')
-        else:
-            filter_parts.append(f"{key}:{value}")
-    
-    # Combine multiple filters with AND logic
-    if len(filter_parts) == 1:
-        q_expr = filter_parts[0]
-    else:
-        q_expr = " AND ".join(f"({part})" for part in filter_parts)
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_keyword(keyword: str, options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by keyword search using cursor-based streaming.
-    
-    Args:
-        keyword: The keyword to search for
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for keyword search (use q_expr instead of fq)
-    q_expr = f'*{keyword}*'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_name(antibiotic_name: str, options: Dict[str, Any] = None,
-                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by antibiotic name using cursor-based streaming.
-    
-    Args:
-        antibiotic_name: The antibiotic name to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for antibiotic_name (use q_expr instead of fq)
-    q_expr = f'antibiotic_name:"{antibiotic_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_cas_id(cas_id: str, options: Dict[str, Any] = None,
-                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by CAS ID using cursor-based streaming.
-    
-    Args:
-        cas_id: The CAS ID to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for cas_id (use q_expr instead of fq)
-    q_expr = f"cas_id:{cas_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_molecular_formula(molecular_formula: str, options: Dict[str, Any] = None,
-                                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by molecular formula using cursor-based streaming.
-    
-    Args:
-        molecular_formula: The molecular formula to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for molecular_formula (use q_expr instead of fq)
-    q_expr = f'molecular_formula:"{molecular_formula}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_atc_classification(atc_classification: str, options: Dict[str, Any] = None,
-                                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by ATC classification using cursor-based streaming.
-    
-    Args:
-        atc_classification: The ATC classification to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for atc_classification (use q_expr instead of fq)
-    q_expr = f"atc_classification:{atc_classification}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_mechanism_of_action(mechanism_of_action: str, options: Dict[str, Any] = None,
-                                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by mechanism of action using cursor-based streaming.
-    
-    Args:
-        mechanism_of_action: The mechanism of action to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for mechanism_of_action (use q_expr instead of fq)
-    q_expr = f'mechanism_of_action:"{mechanism_of_action}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_pharmacological_class(pharmacological_class: str, options: Dict[str, Any] = None,
-                                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by pharmacological class using cursor-based streaming.
-    
-    Args:
-        pharmacological_class: The pharmacological class to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for pharmacological_class (use q_expr instead of fq)
-    q_expr = f'pharmacological_class:"{pharmacological_class}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_synonym(synonym: str, options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by synonym using cursor-based streaming.
-    
-    Args:
-        synonym: The synonym to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for synonym (use q_expr instead of fq)
-    q_expr = f'synonym:"{synonym}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_molecular_weight_range(min_weight: float, max_weight: float, options: Dict[str, Any] = None,
-                                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by molecular weight range using cursor-based streaming.
-    
-    Args:
-        min_weight: Minimum molecular weight
-        max_weight: Maximum molecular weight
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for molecular weight range (use q_expr instead of fq)
-    q_expr = f"molecular_weight:[{min_weight} TO {max_weight}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_by_date_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query antibiotics by date range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date (YYYY-MM-DD format)
-        end_date: End date (YYYY-MM-DD format)
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date range (use q_expr instead of fq)
-    q_expr = f'date_added:["{start_date}" TO "{end_date}"]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_antibiotics_all(options: Dict[str, Any] = None,
-                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query all antibiotics using cursor-based streaming.
-    
-    Args:
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of antibiotic records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.antibiotics.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr="*:*",  # Query all records
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
+from .query_spec_functions import (
+    exact,
+    phrase,
+    value_range,
+    date_range,
+    keyword,
+    filters,
+    all_records,
+    build_query_functions
+)
+
+CORE = "antibiotics"
+
+QUERY_SPECS = [
+    exact("query_antibiotics_by_pubchem_cid", "pubchem_cid",
+          summary="Query antibiotics by PubChem CID"),
+    filters("query_antibiotics_by_filters",
+            summary="Query antibiotics by custom filters"),
+    keyword("query_antibiotics_by_keyword",
+            summary="Query antibiotics by keyword search"),
+    phrase("query_antibiotics_by_name", "antibiotic_name",
+           summary="Query antibiotics by antibiotic name"),
+    exact("query_antibiotics_by_cas_id", "cas_id",
+          summary="Query antibiotics by CAS ID"),
+    phrase("query_antibiotics_by_molecular_formula", "molecular_formula",
+           summary="Query antibiotics by molecular formula"),
+    exact("query_antibiotics_by_atc_classification", "atc_classification",
+          summary="Query antibiotics by ATC classification"),
+    phrase("query_antibiotics_by_mechanism_of_action", "mechanism_of_action",
+           summary="Query antibiotics by mechanism of action"),
+    phrase("query_antibiotics_by_pharmacological_class", "pharmacological_class",
+           summary="Query antibiotics by pharmacological class"),
+    phrase("query_antibiotics_by_synonym", "synonym",
+           summary="Query antibiotics by synonym"),
+    value_range("query_antibiotics_by_molecular_weight_range", "molecular_weight", ("min_weight", "max_weight"),
+                summary="Query antibiotics by molecular weight range"),
+    date_range("query_antibiotics_by_date_range", "date_added",
+               template='date_added:["{0}" TO "{1}"]',
+               summary="Query antibiotics by date range"),
+    all_records("query_antibiotics_all",
+                summary="Query all antibiotics"),
+]
+
+globals().update(build_query_functions(CORE, QUERY_SPECS, __name__))
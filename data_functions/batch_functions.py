@@ -0,0 +1,186 @@
+"""
+BV-BRC Batch Functions
+
+This module runs many independent queries, on any mix of cores, concurrently
+in a shared thread pool. Every query goes through stream_query() and the
+pooled HTTP client, and the whole batch is bounded by a single deadline:
+queries that have not finished by then are reported as timed out instead of
+holding up the ones that did.
+"""
+
+import concurrent.futures
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .common_functions import stream_query
+from .progress_functions import QueryCancelledError, QueryProgress, current_progress, query_progress
+from .query_spec_functions import filters_q_expr
+
+# Module level configuration (overridable via configure_batch)
+_max_workers = int(os.getenv("BVBRC_BATCH_WORKERS", "8"))
+_default_deadline = float(os.getenv("BVBRC_BATCH_DEADLINE", "60"))
+_default_cap = int(os.getenv("BVBRC_BATCH_CAP", "1000"))
+
+# Largest number of queries accepted in one batch
+MAX_BATCH_QUERIES = 50
+
+# Seconds between checks for a cancelled batch
+_WAIT_SLICE = 0.25
+
+# Share of the batch deadline each query may spend paging before it returns
+# partial results, leaving time for the page in flight
+_BUDGET_SHARE = 0.8
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_QUERY_KEYS = frozenset(("id", "core", "q", "filters", "select", "sort", "cap"))
+
+
+class BatchDeadlineError(TimeoutError):
+    """Reported for a batch query that did not finish before the deadline."""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        super().__init__(f"Query did not finish within the {deadline:g}s batch deadline")
+
+
+def configure_batch(max_workers: int = None, deadline: float = None, cap: int = None) -> None:
+    """
+    Configure concurrent batch queries.
+
+    Args:
+        max_workers: Queries run concurrently, across all batches (optional)
+        deadline: Default deadline of a batch in seconds (optional)
+        cap: Default maximum number of records per query (optional)
+    """
+    global _max_workers, _default_deadline, _default_cap, _executor
+    with _executor_lock:
+        if max_workers is not None:
+            _max_workers = int(max_workers)
+            _executor = None
+        if deadline is not None:
+            _default_deadline = float(deadline)
+        if cap is not None:
+            _default_cap = int(cap)
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="bvbrc-batch"
+            )
+        return _executor
+
+
+def parse_batch_queries(queries: List[Dict[str, Any]]) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+    """
+    Check batch query specs and turn them into stream_query arguments.
+
+    Args:
+        queries: List of {"id", "core", "q" or "filters", "select", "sort", "cap"}
+            specs; only core is required, id defaults to the position in the list
+
+    Returns:
+        List of (id, core, query expression, options)
+
+    Raises:
+        ValueError: If a spec is malformed or an id is repeated
+    """
+    if not isinstance(queries, list) or not queries:
+        raise ValueError("queries must be a non-empty list")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise ValueError(f"At most {MAX_BATCH_QUERIES} queries per batch, got {len(queries)}")
+
+    parsed = []
+    for index, spec in enumerate(queries):
+        if not isinstance(spec, dict):
+            raise ValueError(f"Query {index} is not an object")
+        unknown = set(spec) - _QUERY_KEYS
+        if unknown:
+            raise ValueError(f"Query {index} has unknown keys: {', '.join(sorted(unknown))}")
+        query_id = str(spec.get("id", index))
+        if not spec.get("core"):
+            raise ValueError(f"Query {query_id} has no core")
+        if spec.get("q") and spec.get("filters"):
+            raise ValueError(f"Query {query_id} has both q and filters")
+
+        q_expr = spec.get("q") or (filters_q_expr(spec["filters"]) if spec.get("filters") else "*:*")
+        options = {"cap": int(spec.get("cap", _default_cap))}
+        select = spec.get("select")
+        if select:
+            options["select"] = select.split(",") if isinstance(select, str) else list(select)
+        if spec.get("sort"):
+            options["sort"] = spec["sort"]
+        parsed.append((query_id, spec["core"], q_expr, options))
+
+    ids = [query_id for query_id, _, _, _ in parsed]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Query ids must be unique")
+    return parsed
+
+
+def _run_query(progress: QueryProgress, *args: Any) -> Tuple[Any, int]:
+    with query_progress(progress):
+        return stream_query(*args)
+
+
+def run_batch(queries: List[Dict[str, Any]], deadline: float = None, options: Dict[str, Any] = None,
+              base_url: str = None, headers: Dict[str, str] = None) -> Dict[str, Union[Tuple[Any, int], Exception]]:
+    """
+    Run independent queries concurrently with a shared deadline.
+
+    Args:
+        queries: Batch query specs (see parse_batch_queries)
+        deadline: Seconds the whole batch may take (optional, the configured
+            default otherwise)
+        options: Options added to every query (e.g., {"raw": True}) (optional)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Dictionary of query id to (records, count), where records are
+        PartialResults when a query ran out of time, or to the exception the
+        query raised (BatchDeadlineError when it did not finish in time,
+        QueryCancelledError when the call was cancelled), in the order of
+        the specs
+    """
+    parsed = parse_batch_queries(queries)
+    deadline = _default_deadline if deadline is None else float(deadline)
+    expires = time.monotonic() + deadline
+
+    # Each query reports to the caller's progress, and can be cancelled on its own
+    parent = current_progress() or QueryProgress()
+    executor = _get_executor()
+    futures = {}
+    progress = {}
+    for query_id, core, q_expr, query_options in parsed:
+        query_options["time_budget"] = deadline * _BUDGET_SHARE
+        query_options.update(options or {})
+        progress[query_id] = parent.child()
+        futures[query_id] = executor.submit(
+            _run_query, progress[query_id], core, q_expr, query_options, base_url, headers
+        )
+
+    # Wait in slices so that a cancelled call stops waiting
+    pending = set(futures.values())
+    while pending and not parent.cancelled and time.monotonic() < expires:
+        remaining = max(0.0, expires - time.monotonic())
+        _, pending = concurrent.futures.wait(pending, timeout=min(remaining, _WAIT_SLICE))
+
+    results: Dict[str, Union[Tuple[Any, int], Exception]] = {}
+    for query_id, future in futures.items():
+        if not future.done():
+            # A query already running stops at its next page
+            future.cancel()
+            progress[query_id].cancel()
+            results[query_id] = QueryCancelledError("Query cancelled") if parent.cancelled else BatchDeadlineError(deadline)
+        elif future.exception() is not None:
+            results[query_id] = future.exception()
+        else:
+            results[query_id] = future.result()
+    return results
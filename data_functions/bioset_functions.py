@@ -4,1040 +4,70 @@ BV-BRC Bioset Functions
 This module provides bioset querying functions for the BV-BRC Solr API.
 """
 
-from typing import Any, Dict, List, Tuple
-from .common_functions import create_bvbrc_client
-
-
-def query_bioset_by_id(bioset_id: str, options: Dict[str, Any] = None, 
-                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by ID using cursor-based streaming.
-    
-    Args:
-        bioset_id: The bioset ID to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_id (use q_expr instead of fq)
-    q_expr = f"bioset_id:{bioset_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_filters(filters: Dict[str, Any], options: Dict[str, Any] = None,
-                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by custom filters using cursor-based streaming.
-    
-    Args:
-        filters: Dictionary of filter criteria
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression from the filters dict
-    # For multiple filters, we need to combine them with AND logic
-    filter_parts = []
-    for key, value in filters.items():
-        if isinstance(value, str):
-            filter_parts.append(f'{key}:"{value}"')
-        else:
-            filter_parts.append(f"{key}:{value}")
-    
-    # Combine multiple filters with AND logic
-    if len(filter_parts) == 1:
-        q_expr = filter_parts[0]
-    else:
-        q_expr = " AND ".join(f"({part})" for part in filter_parts)
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_name(bioset_name: str, options: Dict[str, Any] = None,
-                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by bioset name using cursor-based streaming.
-    
-    Args:
-        bioset_name: The bioset name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_name (use q_expr instead of fq)
-    q_expr = f'bioset_name:"{bioset_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_type(bioset_type: str, options: Dict[str, Any] = None,
-                         base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by bioset type using cursor-based streaming.
-    
-    Args:
-        bioset_type: The bioset type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_type (use q_expr instead of fq)
-    q_expr = f"bioset_type:{bioset_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_exp_id(exp_id: str, options: Dict[str, Any] = None,
-                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by experiment ID using cursor-based streaming.
-    
-    Args:
-        exp_id: The experiment ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_id (use q_expr instead of fq)
-    q_expr = f"exp_id:{exp_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_exp_name(exp_name: str, options: Dict[str, Any] = None,
-                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by experiment name using cursor-based streaming.
-    
-    Args:
-        exp_name: The experiment name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_name (use q_expr instead of fq)
-    q_expr = f'exp_name:"{exp_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_exp_type(exp_type: str, options: Dict[str, Any] = None,
-                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by experiment type using cursor-based streaming.
-    
-    Args:
-        exp_type: The experiment type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_type (use q_expr instead of fq)
-    q_expr = f"exp_type:{exp_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_organism(organism: str, options: Dict[str, Any] = None,
-                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by organism using cursor-based streaming.
-    
-    Args:
-        organism: The organism to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for organism (use q_expr instead of fq)
-    q_expr = f'organism:"{organism}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_strain(strain: str, options: Dict[str, Any] = None,
-                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by strain using cursor-based streaming.
-    
-    Args:
-        strain: The strain to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for strain (use q_expr instead of fq)
-    q_expr = f'strain:"{strain}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_taxon_id(taxon_id: int, options: Dict[str, Any] = None,
-                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by taxon ID using cursor-based streaming.
-    
-    Args:
-        taxon_id: The taxon ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for taxon_id (use q_expr instead of fq)
-    q_expr = f"taxon_id:{taxon_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_entity_type(entity_type: str, options: Dict[str, Any] = None,
-                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by entity type using cursor-based streaming.
-    
-    Args:
-        entity_type: The entity type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for entity_type (use q_expr instead of fq)
-    q_expr = f"entity_type:{entity_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_result_type(result_type: str, options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by result type using cursor-based streaming.
-    
-    Args:
-        result_type: The result type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for result_type (use q_expr instead of fq)
-    q_expr = f"result_type:{result_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_analysis_method(analysis_method: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by analysis method using cursor-based streaming.
-    
-    Args:
-        analysis_method: The analysis method to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for analysis_method (use q_expr instead of fq)
-    q_expr = f"analysis_method:{analysis_method}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_analysis_group_1(analysis_group_1: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by analysis group 1 using cursor-based streaming.
-    
-    Args:
-        analysis_group_1: The analysis group 1 to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for analysis_group_1 (use q_expr instead of fq)
-    q_expr = f"analysis_group_1:{analysis_group_1}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_analysis_group_2(analysis_group_2: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by analysis group 2 using cursor-based streaming.
-    
-    Args:
-        analysis_group_2: The analysis group 2 to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for analysis_group_2 (use q_expr instead of fq)
-    q_expr = f"analysis_group_2:{analysis_group_2}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_treatment_type(treatment_type: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by treatment type using cursor-based streaming.
-    
-    Args:
-        treatment_type: The treatment type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_type (use q_expr instead of fq)
-    q_expr = f"treatment_type:{treatment_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_treatment_name(treatment_name: str, options: Dict[str, Any] = None,
-                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by treatment name using cursor-based streaming.
-    
-    Args:
-        treatment_name: The treatment name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_name (use q_expr instead of fq)
-    q_expr = f'treatment_name:"{treatment_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_study_name(study_name: str, options: Dict[str, Any] = None,
-                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by study name using cursor-based streaming.
-    
-    Args:
-        study_name: The study name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for study_name (use q_expr instead of fq)
-    q_expr = f'study_name:"{study_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_study_pi(study_pi: str, options: Dict[str, Any] = None,
-                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by study PI using cursor-based streaming.
-    
-    Args:
-        study_pi: The study PI to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for study_pi (use q_expr instead of fq)
-    q_expr = f'study_pi:"{study_pi}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_study_institution(study_institution: str, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by study institution using cursor-based streaming.
-    
-    Args:
-        study_institution: The study institution to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for study_institution (use q_expr instead of fq)
-    q_expr = f'study_institution:"{study_institution}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_genome_id(genome_id: str, options: Dict[str, Any] = None,
-                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by genome ID using cursor-based streaming.
-    
-    Args:
-        genome_id: The genome ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for genome_id (use q_expr instead of fq)
-    q_expr = f"genome_id:{genome_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_date_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by date range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date range (use q_expr instead of fq)
-    q_expr = f"date:[{start_date} TO {end_date}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_modified_date_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by modified date range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for modified date range (use q_expr instead of fq)
-    q_expr = f"modified_date:[{start_date} TO {end_date}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_by_keyword(keyword: str, options: Dict[str, Any] = None,
-                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset by keyword search using cursor-based streaming.
-    
-    Args:
-        keyword: The keyword to search for
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for keyword search (use q_expr instead of fq)
-    q_expr = f'*"{keyword}"*'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_all(options: Dict[str, Any] = None,
-                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query all bioset records using cursor-based streaming.
-    
-    Args:
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr="*:*",  # Match all documents
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
+from .query_spec_functions import (
+    exact,
+    phrase,
+    date_range,
+    keyword,
+    filters,
+    all_records,
+    build_query_functions
+)
+
+CORE = "bioset"
+
+QUERY_SPECS = [
+    exact("query_bioset_by_id", "bioset_id",
+          summary="Query bioset by ID"),
+    filters("query_bioset_by_filters",
+            summary="Query bioset by custom filters"),
+    phrase("query_bioset_by_name", "bioset_name",
+           summary="Query bioset by bioset name"),
+    exact("query_bioset_by_type", "bioset_type",
+          summary="Query bioset by bioset type"),
+    exact("query_bioset_by_exp_id", "exp_id",
+          summary="Query bioset by experiment ID"),
+    phrase("query_bioset_by_exp_name", "exp_name",
+           summary="Query bioset by experiment name"),
+    exact("query_bioset_by_exp_type", "exp_type",
+          summary="Query bioset by experiment type"),
+    phrase("query_bioset_by_organism", "organism",
+           summary="Query bioset by organism"),
+    phrase("query_bioset_by_strain", "strain",
+           summary="Query bioset by strain"),
+    exact("query_bioset_by_taxon_id", "taxon_id", param_type=int,
+          summary="Query bioset by taxon ID"),
+    exact("query_bioset_by_entity_type", "entity_type",
+          summary="Query bioset by entity type"),
+    exact("query_bioset_by_result_type", "result_type",
+          summary="Query bioset by result type"),
+    exact("query_bioset_by_analysis_method", "analysis_method",
+          summary="Query bioset by analysis method"),
+    exact("query_bioset_by_analysis_group_1", "analysis_group_1",
+          summary="Query bioset by analysis group 1"),
+    exact("query_bioset_by_analysis_group_2", "analysis_group_2",
+          summary="Query bioset by analysis group 2"),
+    exact("query_bioset_by_treatment_type", "treatment_type",
+          summary="Query bioset by treatment type"),
+    phrase("query_bioset_by_treatment_name", "treatment_name",
+           summary="Query bioset by treatment name"),
+    phrase("query_bioset_by_study_name", "study_name",
+           summary="Query bioset by study name"),
+    phrase("query_bioset_by_study_pi", "study_pi",
+           summary="Query bioset by study PI"),
+    phrase("query_bioset_by_study_institution", "study_institution",
+           summary="Query bioset by study institution"),
+    exact("query_bioset_by_genome_id", "genome_id",
+          summary="Query bioset by genome ID"),
+    date_range("query_bioset_by_date_range", "date",
+               summary="Query bioset by date range"),
+    date_range("query_bioset_by_modified_date_range", "modified_date",
+               summary="Query bioset by modified date range"),
+    keyword("query_bioset_by_keyword",
+            template='*"{0}"*',
+            summary="Query bioset by keyword search"),
+    all_records("query_bioset_all",
+                summary="Query all bioset records"),
+]
+
+globals().update(build_query_functions(CORE, QUERY_SPECS, __name__))
@@ -4,1785 +4,106 @@ BV-BRC Bioset Result Functions
 This module provides bioset_result querying functions for the BV-BRC Solr API.
 """
 
-from typing import Any, Dict, List, Tuple
-from .common_functions import create_bvbrc_client
-
-
-def query_bioset_result_by_id(id: str, options: Dict[str, Any] = None, 
-                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by ID using cursor-based streaming.
-    
-    Args:
-        id: The bioset_result ID to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for id (use q_expr instead of fq)
-    q_expr = f"id:{id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_filters(filters: Dict[str, Any], options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by custom filters using cursor-based streaming.
-    
-    Args:
-        filters: Dictionary of filter criteria
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression from the filters dict
-    # For multiple filters, we need to combine them with AND logic
-    filter_parts = []
-    for key, value in filters.items():
-        if isinstance(value, str):
-            filter_parts.append(f'{key}:"{value}"')
-        else:
-            filter_parts.append(f"{key}:{value}")
-    
-    # Combine multiple filters with AND logic
-    if len(filter_parts) == 1:
-        q_expr = filter_parts[0]
-    else:
-        q_expr = " AND ".join(f"({part})" for part in filter_parts)
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_bioset_id(bioset_id: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by bioset ID using cursor-based streaming.
-    
-    Args:
-        bioset_id: The bioset ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_id (use q_expr instead of fq)
-    q_expr = f"bioset_id:{bioset_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_bioset_name(bioset_name: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by bioset name using cursor-based streaming.
-    
-    Args:
-        bioset_name: The bioset name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_name (use q_expr instead of fq)
-    q_expr = f'bioset_name:"{bioset_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_bioset_description(bioset_description: str, options: Dict[str, Any] = None,
-                                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by bioset description using cursor-based streaming.
-    
-    Args:
-        bioset_description: The bioset description to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_description (use q_expr instead of fq)
-    q_expr = f'bioset_description:"{bioset_description}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_bioset_type(bioset_type: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by bioset type using cursor-based streaming.
-    
-    Args:
-        bioset_type: The bioset type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for bioset_type (use q_expr instead of fq)
-    q_expr = f"bioset_type:{bioset_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_entity_id(entity_id: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by entity ID using cursor-based streaming.
-    
-    Args:
-        entity_id: The entity ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for entity_id (use q_expr instead of fq)
-    q_expr = f"entity_id:{entity_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_entity_name(entity_name: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by entity name using cursor-based streaming.
-    
-    Args:
-        entity_name: The entity name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for entity_name (use q_expr instead of fq)
-    q_expr = f'entity_name:"{entity_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_entity_type(entity_type: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by entity type using cursor-based streaming.
-    
-    Args:
-        entity_type: The entity type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for entity_type (use q_expr instead of fq)
-    q_expr = f"entity_type:{entity_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_exp_id(exp_id: str, options: Dict[str, Any] = None,
-                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by experiment ID using cursor-based streaming.
-    
-    Args:
-        exp_id: The experiment ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_id (use q_expr instead of fq)
-    q_expr = f"exp_id:{exp_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_exp_name(exp_name: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by experiment name using cursor-based streaming.
-    
-    Args:
-        exp_name: The experiment name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_name (use q_expr instead of fq)
-    q_expr = f'exp_name:"{exp_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_exp_title(exp_title: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by experiment title using cursor-based streaming.
-    
-    Args:
-        exp_title: The experiment title to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_title (use q_expr instead of fq)
-    q_expr = f'exp_title:"{exp_title}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_exp_type(exp_type: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by experiment type using cursor-based streaming.
-    
-    Args:
-        exp_type: The experiment type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for exp_type (use q_expr instead of fq)
-    q_expr = f"exp_type:{exp_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_feature_id(feature_id: str, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by feature ID using cursor-based streaming.
-    
-    Args:
-        feature_id: The feature ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for feature_id (use q_expr instead of fq)
-    q_expr = f"feature_id:{feature_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_gene(gene: str, options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by gene using cursor-based streaming.
-    
-    Args:
-        gene: The gene to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for gene (use q_expr instead of fq)
-    q_expr = f'gene:"{gene}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_gene_id(gene_id: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by gene ID using cursor-based streaming.
-    
-    Args:
-        gene_id: The gene ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for gene_id (use q_expr instead of fq)
-    q_expr = f"gene_id:{gene_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_genome_id(genome_id: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by genome ID using cursor-based streaming.
-    
-    Args:
-        genome_id: The genome ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for genome_id (use q_expr instead of fq)
-    q_expr = f"genome_id:{genome_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_locus_tag(locus_tag: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by locus tag using cursor-based streaming.
-    
-    Args:
-        locus_tag: The locus tag to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for locus_tag (use q_expr instead of fq)
-    q_expr = f'locus_tag:"{locus_tag}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_organism(organism: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by organism using cursor-based streaming.
-    
-    Args:
-        organism: The organism to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for organism (use q_expr instead of fq)
-    q_expr = f'organism:"{organism}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_patric_id(patric_id: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by PATRIC ID using cursor-based streaming.
-    
-    Args:
-        patric_id: The PATRIC ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for patric_id (use q_expr instead of fq)
-    q_expr = f"patric_id:{patric_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_product(product: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by product using cursor-based streaming.
-    
-    Args:
-        product: The product to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for product (use q_expr instead of fq)
-    q_expr = f'product:"{product}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_protein_id(protein_id: str, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by protein ID using cursor-based streaming.
-    
-    Args:
-        protein_id: The protein ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for protein_id (use q_expr instead of fq)
-    q_expr = f"protein_id:{protein_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_result_type(result_type: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by result type using cursor-based streaming.
-    
-    Args:
-        result_type: The result type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for result_type (use q_expr instead of fq)
-    q_expr = f"result_type:{result_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_strain(strain: str, options: Dict[str, Any] = None,
-                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by strain using cursor-based streaming.
-    
-    Args:
-        strain: The strain to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for strain (use q_expr instead of fq)
-    q_expr = f'strain:"{strain}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_taxon_id(taxon_id: int, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by taxon ID using cursor-based streaming.
-    
-    Args:
-        taxon_id: The taxon ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for taxon_id (use q_expr instead of fq)
-    q_expr = f"taxon_id:{taxon_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_uniprot_id(uniprot_id: str, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by UniProt ID using cursor-based streaming.
-    
-    Args:
-        uniprot_id: The UniProt ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for uniprot_id (use q_expr instead of fq)
-    q_expr = f"uniprot_id:{uniprot_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_other_id(other_id: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by other ID using cursor-based streaming.
-    
-    Args:
-        other_id: The other ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for other_id (use q_expr instead of fq)
-    q_expr = f"other_id:{other_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_treatment_name(treatment_name: str, options: Dict[str, Any] = None,
-                                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by treatment name using cursor-based streaming.
-    
-    Args:
-        treatment_name: The treatment name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_name (use q_expr instead of fq)
-    q_expr = f'treatment_name:"{treatment_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_treatment_type(treatment_type: str, options: Dict[str, Any] = None,
-                                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by treatment type using cursor-based streaming.
-    
-    Args:
-        treatment_type: The treatment type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_type (use q_expr instead of fq)
-    q_expr = f"treatment_type:{treatment_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_treatment_amount(treatment_amount: str, options: Dict[str, Any] = None,
-                                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by treatment amount using cursor-based streaming.
-    
-    Args:
-        treatment_amount: The treatment amount to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_amount (use q_expr instead of fq)
-    q_expr = f"treatment_amount:{treatment_amount}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_treatment_duration(treatment_duration: str, options: Dict[str, Any] = None,
-                                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by treatment duration using cursor-based streaming.
-    
-    Args:
-        treatment_duration: The treatment duration to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for treatment_duration (use q_expr instead of fq)
-    q_expr = f"treatment_duration:{treatment_duration}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_counts_range(min_counts: float, max_counts: float, options: Dict[str, Any] = None,
-                                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by counts range using cursor-based streaming.
-    
-    Args:
-        min_counts: Minimum counts value
-        max_counts: Maximum counts value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for counts range (use q_expr instead of fq)
-    q_expr = f"counts:[{min_counts} TO {max_counts}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_fpkm_range(min_fpkm: float, max_fpkm: float, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by FPKM range using cursor-based streaming.
-    
-    Args:
-        min_fpkm: Minimum FPKM value
-        max_fpkm: Maximum FPKM value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for fpkm range (use q_expr instead of fq)
-    q_expr = f"fpkm:[{min_fpkm} TO {max_fpkm}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_log2_fc_range(min_log2_fc: float, max_log2_fc: float, options: Dict[str, Any] = None,
-                                         base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by log2 fold change range using cursor-based streaming.
-    
-    Args:
-        min_log2_fc: Minimum log2 fold change value
-        max_log2_fc: Maximum log2 fold change value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for log2_fc range (use q_expr instead of fq)
-    q_expr = f"log2_fc:[{min_log2_fc} TO {max_log2_fc}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_p_value_range(min_p_value: float, max_p_value: float, options: Dict[str, Any] = None,
-                                         base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by p-value range using cursor-based streaming.
-    
-    Args:
-        min_p_value: Minimum p-value
-        max_p_value: Maximum p-value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for p_value range (use q_expr instead of fq)
-    q_expr = f"p_value:[{min_p_value} TO {max_p_value}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_tpm_range(min_tpm: float, max_tpm: float, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by TPM range using cursor-based streaming.
-    
-    Args:
-        min_tpm: Minimum TPM value
-        max_tpm: Maximum TPM value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for tpm range (use q_expr instead of fq)
-    q_expr = f"tpm:[{min_tpm} TO {max_tpm}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_other_value_range(min_value: float, max_value: float, options: Dict[str, Any] = None,
-                                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by other value range using cursor-based streaming.
-    
-    Args:
-        min_value: Minimum other value
-        max_value: Maximum other value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for other_value range (use q_expr instead of fq)
-    q_expr = f"other_value:[{min_value} TO {max_value}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_z_score_range(min_z_score: float, max_z_score: float, options: Dict[str, Any] = None,
-                                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by z-score range using cursor-based streaming.
-    
-    Args:
-        min_z_score: Minimum z-score value
-        max_z_score: Maximum z-score value
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for z_score range (use q_expr instead of fq)
-    q_expr = f"z_score:[{min_z_score} TO {max_z_score}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_version(version: int, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by version using cursor-based streaming.
-    
-    Args:
-        version: The version to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for version (use q_expr instead of fq)
-    q_expr = f"version:{version}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_date_inserted_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by date inserted range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date for the range
-        end_date: End date for the range
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_inserted range (use q_expr instead of fq)
-    q_expr = f'date_inserted:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_date_modified_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by date modified range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date for the range
-        end_date: End date for the range
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_modified range (use q_expr instead of fq)
-    q_expr = f'date_modified:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_by_keyword(keyword: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query bioset_result by keyword using cursor-based streaming.
-    
-    Args:
-        keyword: The keyword to search for
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for keyword search (use q_expr instead of fq)
-    q_expr = f'*{keyword}*'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_bioset_result_all(options: Dict[str, Any] = None,
-                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query all bioset_result data using cursor-based streaming.
-    
-    Args:
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of bioset_result records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.bioset_result.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr="*:*",  # Match all documents
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
\ No newline at end of file
+from .query_spec_functions import (
+    exact,
+    phrase,
+    value_range,
+    date_range,
+    keyword,
+    filters,
+    all_records,
+    build_query_functions
+)
+
+CORE = "bioset_result"
+
+QUERY_SPECS = [
+    exact("query_bioset_result_by_id", "id",
+          summary="Query bioset_result by ID"),
+    filters("query_bioset_result_by_filters",
+            summary="Query bioset_result by custom filters"),
+    exact("query_bioset_result_by_bioset_id", "bioset_id",
+          summary="Query bioset_result by bioset ID"),
+    phrase("query_bioset_result_by_bioset_name", "bioset_name",
+           summary="Query bioset_result by bioset name"),
+    phrase("query_bioset_result_by_bioset_description", "bioset_description",
+           summary="Query bioset_result by bioset description"),
+    exact("query_bioset_result_by_bioset_type", "bioset_type",
+          summary="Query bioset_result by bioset type"),
+    exact("query_bioset_result_by_entity_id", "entity_id",
+          summary="Query bioset_result by entity ID"),
+    phrase("query_bioset_result_by_entity_name", "entity_name",
+           summary="Query bioset_result by entity name"),
+    exact("query_bioset_result_by_entity_type", "entity_type",
+          summary="Query bioset_result by entity type"),
+    exact("query_bioset_result_by_exp_id", "exp_id",
+          summary="Query bioset_result by experiment ID"),
+    phrase("query_bioset_result_by_exp_name", "exp_name",
+           summary="Query bioset_result by experiment name"),
+    phrase("query_bioset_result_by_exp_title", "exp_title",
+           summary="Query bioset_result by experiment title"),
+    exact("query_bioset_result_by_exp_type", "exp_type",
+          summary="Query bioset_result by experiment type"),
+    exact("query_bioset_result_by_feature_id", "feature_id",
+          summary="Query bioset_result by feature ID"),
+    phrase("query_bioset_result_by_gene", "gene",
+           summary="Query bioset_result by gene"),
+    exact("query_bioset_result_by_gene_id", "gene_id",
+          summary="Query bioset_result by gene ID"),
+    exact("query_bioset_result_by_genome_id", "genome_id",
+          summary="Query bioset_result by genome ID"),
+    phrase("query_bioset_result_by_locus_tag", "locus_tag",
+           summary="Query bioset_result by locus tag"),
+    phrase("query_bioset_result_by_organism", "organism",
+           summary="Query bioset_result by organism"),
+    exact("query_bioset_result_by_patric_id", "patric_id",
+          summary="Query bioset_result by PATRIC ID"),
+    phrase("query_bioset_result_by_product", "product",
+           summary="Query bioset_result by product"),
+    exact("query_bioset_result_by_protein_id", "protein_id",
+          summary="Query bioset_result by protein ID"),
+    exact("query_bioset_result_by_result_type", "result_type",
+          summary="Query bioset_result by result type"),
+    phrase("query_bioset_result_by_strain", "strain",
+           summary="Query bioset_result by strain"),
+    exact("query_bioset_result_by_taxon_id", "taxon_id", param_type=int,
+          summary="Query bioset_result by taxon ID"),
+    exact("query_bioset_result_by_uniprot_id", "uniprot_id",
+          summary="Query bioset_result by UniProt ID"),
+    exact("query_bioset_result_by_other_id", "other_id",
+          summary="Query bioset_result by other ID"),
+    phrase("query_bioset_result_by_treatment_name", "treatment_name",
+           summary="Query bioset_result by treatment name"),
+    exact("query_bioset_result_by_treatment_type", "treatment_type",
+          summary="Query bioset_result by treatment type"),
+    exact("query_bioset_result_by_treatment_amount", "treatment_amount",
+          summary="Query bioset_result by treatment amount"),
+    exact("query_bioset_result_by_treatment_duration", "treatment_duration",
+          summary="Query bioset_result by treatment duration"),
+    value_range("query_bioset_result_by_counts_range", "counts", ("min_counts", "max_counts"),
+                summary="Query bioset_result by counts range"),
+    value_range("query_bioset_result_by_fpkm_range", "fpkm", ("min_fpkm", "max_fpkm"),
+                summary="Query bioset_result by FPKM range"),
+    value_range("query_bioset_result_by_log2_fc_range", "log2_fc", ("min_log2_fc", "max_log2_fc"),
+                summary="Query bioset_result by log2 fold change range"),
+    value_range("query_bioset_result_by_p_value_range", "p_value", ("min_p_value", "max_p_value"),
+                summary="Query bioset_result by p-value range"),
+    value_range("query_bioset_result_by_tpm_range", "tpm", ("min_tpm", "max_tpm"),
+                summary="Query bioset_result by TPM range"),
+    value_range("query_bioset_result_by_other_value_range", "other_value", ("min_value", "max_value"),
+                summary="Query bioset_result by other value range"),
+    value_range("query_bioset_result_by_z_score_range", "z_score", ("min_z_score", "max_z_score"),
+                summary="Query bioset_result by z-score range"),
+    exact("query_bioset_result_by_version", "version", param_type=int,
+          summary="Query bioset_result by version"),
+    date_range("query_bioset_result_by_date_inserted_range", "date_inserted",
+               summary="Query bioset_result by date inserted range"),
+    date_range("query_bioset_result_by_date_modified_range", "date_modified",
+               summary="Query bioset_result by date modified range"),
+    keyword("query_bioset_result_by_keyword",
+            summary="Query bioset_result by keyword"),
+    all_records("query_bioset_result_all",
+                summary="Query all bioset_result data"),
+]
+
+globals().update(build_query_functions(CORE, QUERY_SPECS, __name__))
@@ -0,0 +1,203 @@
+"""
+BV-BRC Cassette Functions
+
+This module provides record/replay of upstream BV-BRC Solr traffic. In record
+mode every cursor stream is captured to a cassette directory together with the
+time at which each document arrived; in replay mode the streams are served back
+from the cassettes with the original or scaled timing, so a production workload
+can be profiled offline without touching the upstream API.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+CASSETTE_MODES = ("", "record", "replay")
+
+# Module level configuration (overridable via configure_cassette)
+_cassette_mode = os.getenv("BVBRC_CASSETTE_MODE", "")
+_cassette_dir = os.getenv("BVBRC_CASSETTE_DIR", "cassettes")
+_replay_speed = float(os.getenv("BVBRC_REPLAY_SPEED", "1.0"))
+
+
+def configure_cassette(mode: str = None, directory: str = None, speed: float = None) -> None:
+    """
+    Configure the cassette record/replay layer.
+
+    Args:
+        mode: "record", "replay" or "" to disable (optional)
+        directory: Directory holding the cassette files (optional)
+        speed: Replay speed-up factor; 1.0 keeps the original timing and
+            0 replays as fast as possible (optional)
+    """
+    global _cassette_mode, _cassette_dir, _replay_speed
+    if mode is not None:
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        _cassette_mode = mode
+    if directory is not None:
+        _cassette_dir = directory
+    if speed is not None:
+        _replay_speed = float(speed)
+
+
+def get_cassette_mode() -> str:
+    """Return the active cassette mode ("" when disabled)."""
+    return _cassette_mode
+
+
+def cassette_key(core: str, request: Dict[str, Any]) -> str:
+    """
+    Compute the cassette key for an upstream stream request.
+
+    Args:
+        core: The core/collection name
+        request: The stream parameters (rows, sort, fields, q_expr)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps({"core": core, **request}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _cassette_path(core: str, key: str) -> str:
+    return os.path.join(_cassette_dir, core, f"{key}.json")
+
+
+class CassetteClient:
+    """BV-BRC client wrapper that records or replays core streams."""
+
+    def __init__(self, client: Any = None):
+        self._client = client
+
+    def __getattr__(self, core: str) -> "_CassetteCore":
+        if core.startswith("_"):
+            raise AttributeError(core)
+        return _CassetteCore(self._client, core)
+
+
+class _CassetteCore:
+    def __init__(self, client: Any, core: str):
+        self._client = client
+        self._core = core
+
+    def stream_all_solr(self, rows: int = 1000, sort: Any = None, fields: Any = None,
+                        q_expr: str = "*:*", context_overrides: Dict[str, Any] = None,
+                        **kwargs) -> Iterator[Dict[str, Any]]:
+        # Headers (auth tokens) and base_url are deliberately kept out of the key
+        request = {"rows": rows, "sort": sort, "fields": fields, "q_expr": q_expr}
+        key = cassette_key(self._core, request)
+
+        if _cassette_mode == "replay":
+            return _replay_stream(self._core, key)
+
+        pager = getattr(self._client, self._core).stream_all_solr(
+            rows=rows,
+            sort=sort,
+            fields=fields,
+            q_expr=q_expr,
+            context_overrides=context_overrides,
+            **kwargs
+        )
+        return _record_stream(self._core, key, request, pager)
+
+
+def _record_stream(core: str, key: str, request: Dict[str, Any],
+                   pager: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    docs: List[Dict[str, Any]] = []
+    offsets: List[float] = []
+    start = time.perf_counter()
+    for doc in pager:
+        offsets.append(round(time.perf_counter() - start, 6))
+        docs.append(doc)
+        yield doc
+
+    # Only completed streams are written; an abandoned stream is not a faithful recording
+    cassette = {
+        "core": core,
+        "request": request,
+        "elapsed": round(time.perf_counter() - start, 6),
+        "offsets": offsets,
+        "docs": docs,
+    }
+    path = _cassette_path(core, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cassette, f)
+    os.replace(tmp_path, path)
+
+
+def _replay_stream(core: str, key: str) -> Iterator[Dict[str, Any]]:
+    path = _cassette_path(core, key)
+    try:
+        with open(path, "r") as f:
+            cassette = json.load(f)
+    except FileNotFoundError:
+        raise LookupError(f"No cassette recorded for {core} request {key} in {_cassette_dir}")
+
+    speed = _replay_speed
+    start = time.perf_counter()
+    for offset, doc in zip(cassette["offsets"], cassette["docs"]):
+        if speed > 0:
+            delay = offset / speed - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        yield doc
+
+    # Honour the tail latency of the recorded stream (the final empty cursor page)
+    if speed > 0:
+        delay = cassette.get("elapsed", 0) / speed - (time.perf_counter() - start)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def record_response(core: str, request: Dict[str, Any], response: Any, elapsed: float) -> None:
+    """
+    Write a single upstream request/response pair to the cassette directory.
+
+    Args:
+        core: The core/collection name
+        request: Request parameters (the cassette key is derived from them)
+        response: Decoded response body
+        elapsed: Upstream latency in seconds
+    """
+    key = cassette_key(core, request)
+    cassette = {
+        "core": core,
+        "request": request,
+        "elapsed": round(elapsed, 6),
+        "response": response,
+    }
+    path = _cassette_path(core, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(cassette, f)
+    os.replace(tmp_path, path)
+
+
+def replay_response(core: str, request: Dict[str, Any]) -> Any:
+    """
+    Serve a single upstream response from the cassette directory.
+
+    Args:
+        core: The core/collection name
+        request: Request parameters
+
+    Returns:
+        Decoded response body, after the recorded latency scaled by the replay speed
+    """
+    key = cassette_key(core, request)
+    path = _cassette_path(core, key)
+    try:
+        with open(path, "r") as f:
+            cassette = json.load(f)
+    except FileNotFoundError:
+        raise LookupError(f"No cassette recorded for {core} request {key} in {_cassette_dir}")
+    if _replay_speed > 0:
+        time.sleep(cassette.get("elapsed", 0) / _replay_speed)
+    return cassette["response"]
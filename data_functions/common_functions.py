@@ -4,9 +4,49 @@ BV-BRC Common Functions
 This module provides common utility functions for the BV-BRC Solr API.
 """
 
+import contextlib
+import itertools
 import json
-from typing import Any, Dict, List, Tuple
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
 from bvbrc_solr_api import create_client, query
+from .cassette_functions import CassetteClient, get_cassette_mode, record_response, replay_response
+from .shared_cache_functions import cache_response, cached_response, shared_cache_entry_limit
+from .spill_functions import ResultAccumulator, SpilledResults, spill_results
+from .record_functions import decode_records, record_converter, to_records
+from .schema_functions import get_field_schema, sort_fields, validate_query
+from .deadline_functions import PartialResults, decode_continuation, encode_continuation
+from .sketch_functions import DEFAULT_QUANTILES, StreamSummary
+from .progress_functions import current_progress, track_progress
+from .preflight_functions import (
+    EXPORT,
+    PROCEED,
+    REFUSE,
+    QueryTooLargeError,
+    preflight_enabled,
+    preflight_mode,
+    suggest_facets,
+)
+
+DEFAULT_BASE_URL = os.getenv("BVBRC_BASE_URL", "https://www.bv-brc.org/api-bulk")
+SOLR_TIMEOUT = float(os.getenv("BVBRC_SOLR_TIMEOUT", "300"))
+
+# Shared HTTP client for direct Solr requests (connection pooling)
+_http_client = None
+
+# Raw pass-through: result sets up to this many records are fetched in one
+# request and returned as the undecoded upstream docs array
+_raw_results = os.getenv("BVBRC_RAW_RESULTS", "1") != "0"
+_raw_max_rows = int(os.getenv("BVBRC_RAW_MAX_ROWS", "10000"))
+
+_DOCS_START = re.compile(rb'"docs"\s*:\s*\[')
+_NUM_FOUND = re.compile(rb'"numFound"\s*:\s*(\d+)')
 
 
 def create_bvbrc_client(base_url: str = None, headers: Dict[str, str] = None) -> Any:
@@ -18,34 +58,391 @@ def create_bvbrc_client(base_url: str = None, headers: Dict[str, str] = None) ->
         headers: Optional headers override
         
     Returns:
-        BV-BRC client instance
+        BV-BRC client instance (wrapped for record/replay when a cassette mode is active)
     """
+    cassette_mode = get_cassette_mode()
+    if cassette_mode == "replay":
+        return CassetteClient()
+    
     context_overrides = {}
     if base_url:
         context_overrides["base_url"] = base_url
     if headers:
         context_overrides["headers"] = headers
     
-    return create_client(context_overrides)
+    client = create_client(context_overrides)
+    if cassette_mode == "record":
+        return CassetteClient(client)
+    return client
 
 
-def query_direct(core: str, filter_str: str = "", options: Dict[str, Any] = None,
-                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+def get_http_client() -> httpx.Client:
     """
-    Query BV-BRC data directly using core name and filter string with cursor-based streaming.
+    Return the shared HTTP client used for direct Solr requests.
+    
+    Returns:
+        httpx.Client instance (created on first use)
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(timeout=SOLR_TIMEOUT)
+    return _http_client
+
+
+def configure_raw_results(enabled: bool = None, max_rows: int = None) -> None:
+    """
+    Configure the raw pass-through of upstream results.
+    
+    Args:
+        enabled: Return raw docs arrays to callers that ask for them (optional)
+        max_rows: Largest result set fetched raw in a single request (optional)
+    """
+    global _raw_results, _raw_max_rows
+    if enabled is not None:
+        _raw_results = bool(enabled)
+    if max_rows is not None:
+        _raw_max_rows = int(max_rows)
+
+
+def _solr_target(core: str, base_url: str = None,
+                 headers: Dict[str, str] = None) -> Tuple[str, Dict[str, str]]:
+    # URL and request headers of a direct query to a core
+    url = f"{(base_url or DEFAULT_BASE_URL).rstrip('/')}/{core}/"
+    request_headers = {
+        "Accept": "application/solr+json",
+        "Content-Type": "application/solrquery+x-www-form-urlencoded",
+    }
+    if headers:
+        request_headers.update(headers)
+    return url, request_headers
+
+
+def _post_solr(core: str, params: Dict[str, Any], base_url: str = None,
+               headers: Dict[str, str] = None) -> httpx.Response:
+    url, request_headers = _solr_target(core, base_url, headers)
+    response = get_http_client().post(url, content=urlencode(params, doseq=True), headers=request_headers)
+    response.raise_for_status()
+    return response
+
+
+def _solr_page(core: str, params: Dict[str, Any], base_url: str = None,
+               headers: Dict[str, str] = None) -> Dict[str, Any]:
+    # One direct Solr request, recorded to or replayed from the cassettes
+    # like solr_request, but never shared through the response cache
+    cassette_mode = get_cassette_mode()
+    if cassette_mode == "replay":
+        return replay_response(core, params)
+    start = time.perf_counter()
+    result = _post_solr(core, params, base_url, headers).json()
+    if cassette_mode == "record":
+        record_response(core, params, result, time.perf_counter() - start)
+    return result
+
+
+@contextlib.contextmanager
+def _stream_solr(core: str, params: Dict[str, Any], base_url: str = None,
+                 headers: Dict[str, str] = None) -> Iterator[httpx.Response]:
+    # Like _post_solr, but the body is read by the caller as it arrives and
+    # the connection is closed as soon as the caller is done with it
+    url, request_headers = _solr_target(core, base_url, headers)
+    with get_http_client().stream("POST", url, content=urlencode(params, doseq=True),
+                                  headers=request_headers) as response:
+        response.raise_for_status()
+        yield response
+
+
+def solr_request(core: str, params: Dict[str, Any], base_url: str = None,
+                 headers: Dict[str, str] = None) -> Dict[str, Any]:
+    """
+    Send a single Solr query to a BV-BRC core and return the decoded response.
+    
+    Used for requests the cursor stream cannot express, such as facet counts
+    or numFound probes.
+    
+    Args:
+        core: The core/collection name (e.g., "genome")
+        params: Solr parameters (e.g., {"q": "*:*", "rows": 0})
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Decoded Solr JSON response
+    """
+    cassette_mode = get_cassette_mode()
+    if cassette_mode == "replay":
+        return replay_response(core, params)
+    
+    # Requests with headers may carry credentials, so only anonymous ones are shared
+    shared = not headers and not cassette_mode
+    if shared:
+        cached = cached_response(core, params, base_url)
+        if cached is not None:
+            return cached
+    
+    start = time.perf_counter()
+    result = _post_solr(core, params, base_url, headers).json()
+    
+    if cassette_mode == "record":
+        record_response(core, params, result, time.perf_counter() - start)
+    elif shared:
+        cache_response(core, params, result, base_url)
+    return result
+
+
+def solr_facet(core: str, field: str, q_expr: str = "*:*", limit: int = 20,
+               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Count the most frequent values of a field among records matching a query.
+    
+    Args:
+        core: The core/collection name
+        field: Field to facet on
+        q_expr: Solr query expression
+        limit: Maximum number of facet values to return
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Tuple of (list of {"value", "count"} dicts, count of matching records)
+    """
+    response = solr_request(core, {
+        "q": q_expr,
+        "rows": 0,
+        "facet": "true",
+        "facet.field": field,
+        "facet.limit": limit,
+        "facet.mincount": 1,
+    }, base_url, headers)
+    
+    flat = response.get("facet_counts", {}).get("facet_fields", {}).get(field, [])
+    facets = [{"value": flat[i], "count": flat[i + 1]} for i in range(0, len(flat) - 1, 2)]
+    return facets, response.get("response", {}).get("numFound", 0)
+
+
+def count_query(core: str, q_expr: str = "*:*", base_url: str = None,
+                headers: Dict[str, str] = None) -> int:
+    """
+    Count the records of a core matching a query without fetching them.
+    
+    Args:
+        core: The core/collection name
+        q_expr: Solr query expression
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        numFound of the query
+    """
+    response = solr_request(core, {"q": q_expr, "rows": 0}, base_url, headers)
+    return response.get("response", {}).get("numFound", 0)
+
+
+def solr_docs_bytes(body: bytes) -> Tuple[bytes, int]:
+    """
+    Locate the docs array of a Solr JSON response without decoding it.
+    
+    Args:
+        body: Raw Solr JSON response
+        
+    Returns:
+        Tuple of (docs array as raw JSON bytes, numFound)
+        
+    Raises:
+        ValueError: If the response does not end with the docs array
+    """
+    start = _DOCS_START.search(body)
+    num_found = _NUM_FOUND.search(body, 0, start.start()) if start else None
+    if num_found is None:
+        raise ValueError("Solr response has no docs array")
+    end = body.rindex(b"]") + 1
+    # Only the closing braces of "response" and of the body may follow the docs array
+    if end <= start.end() - 1 or b"".join(body[end:].split()) != b"}}":
+        raise ValueError("Solr response has data after the docs array")
+    return body[start.end() - 1:end], int(num_found.group(1))
+
+
+def _solr_sort(sort: str) -> str:
+    # "-field" / "+field" / "field" / "field desc" to Solr sort clauses
+    clauses = []
+    for clause in sort.split(","):
+        clause = clause.strip()
+        if " " in clause:
+            clauses.append(clause)
+        elif clause.startswith("-"):
+            clauses.append(f"{clause[1:]} desc")
+        else:
+            clauses.append(f"{clause.lstrip('+')} asc")
+    return ",".join(clauses)
+
+
+def raw_query(core: str, q_expr: str, rows: int, options: Dict[str, Any] = None,
+              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[bytes, int]:
+    """
+    Fetch the records matching a query in one request as an undecoded docs array.
+    
+    The upstream bytes are never parsed into Python objects, so callers that
+    only re-serialize the records (the query tools) can splice them into
+    their response as they are.
+    
+    Args:
+        core: The core/collection name
+        q_expr: Solr query expression
+        rows: Number of records to fetch (the numFound of the query)
+        options: Optional query options (select, sort)
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Tuple of (docs array as raw JSON bytes, count of results)
+    """
+    options = options or {}
+    if rows <= 0:
+        return b"[]", 0
+    
+    params = {"q": q_expr, "rows": rows}
+    fields = options.get("select")
+    if fields:
+        params["fl"] = fields if isinstance(fields, str) else ",".join(fields)
+    if options.get("sort"):
+        params["sort"] = _solr_sort(options["sort"])
+    
+    if get_cassette_mode():
+        # Cassettes hold decoded responses
+        response = _solr_page(core, params, base_url, headers).get("response", {})
+        return json.dumps(response.get("docs", [])).encode("utf-8"), min(response.get("numFound", 0), rows)
+    
+    # Requests with headers may carry credentials, so only anonymous ones are shared
+    shared = not headers
+    if shared:
+        cached = cached_response(core, params, base_url, raw=True)
+        if cached is not None:
+            return cached, rows
+    
+    docs, num_found = solr_docs_bytes(_post_solr(core, params, base_url, headers).content)
+    # Only complete pages are cached: their count is the rows in the key
+    if shared and num_found >= rows:
+        cache_response(core, params, docs, base_url, raw=True)
+    return docs, min(num_found, rows)
+
+
+def _cursor_walk(core: str, params: Dict[str, Any], walk: Dict[str, Any], expires: float = None,
+                 base_url: str = None, headers: Dict[str, str] = None) -> Iterator[Dict[str, Any]]:
+    # Solr cursor walk that stops between pages once the deadline has passed.
+    # walk["cursor"] is the cursorMark of the next page to fetch.
+    first = True
+    while True:
+        if not first and expires is not None and time.monotonic() >= expires:
+            walk["expired"] = True
+            return
+        first = False
+        response = _solr_page(core, dict(params, cursorMark=walk["cursor"]), base_url, headers)
+        docs = response.get("response", {}).get("docs", [])
+        yield from docs
+        next_cursor = response.get("nextCursorMark")
+        if len(docs) < params["rows"] or not next_cursor or next_cursor == walk["cursor"]:
+            return
+        walk["cursor"] = next_cursor
+
+
+def _filled(docs: Iterator[Dict[str, Any]], fill: Dict[str, Any],
+            order: List[str] = None) -> Iterator[Dict[str, Any]]:
+    # Set the filled fields of every record, each after the nearest field
+    # preceding it in order (the key order of upstream records), or last
+    if not order:
+        for doc in docs:
+            doc.update(fill)
+            yield doc
+        return
+    preceding = {
+        field: [key for key in reversed(order[:order.index(field)]) if key not in fill] if field in order else None
+        for field in fill
+    }
+    for doc in docs:
+        after: Dict[Optional[str], List[str]] = {}
+        for field, keys in preceding.items():
+            anchor = None if keys is None else next((key for key in keys if key in doc), "")
+            after.setdefault(anchor, []).append(field)
+        filled = {field: fill[field] for field in after.get("", ())}
+        for key, value in doc.items():
+            if key not in fill:
+                filled[key] = value
+                filled.update((field, fill[field]) for field in after.get(key, ()))
+        filled.update((field, fill[field]) for field in after.get(None, ()))
+        yield filled
+
+
+def _until(docs: Iterator[Dict[str, Any]], expires: float, page_size: int,
+           walk: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    # Stop a record stream at the first page boundary past the deadline
+    for count, doc in enumerate(docs, 1):
+        yield doc
+        if count % page_size == 0 and time.monotonic() >= expires:
+            walk["expired"] = True
+            return
+
+
+def stream_query(core: str, q_expr: str, options: Dict[str, Any] = None,
+                 base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Stream every record of a core matching a query expression using cursor-based streaming.
     
     Args:
         core: The core/collection name (e.g., "genome", "genome_feature")
-        filter_str: RQL filter string (e.g., "eq(genome_id,123.45)")
-        options: Optional query options
+        q_expr: Solr query expression (e.g., "genome_id:123.45")
+        options: Optional query options (limit, select, sort, cap, etc.);
+            cap is the maximum number of records returned, and time_budget
+            the seconds to spend paging before returning partial results
         base_url: Optional base URL override
         headers: Optional headers override
         
     Returns:
-        Tuple of (list of records from the specified core, count of results)
+        Tuple of (list of records, count of results). With the "summarize"
+        option (a list of fields, with optional "top" and "quantiles"), the
+        records are only fed to streaming sketches and the summary (see
+        sketch_functions) is returned with the count of records summarized.
+        When the time budget runs out, the records fetched so far are returned as PartialResults
+        with a continuation token for continue_query(). A result set larger
+        than the memory budget or the preflight proceed threshold is spilled
+        to disk and returned as a SpilledResults first page. With the "raw"
+        option, a result set of at most the raw row limit is returned as the
+        undecoded upstream docs array (bytes) instead of a list. With the
+        "typed" option, records are compact typed records (see
+        record_functions) instead of dictionaries.
+        
+    Raises:
+        UnknownFieldError: If the query, select or sort names a field that
+            the core schema does not have
+        QueryTooLargeError: If the preflight probe finds more records than
+            the export limit
+        QueryCancelledError: If the caller's QueryProgress is cancelled
+            (see progress_functions)
     """
-    client = create_bvbrc_client(base_url, headers)
     options = options or {}
+    # Summaries only need the summarized fields
+    summarize = options.pop("summarize", None)
+    summary_top = options.pop("top", 10)
+    summary_quantiles = options.pop("quantiles", DEFAULT_QUANTILES)
+    if summarize:
+        summarize = summarize.split(",") if isinstance(summarize, str) else list(summarize)
+        options["select"] = summarize
+    validate_query(core, q_expr, options, base_url)
+    progress = current_progress()
+    if progress is not None:
+        progress.check()
+    raw = options.pop("raw", False)
+    typed = options.pop("typed", False)
+    cap = options.pop("cap", None)
+    budget = options.pop("time_budget", None)
+    expires = time.monotonic() + budget if budget else None
+    # Resumed query (continue_query): cursorMark to resume from and records already returned
+    cursor = options.pop("cursor", None)
+    fetched = options.pop("fetched", 0)
+    # Fields set to the same value in every record, instead of fetched (see sequence_md5_query)
+    fill = options.pop("fill", None)
+    fill_order = options.pop("fill_order", None)
+    # Raw and typed results both come from a single undecoded request when small
+    fetch_raw = ((raw or typed) and _raw_results and not get_cassette_mode()
+                 and cursor is None and not summarize and not fill)
     
     # Convert limit to rows for cursor pagination
     rows = options.get("limit", 1000)
@@ -53,20 +450,258 @@ def query_direct(core: str, filter_str: str = "", options: Dict[str, Any] = None
         del options["limit"]
     options["rows"] = rows
     
-    # Use stream_all_solr for cursor-based streaming
-    pager = getattr(client, core).stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=filter_str if filter_str else "*:*",
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
+    # Requests with headers may carry credentials, so only anonymous ones are shared
+    shared = not headers and not get_cassette_mode()
+    if shared:
+        request = {"q_expr": q_expr, "sort": options.get("sort"), "fields": options.get("select")}
+        if cap is not None:
+            request["cap"] = cap
+        if cursor is not None:
+            request["cursor"] = cursor
+        cached = cached_response(core, request, base_url)
+        if cached is not None and fill:
+            cached = list(_filled((dict(doc) for doc in cached), fill, fill_order))
+        if cached is not None and summarize:
+            summary = StreamSummary(summarize)
+            for doc in cached:
+                summary.add(doc)
+            return summary.result(summary_top, summary_quantiles), summary.count
+        if cached is not None:
+            # Only results that passed preflight and fit the memory budget are
+            # cached, but a hit is charged against the budget like a fresh result
+            if typed:
+                cached = to_records(core, cached, options.get("select"))
+            accumulator = ResultAccumulator()
+            try:
+                results, spilled = _collect_results(iter(cached), accumulator)
+            except BaseException:
+                accumulator.release()
+                raise
+            if spilled is not None:
+                accumulator.release()
+                return spilled, spilled.count
+            return accumulator.hold(results), len(results)
+    
+    # Preflight: probe numFound and proceed, export to a spill file or refuse.
+    # The raw path needs the count as well. A failed probe never blocks the query.
+    # Summaries hold only sketches, so they are never refused or exported: their
+    # probe only feeds progress and the total.
+    preflight = options.pop("preflight", True) and preflight_enabled()
+    num_found = mode = None
+    if preflight or fetch_raw or summarize:
+        try:
+            num_found = count_query(core, q_expr, base_url, headers)
+        except Exception as e:
+            print(f"Warning: count probe failed for {core}: {e}", file=sys.stderr)
+    if num_found is not None:
+        num_found = max(num_found - fetched, 0)
+    if num_found is not None and cap is not None:
+        num_found = min(num_found, cap)
+    if num_found is not None and progress is not None:
+        progress.expect(num_found)
+    if preflight and not summarize and num_found is not None:
+        mode = preflight_mode(num_found)
+        if mode == REFUSE:
+            raise QueryTooLargeError(core, q_expr, num_found, suggest_facets(core, q_expr, base_url, headers))
+    
+    # Raw path: small result sets skip decoding and the cursor walk entirely
+    if fetch_raw and num_found is not None and num_found <= _raw_max_rows and mode in (None, PROCEED):
+        try:
+            docs, count = raw_query(core, q_expr, num_found, options, base_url, headers)
+            if progress is not None:
+                progress.advance(count, core)
+            records = decode_records(core, docs, options.get("select")) if typed else docs
+            # The upstream bytes are charged against the memory budget like collected records
+            accumulator = ResultAccumulator()
+            if not accumulator.reserve(len(docs)):
+                spilled = spill_results([], iter(records if typed else json.loads(docs)))
+                return spilled, spilled.count
+            return accumulator.hold(records), count
+        except ValueError as e:
+            print(f"Warning: raw pass-through failed for {core}: {e}", file=sys.stderr)
     
-    # Collect all results into a list
+    # A query with a time budget walks the Solr cursor itself, so that it can be
+    # resumed from the cursorMark where the budget ran out
+    walk = {"cursor": cursor or "*", "expired": False}
+    unique_key = None
+    if (expires is not None or cursor is not None) and not get_cassette_mode():
+        schema = get_field_schema(core, base_url)
+        unique_key = schema.unique_key if schema is not None else None
+    if cursor is not None and unique_key is None:
+        raise ValueError(f"Cannot resume the {core} query: the unique key of {core} is unavailable")
+    
+    if unique_key is not None:
+        sort = _solr_sort(options["sort"]) if options.get("sort") else ""
+        if unique_key not in sort_fields(sort):
+            sort = f"{sort},{unique_key} asc" if sort else f"{unique_key} asc"
+        params = {"q": q_expr, "rows": options.get("rows", 1000), "sort": sort}
+        fields = options.get("select")
+        if fields:
+            params["fl"] = fields if isinstance(fields, str) else ",".join(fields)
+        stream = _cursor_walk(core, params, walk, expires, base_url, headers)
+        pager = stream
+    else:
+        client = create_bvbrc_client(base_url, headers)
+        stream = getattr(client, core).stream_all_solr(
+            rows=options.get("rows", 1000),
+            sort=options.get("sort"),
+            fields=options.get("select"),
+            q_expr=q_expr,
+            context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
+        )
+        pager = stream if expires is None else _until(stream, expires, options.get("rows", 1000), walk)
+    if cap is not None:
+        pager = itertools.islice(pager, cap)
+    if fill:
+        pager = _filled(pager, fill, fill_order)
+    # Progress per page; a cancelled call stops at the next page
+    if progress is not None:
+        pager = track_progress(pager, options.get("rows", 1000), core, progress)
+    
+    if summarize:
+        # Bounded memory: nothing is collected, cached or spilled
+        summary = StreamSummary(summarize)
+        try:
+            for doc in pager:
+                summary.add(doc)
+        finally:
+            if hasattr(stream, "close"):
+                stream.close()
+        result = summary.result(summary_top, summary_quantiles)
+        if num_found is not None:
+            result["total"] = fetched + num_found
+        if walk["expired"]:
+            result["partial"] = True
+        return result, summary.count
+    
+    if typed:
+        convert = record_converter(core, options.get("select"))
+        pager = (convert(doc) for doc in pager)
+    
+    def continuation(count: int) -> str:
+        # Token resuming the query after the records returned so far
+        if unique_key is None:
+            return None
+        state = {
+            "core": core, "q": q_expr, "select": options.get("select"), "sort": options.get("sort"),
+            "cap": cap - count if cap is not None else None, "cursor": walk["cursor"], "fetched": fetched + count,
+        }
+        if fill:
+            state["fill"] = fill
+            if fill_order:
+                state["fill_order"] = fill_order
+        return encode_continuation(state)
+    
+    total = fetched + num_found if num_found is not None else None
+    accumulator = ResultAccumulator()
+    try:
+        if mode == EXPORT:
+            spilled = spill_results([], pager)
+        else:
+            results, spilled = _collect_results(pager, accumulator)
+    except BaseException:
+        accumulator.release()
+        raise
+    finally:
+        # A capped, cancelled or expired stream stops early: release its connection now
+        if hasattr(stream, "close"):
+            stream.close()
+    
+    if spilled is not None:
+        accumulator.release()
+        if walk["expired"]:
+            spilled.mark_partial(continuation(spilled.count), total)
+        return spilled, spilled.count
+    # The reservation is held until the records are serialized
+    if walk["expired"]:
+        return accumulator.hold(PartialResults(results, continuation(len(results)), total)), len(results)
+    # Only results whose measured size fits a cache entry are encoded for the cache
+    if shared and accumulator.bytes <= shared_cache_entry_limit():
+        # Filled fields are not part of the upstream response
+        cached = [{key: value for key, value in doc.items() if key not in fill} for doc in results] if fill else results
+        cache_response(core, request, cached, base_url)
+    return accumulator.hold(results), len(results)
+
+
+def _collect_results(docs: Iterator[Any], accumulator: ResultAccumulator) -> Tuple[List[Any], Optional[SpilledResults]]:
+    # Collect records into a list, spilling them to disk past the memory budget
     results = []
-    for doc in pager:
+    for doc in docs:
         results.append(doc)
-    return results, len(results)
+        if not accumulator.add(doc):
+            return results, spill_results(results, docs)
+    return results, None
+
+
+def continue_query(continuation: str, options: Dict[str, Any] = None,
+                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Resume a query that ran out of its time budget.
+    
+    Args:
+        continuation: Continuation token of the PartialResults of the query
+        options: Optional query options (time_budget, raw, typed, etc.); the
+            select, sort and cap of the original query are kept
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Tuple of (list of the next records, count of results), PartialResults
+        again if the budget runs out before the end of the query
+        
+    Raises:
+        ValueError: If the continuation token is invalid
+    """
+    state = decode_continuation(continuation)
+    options = dict(options or {})
+    for key in ("select", "sort", "cap", "fill", "fill_order"):
+        if state.get(key) is not None:
+            options[key] = state[key]
+    options["cursor"] = state["cursor"]
+    options["fetched"] = state.get("fetched", 0)
+    return stream_query(state["core"], state.get("q") or "*:*", options, base_url, headers)
+
+
+def summarize_query(core: str, q_expr: str, fields: List[str], options: Dict[str, Any] = None,
+                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[Dict[str, Any], int]:
+    """
+    Summarize fields of the records matching a query without holding the records.
+    
+    Args:
+        core: The core/collection name (e.g., "bioset_result")
+        q_expr: Solr query expression
+        fields: Fields to summarize
+        options: Optional query options (top, quantiles, time_budget, etc.)
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Tuple of (summary, count of records summarized). The summary holds,
+        per field, the value and missing counts, the distinct count
+        (HyperLogLog), the most frequent values and, for numeric fields, the
+        min, max, mean and quantiles (t-digest)
+    """
+    options = dict(options or {})
+    options["summarize"] = fields
+    return stream_query(core, q_expr, options, base_url, headers)
+
+
+def query_direct(core: str, filter_str: str = "", options: Dict[str, Any] = None,
+                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Query BV-BRC data directly using core name and filter string with cursor-based streaming.
+    
+    Args:
+        core: The core/collection name (e.g., "genome", "genome_feature")
+        filter_str: RQL filter string (e.g., "eq(genome_id,123.45)")
+        options: Optional query options
+        base_url: Optional base URL override
+        headers: Optional headers override
+        
+    Returns:
+        Tuple of (list of records from the specified core, count of results)
+    """
+    return stream_query(core, filter_str if filter_str else "*:*", options, base_url, headers)
 
 
 def format_query_result(result: List[Dict[str, Any]], max_items: int = 10) -> str:
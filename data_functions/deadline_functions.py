@@ -0,0 +1,103 @@
+"""
+BV-BRC Deadline Functions
+
+This module holds the time budget of query calls. A query given a
+time_budget option stops paging once the budget is spent and returns the
+records fetched so far as PartialResults, with a continuation token that
+resumes the cursor walk where it stopped (see continue_query in
+common_functions). Tools apply a server-wide default budget, so a slow
+upstream yields partial results instead of a client-side timeout.
+"""
+
+import base64
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+# Module level configuration (overridable via configure_time_budget); 0 disables
+_default_budget = float(os.getenv("BVBRC_TIME_BUDGET", "50"))
+
+_TOKEN_KEYS = frozenset(("core", "q", "select", "sort", "cap", "cursor", "fetched", "fill", "fill_order"))
+
+
+class PartialResults(list):
+    """
+    Records fetched by a query before its time budget ran out.
+
+    The list holds the records; continuation resumes the query after them
+    (None when the query cannot be resumed), and total is the numFound of
+    the whole query when known.
+    """
+
+    partial = True
+
+    def __init__(self, records: List[Any], continuation: Optional[str], total: Optional[int] = None):
+        super().__init__(records)
+        self.continuation = continuation
+        self.total = total
+
+
+def configure_time_budget(default: float = None) -> None:
+    """
+    Configure the default time budget of query tools.
+
+    Args:
+        default: Seconds a tool call may spend fetching records before it
+            returns partial results (optional, 0 for no budget)
+    """
+    global _default_budget
+    if default is not None:
+        _default_budget = float(default)
+
+
+def tool_time_budget(time_budget: Optional[float] = None) -> Optional[float]:
+    """
+    Return the time budget of a tool call.
+
+    Args:
+        time_budget: Budget requested by the caller (optional, the configured
+            default otherwise)
+
+    Returns:
+        Budget in seconds, or None for no budget
+    """
+    budget = _default_budget if time_budget is None else float(time_budget)
+    return budget if budget > 0 else None
+
+
+def encode_continuation(state: Dict[str, Any]) -> str:
+    """
+    Encode the state of an interrupted query as a continuation token.
+
+    Args:
+        state: Query state (core, q, select, sort, cap, cursor, fetched and
+            optionally fill and fill_order)
+
+    Returns:
+        URL-safe continuation token
+    """
+    data = json.dumps(state, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_continuation(token: str) -> Dict[str, Any]:
+    """
+    Decode a continuation token.
+
+    Args:
+        token: Continuation token returned with partial results
+
+    Returns:
+        Query state (core, q, select, sort, cap, cursor, fetched)
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        state = json.loads(data)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid continuation token: {e}") from None
+    if not isinstance(state, dict) or not state.get("core") or not state.get("cursor") or set(state) - _TOKEN_KEYS:
+        raise ValueError("Invalid continuation token")
+    return state
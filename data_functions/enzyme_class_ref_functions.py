@@ -4,384 +4,37 @@ BV-BRC Enzyme Class Reference Functions
 This module provides enzyme class reference querying functions for the BV-BRC Solr API.
 """
 
-from typing import Any, Dict, List, Tuple
-from .common_functions import create_bvbrc_client
-
-
-def query_enzyme_class_ref_by_ec_number(ec_number: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by EC number using cursor-based streaming.
-    
-    Args:
-        ec_number: The EC number to query (e.g., "1.1.1.1")
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for ec_number (use q_expr instead of fq)
-    q_expr = f"ec_number:{ec_number}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_filters(filters: Dict[str, Any], options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by custom filters using cursor-based streaming.
-    
-    Args:
-        filters: Dictionary of filter criteria
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression from the filters dict
-    # For multiple filters, we need to combine them with AND logic
-    filter_parts = []
-    for key, value in filters.items():
-        if isinstance(value, str):
-            filter_parts.append(f'{key}:"{value}"')
-        else:
-            filter_parts.append(f"{key}:{value}")
-    
-    # Combine multiple filters with AND logic
-    if len(filter_parts) == 1:
-        q_expr = filter_parts[0]
-    else:
-        q_expr = " AND ".join(f"({part})" for part in filter_parts)
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_ec_description(ec_description: str, options: Dict[str, Any] = None,
-                                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by EC description using cursor-based streaming.
-    
-    Args:
-        ec_description: The EC description to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for ec_description (use q_expr instead of fq)
-    q_expr = f'ec_description:"{ec_description}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_go_term(go_term: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by GO term using cursor-based streaming.
-    
-    Args:
-        go_term: The GO term to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for go_term (use q_expr instead of fq)
-    q_expr = f"go:{go_term}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_version(version: int, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by version using cursor-based streaming.
-    
-    Args:
-        version: The version number to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for version (use q_expr instead of fq)
-    q_expr = f"version:{version}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_date_inserted_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                                 base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by date inserted range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_inserted range (use q_expr instead of fq)
-    q_expr = f'date_inserted:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_date_modified_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by date modified range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_modified range (use q_expr instead of fq)
-    q_expr = f'date_modified:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_by_keyword(keyword: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query enzyme class reference by keyword using cursor-based streaming.
-    
-    Args:
-        keyword: The keyword to search for
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for keyword search (use q_expr instead of fq)
-    q_expr = f'*{keyword}*'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_enzyme_class_ref_all(options: Dict[str, Any] = None,
-                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query all enzyme class reference data using cursor-based streaming.
-    
-    Args:
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of enzyme class reference records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.enzyme_class_ref.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr="*:*",  # Match all documents
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
\ No newline at end of file
+from .query_spec_functions import (
+    exact,
+    phrase,
+    date_range,
+    keyword,
+    filters,
+    all_records,
+    build_query_functions
+)
+
+CORE = "enzyme_class_ref"
+
+QUERY_SPECS = [
+    exact("query_enzyme_class_ref_by_ec_number", "ec_number",
+          summary="Query enzyme class reference by EC number"),
+    filters("query_enzyme_class_ref_by_filters",
+            summary="Query enzyme class reference by custom filters"),
+    phrase("query_enzyme_class_ref_by_ec_description", "ec_description",
+           summary="Query enzyme class reference by EC description"),
+    exact("query_enzyme_class_ref_by_go_term", "go", param="go_term",
+          summary="Query enzyme class reference by GO term"),
+    exact("query_enzyme_class_ref_by_version", "version", param_type=int,
+          summary="Query enzyme class reference by version"),
+    date_range("query_enzyme_class_ref_by_date_inserted_range", "date_inserted",
+               summary="Query enzyme class reference by date inserted range"),
+    date_range("query_enzyme_class_ref_by_date_modified_range", "date_modified",
+               summary="Query enzyme class reference by date modified range"),
+    keyword("query_enzyme_class_ref_by_keyword",
+            summary="Query enzyme class reference by keyword"),
+    all_records("query_enzyme_class_ref_all",
+                summary="Query all enzyme class reference data"),
+]
+
+globals().update(build_query_functions(CORE, QUERY_SPECS, __name__))
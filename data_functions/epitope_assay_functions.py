@@ -4,1369 +4,86 @@ BV-BRC Epitope Assay Functions
 This module provides epitope assay querying functions for the BV-BRC Solr API.
 """
 
-from typing import Any, Dict, List, Tuple
-from .common_functions import create_bvbrc_client
-
-
-def query_epitope_assay_by_id(assay_id: str, options: Dict[str, Any] = None,
-                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay ID using cursor-based streaming.
-    
-    Args:
-        assay_id: The assay ID to query
-        options: Optional query options (limit, select, sort, etc.)
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_id (use q_expr instead of fq)
-    q_expr = f"assay_id:{assay_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_filters(filters: Dict[str, Any], options: Dict[str, Any] = None,
-                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by custom filters using cursor-based streaming.
-    
-    Args:
-        filters: Dictionary of filter criteria
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression from the filters dict
-    # For multiple filters, we need to combine them with AND logic
-    filter_parts = []
-    for key, value in filters.items():
-        if isinstance(value, str):
-            filter_parts.append(f'{key}:"{value}"')
-        else:
-            filter_parts.append(f"{key}:{value}")
-    
-    # Combine multiple filters with AND logic
-    if len(filter_parts) == 1:
-        q_expr = filter_parts[0]
-    else:
-        q_expr = " AND ".join(f"({part})" for part in filter_parts)
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_group(assay_group: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay group using cursor-based streaming.
-    
-    Args:
-        assay_group: The assay group to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_group (use q_expr instead of fq)
-    q_expr = f"assay_group:{assay_group}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_measurement(assay_measurement: str, options: Dict[str, Any] = None,
-                                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay measurement using cursor-based streaming.
-    
-    Args:
-        assay_measurement: The assay measurement to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_measurement (use q_expr instead of fq)
-    q_expr = f"assay_measurement:{assay_measurement}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_measurement_unit(assay_measurement_unit: str, options: Dict[str, Any] = None,
-                                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay measurement unit using cursor-based streaming.
-    
-    Args:
-        assay_measurement_unit: The assay measurement unit to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_measurement_unit (use q_expr instead of fq)
-    q_expr = f"assay_measurement_unit:{assay_measurement_unit}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_method(assay_method: str, options: Dict[str, Any] = None,
-                                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay method using cursor-based streaming.
-    
-    Args:
-        assay_method: The assay method to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_method (use q_expr instead of fq)
-    q_expr = f"assay_method:{assay_method}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_result(assay_result: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay result using cursor-based streaming.
-    
-    Args:
-        assay_result: The assay result to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_result (use q_expr instead of fq)
-    q_expr = f"assay_result:{assay_result}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_assay_type(assay_type: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by assay type using cursor-based streaming.
-    
-    Args:
-        assay_type: The assay type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for assay_type (use q_expr instead of fq)
-    q_expr = f"assay_type:{assay_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_authors(authors: str, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by authors using cursor-based streaming.
-    
-    Args:
-        authors: The authors to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for authors (use q_expr instead of fq)
-    q_expr = f'authors:"{authors}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_epitope_id(epitope_id: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by epitope ID using cursor-based streaming.
-    
-    Args:
-        epitope_id: The epitope ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for epitope_id (use q_expr instead of fq)
-    q_expr = f"epitope_id:{epitope_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_epitope_sequence(epitope_sequence: str, options: Dict[str, Any] = None,
-                                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by epitope sequence using cursor-based streaming.
-    
-    Args:
-        epitope_sequence: The epitope sequence to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for epitope_sequence (use q_expr instead of fq)
-    q_expr = f'epitope_sequence:"{epitope_sequence}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_epitope_type(epitope_type: str, options: Dict[str, Any] = None,
-                                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by epitope type using cursor-based streaming.
-    
-    Args:
-        epitope_type: The epitope type to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for epitope_type (use q_expr instead of fq)
-    q_expr = f"epitope_type:{epitope_type}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_host_name(host_name: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by host name using cursor-based streaming.
-    
-    Args:
-        host_name: The host name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for host_name (use q_expr instead of fq)
-    q_expr = f'host_name:"{host_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_host_taxon_id(host_taxon_id: str, options: Dict[str, Any] = None,
-                                        base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by host taxon ID using cursor-based streaming.
-    
-    Args:
-        host_taxon_id: The host taxon ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for host_taxon_id (use q_expr instead of fq)
-    q_expr = f"host_taxon_id:{host_taxon_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_mhc_allele(mhc_allele: str, options: Dict[str, Any] = None,
-                                     base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by MHC allele using cursor-based streaming.
-    
-    Args:
-        mhc_allele: The MHC allele to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for mhc_allele (use q_expr instead of fq)
-    q_expr = f"mhc_allele:{mhc_allele}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_mhc_allele_class(mhc_allele_class: str, options: Dict[str, Any] = None,
-                                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by MHC allele class using cursor-based streaming.
-    
-    Args:
-        mhc_allele_class: The MHC allele class to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for mhc_allele_class (use q_expr instead of fq)
-    q_expr = f"mhc_allele_class:{mhc_allele_class}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_organism(organism: str, options: Dict[str, Any] = None,
-                                    base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by organism using cursor-based streaming.
-    
-    Args:
-        organism: The organism to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for organism (use q_expr instead of fq)
-    q_expr = f'organism:"{organism}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_pdb_id(pdb_id: str, options: Dict[str, Any] = None,
-                                 base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by PDB ID using cursor-based streaming.
-    
-    Args:
-        pdb_id: The PDB ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for pdb_id (use q_expr instead of fq)
-    q_expr = f"pdb_id:{pdb_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_pmid(pmid: str, options: Dict[str, Any] = None,
-                                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by PMID using cursor-based streaming.
-    
-    Args:
-        pmid: The PMID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for pmid (use q_expr instead of fq)
-    q_expr = f"pmid:{pmid}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_protein_accession(protein_accession: str, options: Dict[str, Any] = None,
-                                            base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by protein accession using cursor-based streaming.
-    
-    Args:
-        protein_accession: The protein accession to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for protein_accession (use q_expr instead of fq)
-    q_expr = f"protein_accession:{protein_accession}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_protein_id(protein_id: str, options: Dict[str, Any] = None,
-                                      base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by protein ID using cursor-based streaming.
-    
-    Args:
-        protein_id: The protein ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for protein_id (use q_expr instead of fq)
-    q_expr = f"protein_id:{protein_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_protein_name(protein_name: str, options: Dict[str, Any] = None,
-                                       base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by protein name using cursor-based streaming.
-    
-    Args:
-        protein_name: The protein name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for protein_name (use q_expr instead of fq)
-    q_expr = f'protein_name:"{protein_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_start(start: int, options: Dict[str, Any] = None,
-                                 base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by start position using cursor-based streaming.
-    
-    Args:
-        start: The start position to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for start (use q_expr instead of fq)
-    q_expr = f"start:{start}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_end(end: int, options: Dict[str, Any] = None,
-                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by end position using cursor-based streaming.
-    
-    Args:
-        end: The end position to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for end (use q_expr instead of fq)
-    q_expr = f"end:{end}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_taxon_id(taxon_id: int, options: Dict[str, Any] = None,
-                                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by taxon ID using cursor-based streaming.
-    
-    Args:
-        taxon_id: The taxon ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for taxon_id (use q_expr instead of fq)
-    q_expr = f"taxon_id:{taxon_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_taxon_lineage_id(taxon_lineage_id: str, options: Dict[str, Any] = None,
-                                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by taxon lineage ID using cursor-based streaming.
-    
-    Args:
-        taxon_lineage_id: The taxon lineage ID to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for taxon_lineage_id (use q_expr instead of fq)
-    q_expr = f"taxon_lineage_id:{taxon_lineage_id}"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_taxon_lineage_name(taxon_lineage_name: str, options: Dict[str, Any] = None,
-                                             base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by taxon lineage name using cursor-based streaming.
-    
-    Args:
-        taxon_lineage_name: The taxon lineage name to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for taxon_lineage_name (use q_expr instead of fq)
-    q_expr = f'taxon_lineage_name:"{taxon_lineage_name}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_title(title: str, options: Dict[str, Any] = None,
-                                 base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by title using cursor-based streaming.
-    
-    Args:
-        title: The title to query
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for title (use q_expr instead of fq)
-    q_expr = f'title:"{title}"'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_position_range(min_start: int, max_end: int, options: Dict[str, Any] = None,
-                                          base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by position range using cursor-based streaming.
-    
-    Args:
-        min_start: Minimum start position
-        max_end: Maximum end position
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for position range (use q_expr instead of fq)
-    q_expr = f"start:[{min_start} TO {max_end}]"
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_date_inserted_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                               base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by date inserted range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_inserted range (use q_expr instead of fq)
-    q_expr = f'date_inserted:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_date_modified_range(start_date: str, end_date: str, options: Dict[str, Any] = None,
-                                              base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by date modified range using cursor-based streaming.
-    
-    Args:
-        start_date: Start date in YYYY-MM-DD format
-        end_date: End date in YYYY-MM-DD format
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for date_modified range (use q_expr instead of fq)
-    q_expr = f'date_modified:[{start_date} TO {end_date}]'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_by_keyword(keyword: str, options: Dict[str, Any] = None,
-                                  base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query epitope assay by keyword using cursor-based streaming.
-    
-    Args:
-        keyword: The keyword to search for
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Build query expression for keyword search (use q_expr instead of fq)
-    q_expr = f'*{keyword}*'
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr=q_expr,
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
-
-
-def query_epitope_assay_all(options: Dict[str, Any] = None,
-                           base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
-    """
-    Query all epitope assay data using cursor-based streaming.
-    
-    Args:
-        options: Optional query options
-        base_url: Optional base URL override
-        headers: Optional headers override
-        
-    Returns:
-        Tuple of (list of epitope assay records, count of results)
-    """
-    client = create_bvbrc_client(base_url, headers)
-    options = options or {}
-    
-    # Convert limit to rows for cursor pagination
-    rows = options.get("limit", 1000)
-    if "limit" in options:
-        del options["limit"]
-    options["rows"] = rows
-    
-    pager = client.epitope_assay.stream_all_solr(
-        rows=options.get("rows", 1000),
-        sort=options.get("sort"),
-        fields=options.get("select"),
-        q_expr="*:*",  # Match all documents
-        context_overrides={"base_url": base_url, "headers": headers} if base_url or headers else None
-    )
-    
-    # Collect all results into a list
-    results = []
-    for doc in pager:
-        results.append(doc)
-    return results, len(results)
\ No newline at end of file
+from .query_spec_functions import (
+    exact,
+    phrase,
+    value_range,
+    date_range,
+    keyword,
+    filters,
+    all_records,
+    build_query_functions
+)
+
+CORE = "epitope_assay"
+
+QUERY_SPECS = [
+    exact("query_epitope_assay_by_id", "assay_id",
+          summary="Query epitope assay by assay ID"),
+    filters("query_epitope_assay_by_filters",
+            summary="Query epitope assay by custom filters"),
+    exact("query_epitope_assay_by_assay_group", "assay_group",
+          summary="Query epitope assay by assay group"),
+    exact("query_epitope_assay_by_assay_measurement", "assay_measurement",
+          summary="Query epitope assay by assay measurement"),
+    exact("query_epitope_assay_by_assay_measurement_unit", "assay_measurement_unit",
+          summary="Query epitope assay by assay measurement unit"),
+    exact("query_epitope_assay_by_assay_method", "assay_method",
+          summary="Query epitope assay by assay method"),
+    exact("query_epitope_assay_by_assay_result", "assay_result",
+          summary="Query epitope assay by assay result"),
+    exact("query_epitope_assay_by_assay_type", "assay_type",
+          summary="Query epitope assay by assay type"),
+    phrase("query_epitope_assay_by_authors", "authors",
+           summary="Query epitope assay by authors"),
+    exact("query_epitope_assay_by_epitope_id", "epitope_id",
+          summary="Query epitope assay by epitope ID"),
+    phrase("query_epitope_assay_by_epitope_sequence", "epitope_sequence",
+           summary="Query epitope assay by epitope sequence"),
+    exact("query_epitope_assay_by_epitope_type", "epitope_type",
+          summary="Query epitope assay by epitope type"),
+    phrase("query_epitope_assay_by_host_name", "host_name",
+           summary="Query epitope assay by host name"),
+    exact("query_epitope_assay_by_host_taxon_id", "host_taxon_id",
+          summary="Query epitope assay by host taxon ID"),
+    exact("query_epitope_assay_by_mhc_allele", "mhc_allele",
+          summary="Query epitope assay by MHC allele"),
+    exact("query_epitope_assay_by_mhc_allele_class", "mhc_allele_class",
+          summary="Query epitope assay by MHC allele class"),
+    phrase("query_epitope_assay_by_organism", "organism",
+           summary="Query epitope assay by organism"),
+    exact("query_epitope_assay_by_pdb_id", "pdb_id",
+          summary="Query epitope assay by PDB ID"),
+    exact("query_epitope_assay_by_pmid", "pmid",
+          summary="Query epitope assay by PMID"),
+    exact("query_epitope_assay_by_protein_accession", "protein_accession",
+          summary="Query epitope assay by protein accession"),
+    exact("query_epitope_assay_by_protein_id", "protein_id",
+          summary="Query epitope assay by protein ID"),
+    phrase("query_epitope_assay_by_protein_name", "protein_name",
+           summary="Query epitope assay by protein name"),
+    exact("query_epitope_assay_by_start", "start", param_type=int,
+          summary="Query epitope assay by start position"),
+    exact("query_epitope_assay_by_end", "end", param_type=int,
+          summary="Query epitope assay by end position"),
+    exact("query_epitope_assay_by_taxon_id", "taxon_id", param_type=int,
+          summary="Query epitope assay by taxon ID"),
+    exact("query_epitope_assay_by_taxon_lineage_id", "taxon_lineage_id",
+          summary="Query epitope assay by taxon lineage ID"),
+    phrase("query_epitope_assay_by_taxon_lineage_name", "taxon_lineage_name",
+           summary="Query epitope assay by taxon lineage name"),
+    phrase("query_epitope_assay_by_title", "title",
+           summary="Query epitope assay by title"),
+    value_range("query_epitope_assay_by_position_range", "start", ("min_start", "max_end"), param_type=int,
+                summary="Query epitope assay by position range"),
+    date_range("query_epitope_assay_by_date_inserted_range", "date_inserted",
+               summary="Query epitope assay by date inserted range"),
+    date_range("query_epitope_assay_by_date_modified_range", "date_modified",
+               summary="Query epitope assay by date modified range"),
+    keyword("query_epitope_assay_by_keyword",
+            summary="Query epitope assay by keyword"),
+    all_records("query_epitope_assay_all",
+                summary="Query all epitope assay data"),
+]
+
+globals().update(build_query_functions(CORE, QUERY_SPECS, __name__))
@@ -0,0 +1,600 @@
+"""
+BV-BRC FASTA Functions
+
+This module streams genome sequences as FASTA without materializing contig
+docs. The contigs of a query are listed without their sequence; then each
+sequence is requested on its own and its bytes are wrapped into FASTA lines
+as they arrive from the upstream response, so no more than one network chunk
+of one contig is held in memory. A region (accession:start-end) stops
+reading at the end of its window and closes the response.
+
+Protein and gene FASTA of whole genomes are exported by export_genome_fasta:
+the features of each genome are listed with their IDs and sequence MD5 only,
+the sequences are resolved by MD5 (through the sequence store when it is
+enabled, so each distinct sequence is downloaded once), and the genomes run
+in parallel.
+"""
+
+import concurrent.futures
+import contextlib
+import glob
+import itertools
+import os
+import re
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cassette_functions import get_cassette_mode
+from .common_functions import _cursor_walk, _stream_solr
+from .progress_functions import QueryCancelledError, current_progress, query_progress
+from .sequence_store_functions import fetch_sequences
+
+CORE = "genome_sequence"
+
+# Bases per FASTA line
+FASTA_WIDTH = 60
+
+# Module level configuration (overridable via configure_fasta)
+_fasta_dir = os.getenv("BVBRC_FASTA_DIR", "") or os.path.join(tempfile.gettempdir(), "bvbrc-fasta")
+_inline_bases = int(os.getenv("BVBRC_FASTA_INLINE_BASES", "100000"))
+_export_workers = int(os.getenv("BVBRC_FASTA_WORKERS", "4"))
+_fasta_ttl = float(os.getenv("BVBRC_FASTA_TTL", "86400"))
+# Whether tools return server-local paths (STDIO) or file names read through
+# read_fasta_page (HTTP clients, which cannot open server files)
+_local_paths = True
+
+# Most genomes of one export
+MAX_EXPORT_GENOMES = 1000
+
+# Sequence types of exports: MD5 field of the genome features (None for
+# contigs) and file extension
+SEQUENCE_TYPES = {
+    "protein": ("aa_sequence_md5", ".faa"),
+    "dna": ("na_sequence_md5", ".ffn"),
+    "contig": (None, ".fna"),
+}
+
+# Features whose sequences are resolved together
+_FEATURE_PAGE = 5000
+
+# Bytes copied at a time from the per-genome files into a merged file
+_COPY_CHUNK = 1024 * 1024
+
+# Contig fields listed ahead of the sequences (never the sequence itself)
+_CONTIG_FIELDS = ["sequence_id", "accession", "genome_id", "genome_name", "description", "length"]
+_CONTIG_PAGE = 1000
+
+_REGION = re.compile(r"^(.+):(\d+)-(\d+)$")
+_SEQUENCE_START = re.compile(rb'"sequence"\s*:\s*"')
+
+# Bytes of a response kept while looking for the sequence value
+_KEY_TAIL = 64
+
+
+def configure_fasta(directory: str = None, inline_bases: int = None, workers: int = None,
+                    ttl: float = None, local_paths: bool = None) -> None:
+    """
+    Configure FASTA exports.
+
+    Args:
+        directory: Directory FASTA files are written to (optional)
+        inline_bases: Most bases a tool returns inline rather than in a file (optional)
+        workers: Genomes of an export fetched in parallel (optional)
+        ttl: Seconds before a FASTA file is deleted (optional)
+        local_paths: Whether tools return server-local file paths rather
+            than file names to page through (optional)
+    """
+    global _fasta_dir, _inline_bases, _export_workers, _fasta_ttl, _local_paths
+    if directory is not None:
+        _fasta_dir = directory
+    if inline_bases is not None:
+        _inline_bases = int(inline_bases)
+    if workers is not None:
+        _export_workers = max(int(workers), 1)
+    if ttl is not None:
+        _fasta_ttl = float(ttl)
+    if local_paths is not None:
+        _local_paths = bool(local_paths)
+
+
+def fasta_inline_bases() -> int:
+    """Return the most bases a tool returns inline."""
+    return _inline_bases
+
+
+def fasta_local_paths() -> bool:
+    """Return whether tools return server-local FASTA file paths."""
+    return _local_paths
+
+
+def purge_fasta(max_age: float = None) -> int:
+    """
+    Delete FASTA files (and leftover part files) older than the FASTA TTL.
+
+    Args:
+        max_age: Age in seconds (optional, the configured FASTA TTL otherwise)
+
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - (_fasta_ttl if max_age is None else max_age)
+    removed = 0
+    for path in glob.glob(os.path.join(_fasta_dir, "*")):
+        try:
+            if os.path.isfile(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def fasta_path(file_name: str) -> str:
+    """
+    Return the path of a FASTA file in the export directory.
+
+    Args:
+        file_name: Plain file name (no directories)
+
+    Returns:
+        Absolute path of the file; the directory is created if needed and
+        files older than the FASTA TTL are deleted
+
+    Raises:
+        ValueError: If the name is empty, hidden or contains a directory
+    """
+    if not file_name or os.path.basename(file_name) != file_name or file_name.startswith("."):
+        raise ValueError(f"Invalid FASTA file name: {file_name!r}")
+    os.makedirs(_fasta_dir, exist_ok=True)
+    purge_fasta()
+    return os.path.abspath(os.path.join(_fasta_dir, file_name))
+
+
+def read_fasta_page(file_name: str, offset: int = 0, limit: int = None) -> Tuple[str, Optional[int], int]:
+    """
+    Read a page of a FASTA file in the export directory.
+
+    Args:
+        file_name: Plain file name, as returned by the FASTA tools
+        offset: Byte offset of the page
+        limit: Most bytes of the page (optional, the inline limit otherwise);
+            a page ends at a line break when it holds one
+
+    Returns:
+        Tuple of (FASTA text, offset of the next page or None at the end,
+        size of the file in bytes)
+
+    Raises:
+        ValueError: If the name, offset or limit is invalid
+        LookupError: If the file does not exist or has expired
+    """
+    limit = _inline_bases if limit is None else limit
+    if offset < 0 or limit < 1:
+        raise ValueError("offset must be at least 0 and limit at least 1")
+    path = fasta_path(file_name)
+    try:
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            handle.seek(offset)
+            data = handle.read(limit)
+    except FileNotFoundError:
+        raise LookupError(f"FASTA file {file_name} not found or expired")
+    end = offset + len(data)
+    if end < size and b"\n" in data:
+        data = data[:data.rindex(b"\n") + 1]
+        end = offset + len(data)
+    return data.decode("utf-8", errors="replace"), end if end < size else None, size
+
+
+def parse_region(region: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Parse a sequence region.
+
+    Args:
+        region: An accession, or a window of it as "accession:start-end"
+            (1-based, inclusive)
+
+    Returns:
+        Tuple of (accession, start, end); start and end are None for a whole
+        sequence
+
+    Raises:
+        ValueError: If the window is empty or starts before 1
+    """
+    region = region.strip()
+    match = _REGION.match(region)
+    if match is None:
+        if not region:
+            raise ValueError("Empty sequence region")
+        return region, None, None
+    start, end = int(match.group(2)), int(match.group(3))
+    if start < 1 or end < start:
+        raise ValueError(f"Invalid sequence region {region!r}: expected accession:start-end with 1 <= start <= end")
+    return match.group(1), start, end
+
+
+def list_contigs(q_expr: str, base_url: str = None,
+                 headers: Dict[str, str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    List the contigs matching a query, without their sequences.
+
+    Args:
+        q_expr: Solr query expression on the genome_sequence core
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Yields:
+        Contig docs (sequence_id, accession, genome_id, genome_name,
+        description, length) in sequence_id order
+    """
+    params = {
+        "q": q_expr,
+        "fl": ",".join(_CONTIG_FIELDS),
+        "rows": _CONTIG_PAGE,
+        "sort": "sequence_id asc",
+    }
+    yield from _cursor_walk(CORE, params, {"cursor": "*"}, None, base_url, headers)
+
+
+def _sequence_value(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    # The bytes of the first "sequence" string value of a streamed response.
+    # Sequences are plain IUPAC letters, so the value ends at the next quote.
+    tail = b""
+    for chunk in chunks:
+        data = tail + chunk
+        match = _SEQUENCE_START.search(data)
+        if match is not None:
+            break
+        tail = data[-_KEY_TAIL:]
+    else:
+        return
+    chunk = data[match.end():]
+    while True:
+        end = chunk.find(b'"')
+        value = chunk if end < 0 else chunk[:end]
+        if b"\\" in value:
+            raise ValueError("Unexpected escape in sequence data")
+        if value:
+            yield value
+        if end >= 0:
+            return
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("Truncated sequence response")
+
+
+def _window(chunks: Iterator[bytes], start: Optional[int], end: Optional[int]) -> Iterator[bytes]:
+    # The bases start..end (1-based, inclusive) of a chunked sequence
+    if start is None:
+        yield from chunks
+        return
+    offset = 0
+    for chunk in chunks:
+        low, high = max(start - 1 - offset, 0), min(end - offset, len(chunk))
+        offset += len(chunk)
+        if low < high:
+            yield chunk[low:high]
+        if offset >= end:
+            return
+
+
+def stream_sequence(sequence_id: str, start: int = None, end: int = None, base_url: str = None,
+                    headers: Dict[str, str] = None) -> Iterator[bytes]:
+    """
+    Stream the bases of one contig, or of a window of it.
+
+    The response is read in chunks and closed once the window is complete,
+    so the contig is never held in memory.
+
+    Args:
+        sequence_id: Sequence ID of the contig
+        start: First base of the window, 1-based (optional, whole contig)
+        end: Last base of the window, inclusive (optional, whole contig)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Yields:
+        Chunks of bases (ASCII bytes)
+    """
+    params = {"q": f'sequence_id:"{sequence_id}"', "fl": "sequence", "rows": 1}
+    with _stream_solr(CORE, params, base_url, headers) as response:
+        yield from _window(_sequence_value(response.iter_bytes()), start, end)
+
+
+def _wrap(chunks: Iterator[bytes], width: int, stats: Dict[str, int]) -> Iterator[bytes]:
+    # FASTA sequence lines of a chunked sequence
+    carry = b""
+    for chunk in chunks:
+        stats["bases"] += len(chunk)
+        data = carry + chunk
+        full = len(data) - len(data) % width
+        if full:
+            yield b"".join(data[i:i + width] + b"\n" for i in range(0, full, width))
+        carry = data[full:]
+    if carry:
+        yield carry + b"\n"
+
+
+def _header(contig: Dict[str, Any], start: Optional[int], end: Optional[int]) -> bytes:
+    # BV-BRC style header: >accession[:start-end]   description   [genome_name | genome_id]
+    name = contig.get("accession") or contig.get("sequence_id", "")
+    if start is not None:
+        name = f"{name}:{start}-{end}"
+    parts = [f">{name}"]
+    if contig.get("description"):
+        parts.append(contig["description"])
+    if contig.get("genome_id"):
+        parts.append(f"[{contig.get('genome_name', '')} | {contig['genome_id']}]")
+    return ("   ".join(parts) + "\n").encode("utf-8")
+
+
+def _region_targets(regions: List[str], q_expr: Optional[str], base_url: str,
+                    headers: Dict[str, str]) -> Iterator[Tuple[Dict[str, Any], Optional[int], Optional[int]]]:
+    for region in regions:
+        accession, start, end = parse_region(region)
+        region_q = f'accession:"{accession}"'
+        if q_expr:
+            region_q = f"({region_q}) AND ({q_expr})"
+        contig = next(list_contigs(region_q, base_url, headers), None)
+        if contig is None:
+            raise ValueError(f"No genome sequence with accession {accession!r}")
+        if start is not None:
+            length = contig.get("length")
+            if length is not None:
+                if start > length:
+                    raise ValueError(f"Region {region!r} starts past the end of {accession} ({length:,} bp)")
+                end = min(end, length)
+        yield contig, start, end
+
+
+def fasta_chunks(q_expr: str = None, regions: List[str] = None, width: int = FASTA_WIDTH,
+                 stats: Dict[str, int] = None, base_url: str = None,
+                 headers: Dict[str, str] = None) -> Iterator[bytes]:
+    """
+    Stream genome sequences as FASTA.
+
+    Args:
+        q_expr: Solr query expression selecting the contigs (e.g.,
+            'genome_id:"83332.12"'); with regions, it only disambiguates
+            accessions shared by several genomes (optional)
+        regions: Accessions or "accession:start-end" windows, written in
+            this order (optional, every contig of q_expr otherwise)
+        width: Bases per FASTA line
+        stats: Optional dictionary updated with the "sequences" and "bases"
+            written so far
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Yields:
+        Chunks of FASTA text (bytes): one header, then the wrapped lines of
+        each sequence
+
+    Raises:
+        ValueError: If neither q_expr nor regions is given, a region is
+            invalid or unknown, or cassettes are being replayed
+        QueryCancelledError: If the call is cancelled (checked between chunks)
+    """
+    if not q_expr and not regions:
+        raise ValueError("Give a query or regions of genome sequences")
+    if get_cassette_mode():
+        raise ValueError("FASTA streaming queries Solr directly and is not available with cassettes")
+    stats = stats if stats is not None else {}
+    stats.setdefault("sequences", 0)
+    stats.setdefault("bases", 0)
+    progress = current_progress()
+
+    if regions:
+        targets = _region_targets(regions, q_expr, base_url, headers)
+    else:
+        targets = ((contig, None, None) for contig in list_contigs(q_expr, base_url, headers))
+    for contig, start, end in targets:
+        if progress is not None:
+            progress.check()
+        yield _header(contig, start, end)
+        for lines in _wrap(stream_sequence(contig["sequence_id"], start, end, base_url, headers), width, stats):
+            if progress is not None:
+                progress.check()
+            yield lines
+        stats["sequences"] += 1
+        if progress is not None:
+            progress.advance(1, CORE)
+
+
+def _write_chunks(path: str, chunks: Iterable[bytes]) -> int:
+    # Write a chunk stream to a file, deleting the partial file on error
+    written = 0
+    try:
+        with open(path, "wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+                written += len(chunk)
+    except BaseException:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+def write_fasta(path: str, q_expr: str = None, regions: List[str] = None, width: int = FASTA_WIDTH,
+                base_url: str = None, headers: Dict[str, str] = None) -> Dict[str, int]:
+    """
+    Write genome sequences to a FASTA file as they stream.
+
+    Args:
+        path: Output file path (a partial file is deleted on error)
+        q_expr: Solr query expression selecting the contigs (optional, see fasta_chunks)
+        regions: Accessions or "accession:start-end" windows (optional)
+        width: Bases per FASTA line
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Dictionary with the sequences, bases and bytes written
+    """
+    stats: Dict[str, int] = {}
+    written = _write_chunks(path, fasta_chunks(q_expr, regions, width, stats, base_url, headers))
+    return dict(stats, bytes=written)
+
+
+def feature_fasta_chunks(genome_id: str, sequence_type: str = "protein", width: int = FASTA_WIDTH,
+                         stats: Dict[str, int] = None, base_url: str = None,
+                         headers: Dict[str, str] = None) -> Iterator[bytes]:
+    """
+    Stream the protein or gene sequences of a genome as FASTA.
+
+    Features are listed with their IDs and sequence MD5 only; the sequences
+    of each page of features are resolved by MD5 (see fetch_sequences), so a
+    sequence shared by several features or genomes is downloaded once.
+
+    Args:
+        genome_id: Genome ID
+        sequence_type: "protein" (amino acids) or "dna" (gene nucleotides)
+        width: Residues per FASTA line
+        stats: Optional dictionary updated with the "sequences" and "bases"
+            (residues) written so far, and the "missing" features whose
+            sequence was not found
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Yields:
+        Chunks of FASTA text (bytes), one per feature, in feature_id order
+
+    Raises:
+        QueryCancelledError: If the call is cancelled (checked between pages)
+    """
+    md5_field = SEQUENCE_TYPES[sequence_type][0]
+    if md5_field is None:
+        raise ValueError(f"Sequence type {sequence_type!r} is not a feature sequence type")
+    if get_cassette_mode():
+        raise ValueError("FASTA streaming queries Solr directly and is not available with cassettes")
+    stats = stats if stats is not None else {}
+    for key in ("sequences", "bases", "missing"):
+        stats.setdefault(key, 0)
+    progress = current_progress()
+
+    params = {
+        "q": f'genome_id:"{genome_id}" AND {md5_field}:*',
+        "fl": f"feature_id,patric_id,{md5_field}",
+        "rows": _FEATURE_PAGE,
+        "sort": "feature_id asc",
+    }
+    features = _cursor_walk("genome_feature", params, {"cursor": "*"}, None, base_url, headers)
+    while True:
+        page = list(itertools.islice(features, _FEATURE_PAGE))
+        if not page:
+            return
+        if progress is not None:
+            progress.check()
+        sequences = fetch_sequences("feature_sequence", [feature.get(md5_field) for feature in page],
+                                    base_url, headers)
+        for feature in page:
+            sequence = sequences.get(feature.get(md5_field))
+            if sequence is None:
+                stats["missing"] += 1
+                continue
+            name = feature.get("patric_id") or feature["feature_id"]
+            yield f">{name}\n".encode("utf-8") + b"".join(_wrap([sequence.encode("ascii")], width, stats))
+            stats["sequences"] += 1
+        if progress is not None:
+            progress.advance(len(page), "genome_feature")
+
+
+def _export_one(genome_id: str, sequence_type: str, path: str, width: int,
+                base_url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    # Write the FASTA of one genome to path through a temporary part file
+    stats: Dict[str, int] = {}
+    if SEQUENCE_TYPES[sequence_type][0] is None:
+        chunks = fasta_chunks(f'genome_id:"{genome_id}"', None, width, stats, base_url, headers)
+    else:
+        chunks = feature_fasta_chunks(genome_id, sequence_type, width, stats, base_url, headers)
+    part = f"{path}.{uuid.uuid4().hex}.part"
+    written = _write_chunks(part, chunks)
+    os.replace(part, path)
+    return dict({"genome_id": genome_id}, **stats, bytes=written)
+
+
+def export_genome_fasta(genome_ids: Iterable[str], sequence_type: str = "protein", merged_file: str = None,
+                        width: int = FASTA_WIDTH, base_url: str = None,
+                        headers: Dict[str, str] = None) -> Dict[str, Any]:
+    """
+    Export the sequences of many genomes as FASTA files, fetching genomes in parallel.
+
+    Args:
+        genome_ids: Genome IDs (duplicates are exported once)
+        sequence_type: "protein", "dna" (gene nucleotides) or "contig"
+        merged_file: Name of one FASTA file holding every genome, in the
+            order given (optional, one file per genome otherwise)
+        width: Residues per FASTA line
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Dictionary with the "genomes" exported (genome_id, sequences, bases,
+        bytes and path, or the error of a failed genome) and, with
+        merged_file, the "path" of the merged file
+
+    Raises:
+        ValueError: If the sequence type, file name or genome list is invalid
+        QueryCancelledError: If the call is cancelled
+    """
+    if sequence_type not in SEQUENCE_TYPES:
+        raise ValueError(f"Unknown sequence type {sequence_type!r}; expected one of {', '.join(SEQUENCE_TYPES)}")
+    genome_ids = list(dict.fromkeys(genome_id.strip() for genome_id in genome_ids if genome_id.strip()))
+    if not genome_ids:
+        raise ValueError("No genome IDs given")
+    if len(genome_ids) > MAX_EXPORT_GENOMES:
+        raise ValueError(f"At most {MAX_EXPORT_GENOMES} genomes can be exported at once")
+    extension = SEQUENCE_TYPES[sequence_type][1]
+    merged_path = fasta_path(merged_file) if merged_file else None
+    paths = {}
+    for genome_id in genome_ids:
+        name = f"{genome_id}{extension}"
+        # Genomes of a merged export go to part files next to the merged file
+        paths[genome_id] = f"{merged_path}.{name}.part" if merged_path else fasta_path(name)
+
+    # Worker threads report to (and are cancelled with) the caller's progress
+    parent = current_progress()
+
+    def run(genome_id: str) -> Dict[str, Any]:
+        with query_progress(parent) if parent is not None else contextlib.nullcontext():
+            return _export_one(genome_id, sequence_type, paths[genome_id], width, base_url, headers)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_export_workers, len(genome_ids))) as executor:
+        futures = {executor.submit(run, genome_id): genome_id for genome_id in genome_ids}
+        for future in concurrent.futures.as_completed(futures):
+            genome_id = futures[future]
+            try:
+                results[genome_id] = future.result()
+            except QueryCancelledError:
+                raise
+            except Exception as e:
+                results[genome_id] = {"genome_id": genome_id, "error": str(e)}
+    genomes = [results[genome_id] for genome_id in genome_ids]
+
+    if merged_path is None:
+        for genome in genomes:
+            if "error" not in genome:
+                genome["path"] = paths[genome["genome_id"]]
+        return {"genomes": genomes}
+
+    def merged_chunks() -> Iterator[bytes]:
+        for genome in genomes:
+            if "error" in genome:
+                continue
+            with open(paths[genome["genome_id"]], "rb") as part:
+                yield from iter(lambda: part.read(_COPY_CHUNK), b"")
+
+    try:
+        merged_part = f"{merged_path}.{uuid.uuid4().hex}.part"
+        written = _write_chunks(merged_part, merged_chunks())
+        os.replace(merged_part, merged_path)
+    finally:
+        for path in paths.values():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+    return {"path": merged_path, "bytes": written, "genomes": genomes}
@@ -0,0 +1,299 @@
+"""
+BV-BRC Interval Functions
+
+This module answers position queries on the features of one protein or
+contig from a local interval index instead of an upstream range query per
+call. The first query on a sequence streams the coordinates of its features
+(protein domains, sequence features, epitopes or epitope assays) into an
+implicit augmented interval tree: the intervals sorted by start, with the
+largest end of each subtree stored at its root (as in cgranges). Indexes
+are kept in memory, least recently used first out, so repeated exploration
+of the same proteins is answered locally in microseconds.
+"""
+
+import bisect
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .common_functions import _cursor_walk
+from .progress_functions import current_progress, track_progress
+
+# Indexed cores: field naming the protein or contig the coordinates are on,
+# unique key, and the other fields kept with each interval
+INTERVAL_CORES = {
+    "protein_feature": ("feature_id", "id", ("source", "source_id", "description", "interpro_id")),
+    "sequence_feature": ("feature_id", "id", ("sf_id", "sf_name", "sf_category", "aa_variant")),
+    "epitope": ("protein_accession", "epitope_id", ("epitope_sequence", "epitope_type")),
+    "epitope_assay": ("protein_accession", "assay_id", ("epitope_id", "assay_type", "assay_result")),
+}
+
+OVERLAP = "overlap"
+WITHIN = "within"
+NEAREST = "nearest"
+RELATIONS = (OVERLAP, WITHIN, NEAREST)
+
+# Module level configuration (overridable via configure_interval_index)
+_max_indexes = int(os.getenv("BVBRC_INTERVAL_INDEXES", "256"))
+_index_ttl = float(os.getenv("BVBRC_INTERVAL_TTL", "3600"))
+
+_indexes: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[float, IntervalIndex]]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+_PAGE_SIZE = 5000
+
+# Subtrees of at most 2^_SCAN_LEVEL intervals are scanned linearly
+_SCAN_LEVEL = 3
+
+
+class IntervalIndex:
+    """
+    Static interval tree over the features of one sequence.
+
+    Intervals are 1-based and inclusive, as stored upstream. Internally they
+    are half-open [start, end + 1), sorted by start, with max_end holding
+    the largest end of the implicit binary subtree rooted at each position.
+    """
+
+    def __init__(self, intervals: List[Tuple[int, int, Dict[str, Any]]]):
+        intervals = sorted(intervals, key=lambda interval: (interval[0], interval[1]))
+        self.starts = array("q", (start for start, _, _ in intervals))
+        self.ends = array("q", (end + 1 for _, end, _ in intervals))
+        self.records = [record for _, _, record in intervals]
+        self.max_end = array("q", self.ends)
+        self.max_level = self._build()
+        # Largest end (and its position) among the first i + 1 intervals, for nearest()
+        self.prefix_end = array("q")
+        self.prefix_at = array("q")
+        best, at = -1, -1
+        for i, end in enumerate(self.ends):
+            if end > best:
+                best, at = end, i
+            self.prefix_end.append(best)
+            self.prefix_at.append(at)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _build(self) -> int:
+        # Augment each implicit subtree root with the largest end below it
+        n = len(self.starts)
+        if n == 0:
+            return -1
+        ends, max_end = self.ends, self.max_end
+        last_i = 0
+        last = 0
+        for i in range(0, n, 2):
+            last_i, last = i, ends[i]
+        k = 1
+        while (1 << k) <= n:
+            x = 1 << (k - 1)
+            for i in range((x << 1) - 1, n, x << 2):
+                right = max_end[i + x] if i + x < n else last
+                max_end[i] = max(ends[i], max_end[i - x], right)
+            last_i = last_i - x if (last_i >> k) & 1 else last_i + x
+            if last_i < n and max_end[last_i] > last:
+                last = max_end[last_i]
+            k += 1
+        return k - 1
+
+    def overlap(self, start: int, end: int) -> List[int]:
+        """Return the positions of the intervals overlapping start..end (inclusive)."""
+        n = len(self.starts)
+        if n == 0:
+            return []
+        starts, ends, max_end = self.starts, self.ends, self.max_end
+        low, high = start, end + 1
+        found = []
+        stack = [(self.max_level, (1 << self.max_level) - 1, False)]
+        while stack:
+            k, x, left_done = stack.pop()
+            if k <= _SCAN_LEVEL:
+                i = x >> k << k
+                stop = min(i + (1 << (k + 1)) - 1, n)
+                while i < stop and starts[i] < high:
+                    if low < ends[i]:
+                        found.append(i)
+                    i += 1
+            elif not left_done:
+                y = x - (1 << (k - 1))
+                stack.append((k, x, True))
+                if y >= n or max_end[y] > low:
+                    stack.append((k - 1, y, False))
+            elif x < n and starts[x] < high:
+                if low < ends[x]:
+                    found.append(x)
+                stack.append((k - 1, x + (1 << (k - 1)), False))
+        found.sort()
+        return found
+
+    def within(self, start: int, end: int) -> List[int]:
+        """Return the positions of the intervals contained in start..end (inclusive)."""
+        first = bisect.bisect_left(self.starts, start)
+        last = bisect.bisect_right(self.starts, end)
+        return [i for i in range(first, last) if self.ends[i] <= end + 1]
+
+    def nearest(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Return the intervals closest to start..end (inclusive) and their distance.
+
+        Overlapping intervals are at distance 0; otherwise the distance is the
+        number of positions between the query and the interval, plus one.
+        """
+        found = self.overlap(start, end)
+        if found:
+            return [(i, 0) for i in found]
+        candidates = []
+        # Left: the interval ending last among those starting before the query
+        left = bisect.bisect_left(self.starts, start) - 1
+        if left >= 0:
+            candidates.append((self.prefix_at[left], start - (self.prefix_end[left] - 1)))
+        # Right: the intervals starting first after the query
+        right = bisect.bisect_right(self.starts, end)
+        if right < len(self.starts):
+            first = self.starts[right]
+            i = right
+            while i < len(self.starts) and self.starts[i] == first:
+                candidates.append((i, first - end))
+                i += 1
+        if not candidates:
+            return []
+        best = min(distance for _, distance in candidates)
+        return [(i, distance) for i, distance in candidates if distance == best]
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Return the record of the interval at a position."""
+        return self.records[i]
+
+
+def configure_interval_index(max_indexes: int = None, ttl: float = None) -> None:
+    """
+    Configure the cache of interval indexes.
+
+    Args:
+        max_indexes: Most sequences indexed in memory at once (optional)
+        ttl: Seconds before an index is rebuilt from upstream (optional)
+    """
+    global _max_indexes, _index_ttl
+    with _indexes_lock:
+        if max_indexes is not None:
+            _max_indexes = int(max_indexes)
+        if ttl is not None:
+            _index_ttl = float(ttl)
+        _indexes.clear()
+
+
+def build_interval_index(core: str, sequence_id: str, base_url: str = None,
+                         headers: Dict[str, str] = None) -> IntervalIndex:
+    """
+    Build the interval index of the features of one sequence from upstream.
+
+    Args:
+        core: An indexed core (see INTERVAL_CORES)
+        sequence_id: The feature_id of a protein (protein_feature,
+            sequence_feature) or the protein_accession (epitope, epitope_assay)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        IntervalIndex of the features with both a start and an end
+    """
+    sequence_field, unique_key, fields = INTERVAL_CORES[core]
+    params = {
+        "q": f'{sequence_field}:"{sequence_id}"',
+        "fl": ",".join((unique_key, "start", "end") + fields),
+        "rows": _PAGE_SIZE,
+        "sort": f"{unique_key} asc",
+    }
+    docs = _cursor_walk(core, params, {"cursor": "*"}, None, base_url, headers)
+    progress = current_progress()
+    if progress is not None:
+        docs = track_progress(docs, _PAGE_SIZE, core, progress)
+    intervals = []
+    for doc in docs:
+        start, end = doc.get("start"), doc.get("end")
+        if start is None or end is None:
+            continue
+        start, end = int(start), int(end)
+        intervals.append((min(start, end), max(start, end), doc))
+    return IntervalIndex(intervals)
+
+
+def get_interval_index(core: str, sequence_id: str, base_url: str = None,
+                       headers: Dict[str, str] = None) -> IntervalIndex:
+    """
+    Return the interval index of a sequence, building it on first use.
+
+    Args:
+        core: An indexed core (see INTERVAL_CORES)
+        sequence_id: Protein feature_id or protein_accession
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        IntervalIndex of the features of the sequence
+
+    Raises:
+        ValueError: If the core is not indexed
+    """
+    if core not in INTERVAL_CORES:
+        raise ValueError(f"No interval index for {core}; indexed cores: {', '.join(INTERVAL_CORES)}")
+    # Requests with headers may carry credentials, so their indexes are never cached
+    key = (core, sequence_id, base_url)
+    now = time.monotonic()
+    if not headers:
+        with _indexes_lock:
+            entry = _indexes.get(key)
+            if entry is not None and entry[0] > now:
+                _indexes.move_to_end(key)
+                return entry[1]
+    index = build_interval_index(core, sequence_id, base_url, headers)
+    if not headers and _max_indexes > 0:
+        with _indexes_lock:
+            _indexes[key] = (now + _index_ttl, index)
+            _indexes.move_to_end(key)
+            while len(_indexes) > _max_indexes:
+                _indexes.popitem(last=False)
+    return index
+
+
+def interval_query(core: str, sequence_id: str, start: int, end: int = None, relation: str = OVERLAP,
+                   base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Find the features of one sequence by position, from its interval index.
+
+    Args:
+        core: An indexed core (see INTERVAL_CORES)
+        sequence_id: Protein feature_id (protein_feature, sequence_feature) or
+            protein_accession (epitope, epitope_assay)
+        start: First position of the query (1-based)
+        end: Last position of the query, inclusive (optional, start)
+        relation: "overlap" (features overlapping start..end), "within"
+            (features contained in start..end) or "nearest" (the closest
+            features, with their distance)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Tuple of (list of records in start order, count of results); nearest
+        records carry a "distance" field
+
+    Raises:
+        ValueError: If the core, relation or positions are invalid
+    """
+    end = start if end is None else end
+    if end < start:
+        raise ValueError("end must not be less than start")
+    if relation not in RELATIONS:
+        raise ValueError(f"Unknown relation {relation!r}; expected one of {', '.join(RELATIONS)}")
+    index = get_interval_index(core, sequence_id, base_url, headers)
+    if relation == NEAREST:
+        results = [dict(index.record(i), distance=distance) for i, distance in index.nearest(start, end)]
+    elif relation == WITHIN:
+        results = [index.record(i) for i in index.within(start, end)]
+    else:
+        results = [index.record(i) for i in index.overlap(start, end)]
+    return results, len(results)
@@ -0,0 +1,573 @@
+"""
+BV-BRC PPI Graph Functions
+
+This module answers graph questions on protein-protein interactions from a
+local adjacency structure instead of one ppi query per step. The
+interactions of a genome or taxon are streamed once into a compressed sparse
+row (CSR) graph: proteins numbered in sorted order, the neighbors of protein
+i at targets[offsets[i]:offsets[i + 1]] and, beside each, the number of
+interaction records supporting the pair. Graphs are kept in memory, least
+recently used first out, and persisted to disk, so neighborhoods, paths,
+degree rankings and components are computed locally.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from .common_functions import _cursor_walk, count_query
+from .progress_functions import current_progress, track_progress
+
+CORE = "ppi"
+
+_FORMAT_VERSION = 1
+_PAGE_SIZE = 5000
+
+# Module level configuration (overridable via configure_ppi_graph)
+_graph_dir = os.getenv("BVBRC_PPI_GRAPH_DIR", os.path.join(tempfile.gettempdir(), "bvbrc-ppi-graphs"))
+_max_graphs = int(os.getenv("BVBRC_PPI_GRAPHS", "16"))
+_graph_ttl = float(os.getenv("BVBRC_PPI_GRAPH_TTL", "86400"))
+_max_edges = int(os.getenv("BVBRC_PPI_GRAPH_MAX_EDGES", "2000000"))
+
+_graphs: "OrderedDict[Tuple[str, str, Optional[str]], Tuple[float, PPIGraph]]" = OrderedDict()
+_graphs_lock = threading.Lock()
+# Per-graph locks, so concurrent first calls build a graph once, with the
+# count of calls holding or waiting for each; a lock is dropped at zero
+_build_locks: Dict[Tuple[str, str, Optional[str]], List[Any]] = {}
+
+# Arrays and string lists persisted, in file order
+_ARRAYS = ("offsets", "targets", "support")
+_STRINGS = ("proteins", "feature_ids", "genes")
+
+# Scopes a graph is loaded for, and the ppi fields of both interactors
+SCOPES = {
+    "genome": ("genome_id_a", "genome_id_b"),
+    "taxon": ("taxon_id_a", "taxon_id_b"),
+}
+
+
+class PPIGraph:
+    """
+    Undirected protein-protein interaction graph in CSR form.
+
+    Proteins are the interactors of the ppi records, with their feature ID
+    and gene when known. Parallel records between two proteins are merged
+    into one edge whose support is the number of records.
+    """
+
+    def __init__(self, arrays: Dict[str, array], strings: Dict[str, List[str]], built: float):
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        for name in _STRINGS:
+            setattr(self, name, strings[name])
+        self.built = built
+        # Proteins are found by interactor, then feature ID, then gene; a
+        # name keeps every protein it matches at the first kind it names
+        self.lookup: Dict[str, List[int]] = {}
+        for names in (self.proteins, self.feature_ids, self.genes):
+            matches: Dict[str, List[int]] = {}
+            for i, name in enumerate(names):
+                if name and name not in self.lookup:
+                    matches.setdefault(name, []).append(i)
+            self.lookup.update(matches)
+
+    def __len__(self) -> int:
+        return len(self.proteins)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct interacting pairs."""
+        loops = sum(1 for i in range(len(self)) if i in self.neighbors(i))
+        return (len(self.targets) + loops) // 2
+
+    def index(self, protein: str) -> int:
+        """Return the number of a protein given by interactor, feature ID or gene."""
+        matches = self.lookup.get(protein)
+        if not matches:
+            raise ValueError(f"Protein {protein} has no interactions in this graph")
+        if len(matches) > 1:
+            candidates = ", ".join(self.proteins[i] for i in matches)
+            raise ValueError(f"Protein {protein} names {len(matches)} proteins in this graph; "
+                             f"give one of the interactors {candidates}")
+        return matches[0]
+
+    def neighbors(self, i: int) -> array:
+        """Return the numbers of the proteins interacting with protein i."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i: int) -> int:
+        """Return the number of proteins interacting with protein i."""
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def node(self, i: int) -> Dict[str, Any]:
+        """Return the interactor, feature ID, gene and degree of protein i."""
+        return {
+            "interactor": self.proteins[i],
+            "feature_id": self.feature_ids[i] or None,
+            "gene": self.genes[i] or None,
+            "degree": self.degree(i),
+        }
+
+    def k_hop(self, i: int, hops: int) -> List[Tuple[int, int]]:
+        """Return the proteins within hops interactions of protein i, with their distance, nearest first."""
+        distance = {i: 0}
+        frontier = [i]
+        for hop in range(1, hops + 1):
+            next_frontier = []
+            for j in frontier:
+                for k in self.neighbors(j):
+                    if k not in distance:
+                        distance[k] = hop
+                        next_frontier.append(k)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return [(j, d) for j, d in distance.items() if j != i]
+
+    def shortest_path(self, source: int, target: int) -> Optional[List[int]]:
+        """Return the proteins of a shortest path from source to target, or None if they are not connected."""
+        if source == target:
+            return [source]
+        parent = {source: -1}
+        queue = deque([source])
+        while queue:
+            j = queue.popleft()
+            for k in self.neighbors(j):
+                if k in parent:
+                    continue
+                parent[k] = j
+                if k == target:
+                    path = [k]
+                    while parent[path[-1]] >= 0:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path
+                queue.append(k)
+        return None
+
+    def components(self) -> array:
+        """Return the connected component number of every protein, components numbered by decreasing size."""
+        labels = array("l", [-1]) * len(self)
+        sizes = []
+        for start in range(len(self)):
+            if labels[start] >= 0:
+                continue
+            label = len(sizes)
+            labels[start] = label
+            stack = [start]
+            size = 0
+            while stack:
+                j = stack.pop()
+                size += 1
+                for k in self.neighbors(j):
+                    if labels[k] < 0:
+                        labels[k] = label
+                        stack.append(k)
+            sizes.append(size)
+        rank = sorted(range(len(sizes)), key=lambda label: (-sizes[label], label))
+        renumber = array("l", [0]) * len(sizes)
+        for new, old in enumerate(rank):
+            renumber[old] = new
+        return array("l", (renumber[label] for label in labels))
+
+
+def _build_graph(docs) -> PPIGraph:
+    # Interactors, then the merged pairs in CSR form
+    proteins: Dict[str, int] = {}
+    feature_ids: List[str] = []
+    genes: List[str] = []
+    pairs: Dict[Tuple[int, int], int] = {}
+    for doc in docs:
+        ends = []
+        for side in ("a", "b"):
+            interactor = doc.get(f"interactor_{side}") or doc.get(f"feature_id_{side}")
+            if not interactor:
+                break
+            i = proteins.setdefault(interactor, len(proteins))
+            if i == len(feature_ids):
+                feature_ids.append("")
+                genes.append("")
+            feature_ids[i] = feature_ids[i] or doc.get(f"feature_id_{side}") or ""
+            genes[i] = genes[i] or doc.get(f"gene_{side}") or ""
+            ends.append(i)
+        if len(ends) == 2:
+            pair = (min(ends), max(ends))
+            pairs[pair] = pairs.get(pair, 0) + 1
+
+    # Renumber the proteins in sorted order
+    names = sorted(proteins)
+    order = [proteins[name] for name in names]
+    number = [0] * len(order)
+    for new, old in enumerate(order):
+        number[old] = new
+    adjacency: List[List[Tuple[int, int]]] = [[] for _ in names]
+    for (a, b), support in pairs.items():
+        a, b = number[a], number[b]
+        adjacency[a].append((b, support))
+        if a != b:
+            adjacency[b].append((a, support))
+    offsets, targets, support = array("q", [0]), array("l"), array("L")
+    for neighbors in adjacency:
+        neighbors.sort()
+        targets.extend(k for k, _ in neighbors)
+        support.extend(s for _, s in neighbors)
+        offsets.append(len(targets))
+    strings = {
+        "proteins": names,
+        "feature_ids": [feature_ids[old] for old in order],
+        "genes": [genes[old] for old in order],
+    }
+    return PPIGraph({"offsets": offsets, "targets": targets, "support": support}, strings, time.time())
+
+
+def _graph_path(scope: str, value: str, base_url: str = None) -> Optional[str]:
+    if not _graph_dir:
+        return None
+    name = f"{scope}-{re.sub(r'[^A-Za-z0-9_.-]', '_', value)}"
+    if base_url:
+        name += "-" + hashlib.md5(base_url.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(_graph_dir, f"{name}.bin")
+
+
+def save_ppi_graph(graph: PPIGraph, path: str) -> None:
+    """
+    Write a PPI graph to a file: a JSON header line, then the raw arrays and
+    the protein names.
+
+    Args:
+        graph: The graph to write
+        path: File path, replaced atomically
+    """
+    blobs = {name: "\0".join(getattr(graph, name)).encode("utf-8") for name in _STRINGS}
+    header = {
+        "version": _FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "built": graph.built,
+        "arrays": [[name, getattr(graph, name).typecode, len(getattr(graph, name))] for name in _ARRAYS],
+        "strings": [[name, len(blobs[name])] for name in _STRINGS],
+        "count": len(graph),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".ppi-graph-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for name in _ARRAYS:
+                getattr(graph, name).tofile(f)
+            for name in _STRINGS:
+                f.write(blobs[name])
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_ppi_graph(path: str) -> Optional[PPIGraph]:
+    """
+    Read a PPI graph written by save_ppi_graph.
+
+    Args:
+        path: File path
+
+    Returns:
+        PPIGraph, or None if the file is missing or of another format
+    """
+    try:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != _FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+                return None
+            arrays = {}
+            for name, typecode, length in header["arrays"]:
+                values = array(typecode)
+                values.fromfile(f, length)
+                arrays[name] = values
+            strings = {}
+            for name, length in header["strings"]:
+                blob = f.read(length)
+                if len(blob) != length:
+                    return None
+                strings[name] = blob.decode("utf-8").split("\0") if header["count"] else []
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    if set(arrays) != set(_ARRAYS) or set(strings) != set(_STRINGS):
+        return None
+    return PPIGraph(arrays, strings, header["built"])
+
+
+def configure_ppi_graph(directory: str = None, max_graphs: int = None, ttl: float = None,
+                        max_edges: int = None) -> None:
+    """
+    Configure the cache of PPI graphs.
+
+    Args:
+        directory: Directory graphs are persisted to ("" keeps them in memory
+            only) (optional)
+        max_graphs: Most graphs kept in memory at once (optional)
+        ttl: Seconds before a graph is rebuilt from upstream (optional)
+        max_edges: Most interaction records loaded into one graph (optional)
+    """
+    global _graph_dir, _max_graphs, _graph_ttl, _max_edges
+    with _graphs_lock:
+        if directory is not None:
+            _graph_dir = directory
+        if max_graphs is not None:
+            _max_graphs = int(max_graphs)
+        if ttl is not None:
+            _graph_ttl = float(ttl)
+        if max_edges is not None:
+            _max_edges = int(max_edges)
+        _graphs.clear()
+
+
+def ppi_graph_scope(genome_id: str = None, taxon_id: int = None) -> Tuple[str, str]:
+    """
+    Return the scope of the graph of a genome or taxon.
+
+    Args:
+        genome_id: Genome ID (optional)
+        taxon_id: Taxon ID (optional)
+
+    Returns:
+        Tuple of (scope, value), scope being "genome" or "taxon"
+
+    Raises:
+        ValueError: Unless exactly one of genome_id and taxon_id is given
+    """
+    if (genome_id is None) == (taxon_id is None):
+        raise ValueError("Give either a genome_id or a taxon_id")
+    return ("genome", str(genome_id)) if genome_id is not None else ("taxon", str(int(taxon_id)))
+
+
+def build_ppi_graph(scope: str, value: str, base_url: str = None,
+                    headers: Dict[str, str] = None) -> PPIGraph:
+    """
+    Build the PPI graph of a genome or taxon from upstream.
+
+    Args:
+        scope: "genome" or "taxon"
+        value: Genome ID or taxon ID
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        PPIGraph of the interactions with either interactor in the scope
+
+    Raises:
+        ValueError: If the scope holds more interactions than a graph loads
+    """
+    field_a, field_b = SCOPES[scope]
+    q_expr = f'{field_a}:"{value}" OR {field_b}:"{value}"'
+    total = count_query(CORE, q_expr, base_url, headers)
+    if total > _max_edges:
+        raise ValueError(f"The {scope} {value} has {total:,} interactions, more than the {_max_edges:,} "
+                         f"loaded into a graph")
+    params = {
+        "q": q_expr,
+        "fl": "id,interactor_a,interactor_b,feature_id_a,feature_id_b,gene_a,gene_b",
+        "rows": _PAGE_SIZE,
+        "sort": "id asc",
+    }
+    docs = _cursor_walk(CORE, params, {"cursor": "*"}, None, base_url, headers)
+    progress = current_progress()
+    if progress is not None:
+        progress.expect(total)
+        docs = track_progress(docs, _PAGE_SIZE, CORE, progress)
+    return _build_graph(docs)
+
+
+def get_ppi_graph(genome_id: str = None, taxon_id: int = None, base_url: str = None,
+                  headers: Dict[str, str] = None) -> PPIGraph:
+    """
+    Return the PPI graph of a genome or taxon, loading or building it on first use.
+
+    Args:
+        genome_id: Genome ID (optional)
+        taxon_id: Taxon ID (optional; give one of genome_id and taxon_id)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        PPIGraph of the genome or taxon
+    """
+    scope, value = ppi_graph_scope(genome_id, taxon_id)
+    # Requests with headers may carry credentials, so their graphs are never cached
+    if headers:
+        return build_ppi_graph(scope, value, base_url, headers)
+    key = (scope, value, base_url)
+    graph = _cached_graph(key)
+    if graph is not None:
+        return graph
+    with _graphs_lock:
+        entry = _build_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            # Another call may have loaded the graph while this one waited
+            graph = _cached_graph(key)
+            if graph is not None:
+                return graph
+            path = _graph_path(scope, value, base_url)
+            graph = load_ppi_graph(path) if path else None
+            if graph is None or time.time() - graph.built >= _graph_ttl:
+                graph = build_ppi_graph(scope, value, base_url, headers)
+                if path:
+                    save_ppi_graph(graph, path)
+            if _max_graphs > 0:
+                with _graphs_lock:
+                    _graphs[key] = (graph.built + _graph_ttl, graph)
+                    _graphs.move_to_end(key)
+                    while len(_graphs) > _max_graphs:
+                        _graphs.popitem(last=False)
+            return graph
+    finally:
+        with _graphs_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _build_locks[key]
+
+
+def _cached_graph(key: Tuple[str, str, Optional[str]]) -> Optional[PPIGraph]:
+    # The graph kept in memory for key, unless it has expired
+    with _graphs_lock:
+        entry = _graphs.get(key)
+        if entry is not None and entry[0] > time.time():
+            _graphs.move_to_end(key)
+            return entry[1]
+    return None
+
+
+def ppi_neighbors(protein: str, hops: int = 1, limit: int = None, genome_id: str = None,
+                  taxon_id: int = None, base_url: str = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Get the proteins interacting with a protein, directly or within k hops.
+
+    Args:
+        protein: Interactor, feature ID or gene of the protein
+        hops: Most interactions between the protein and those returned (default 1)
+        limit: Most proteins returned, nearest first (optional, all)
+        genome_id: Genome whose interactions are searched (optional)
+        taxon_id: Taxon whose interactions are searched (optional; give one
+            of genome_id and taxon_id)
+        base_url: Optional base URL override
+
+    Returns:
+        Tuple of (list of proteins with their distance, and the support of
+        their interaction for direct neighbors, count of proteins found)
+
+    Raises:
+        ValueError: If the protein has no interactions or hops is below 1
+    """
+    if hops < 1:
+        raise ValueError("hops must be at least 1")
+    graph = get_ppi_graph(genome_id, taxon_id, base_url)
+    i = graph.index(protein)
+    found = graph.k_hop(i, hops)
+    results = []
+    for j, distance in found[:limit]:
+        record = dict(graph.node(j), distance=distance)
+        if distance == 1:
+            # Neighbors are sorted, so the support is found by bisection
+            record["support"] = graph.support[graph.offsets[i] + bisect.bisect_left(graph.neighbors(i), j)]
+        results.append(record)
+    return results, len(found)
+
+
+def ppi_shortest_path(source: str, target: str, genome_id: str = None, taxon_id: int = None,
+                      base_url: str = None) -> Optional[List[Dict[str, Any]]]:
+    """
+    Get a shortest chain of interactions between two proteins.
+
+    Args:
+        source: Interactor, feature ID or gene of the first protein
+        target: Interactor, feature ID or gene of the last protein
+        genome_id: Genome whose interactions are searched (optional)
+        taxon_id: Taxon whose interactions are searched (optional; give one
+            of genome_id and taxon_id)
+        base_url: Optional base URL override
+
+    Returns:
+        The proteins of the path from source to target, or None when they
+        are not connected
+
+    Raises:
+        ValueError: If either protein has no interactions
+    """
+    graph = get_ppi_graph(genome_id, taxon_id, base_url)
+    path = graph.shortest_path(graph.index(source), graph.index(target))
+    return [graph.node(j) for j in path] if path is not None else None
+
+
+def ppi_degree_ranking(limit: int = 20, genome_id: str = None, taxon_id: int = None,
+                       base_url: str = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Get the proteins with the most interaction partners.
+
+    Args:
+        limit: Most proteins returned (default 20)
+        genome_id: Genome whose interactions are ranked (optional)
+        taxon_id: Taxon whose interactions are ranked (optional; give one of
+            genome_id and taxon_id)
+        base_url: Optional base URL override
+
+    Returns:
+        Tuple of (list of proteins by decreasing degree, count of proteins
+        in the graph)
+    """
+    graph = get_ppi_graph(genome_id, taxon_id, base_url)
+    ranked = sorted(range(len(graph)), key=lambda i: (-graph.degree(i), i))
+    return [graph.node(i) for i in ranked[:limit]], len(graph)
+
+
+def ppi_components(protein: str = None, limit: int = 20, members: int = 100, genome_id: str = None,
+                   taxon_id: int = None, base_url: str = None) -> Dict[str, Any]:
+    """
+    Get the connected components of the interaction graph.
+
+    Args:
+        protein: Only the component of this protein, given by interactor,
+            feature ID or gene (optional)
+        limit: Most components returned, largest first (default 20)
+        members: Most proteins listed per component (default 100)
+        genome_id: Genome whose interactions are searched (optional)
+        taxon_id: Taxon whose interactions are searched (optional; give one
+            of genome_id and taxon_id)
+        base_url: Optional base URL override
+
+    Returns:
+        Dict with the counts of proteins, interactions and components, and
+        the components (size and members, by decreasing degree)
+    """
+    graph = get_ppi_graph(genome_id, taxon_id, base_url)
+    labels = graph.components()
+    groups: Dict[int, List[int]] = {}
+    for i, label in enumerate(labels):
+        groups.setdefault(label, []).append(i)
+    if protein is not None:
+        selected = [labels[graph.index(protein)]]
+    else:
+        selected = sorted(groups)[:limit]
+    components = []
+    for label in selected:
+        group = sorted(groups[label], key=lambda i: (-graph.degree(i), i))
+        components.append({
+            "component": label,
+            "size": len(group),
+            "members": [graph.node(i) for i in group[:members]],
+        })
+    return {
+        "proteins": len(graph),
+        "interactions": graph.edge_count,
+        "component_count": len(groups),
+        "components": components,
+    }
@@ -0,0 +1,145 @@
+"""
+BV-BRC Preflight Functions
+
+This module decides, from a cheap numFound probe, how a streaming query runs
+before any record is pulled. Small result sets proceed normally, large ones
+are streamed straight to a spill file (export mode, see spill_functions) and
+result sets beyond the export limit are refused with the estimated count and
+facet counts that suggest how to narrow the query.
+"""
+
+import importlib
+import os
+from typing import Any, Dict, List
+
+PROCEED = "proceed"
+EXPORT = "export"
+REFUSE = "refuse"
+
+# Module level configuration (overridable via configure_preflight)
+_enabled = os.getenv("BVBRC_PREFLIGHT", "1") != "0"
+_proceed_max = int(os.getenv("BVBRC_PREFLIGHT_PROCEED_MAX", "100000"))
+_export_max = int(os.getenv("BVBRC_PREFLIGHT_EXPORT_MAX", "2000000"))
+
+# Fields that usually split a core into a few large groups, most useful first
+_FACET_PREFERENCES = (
+    "genus", "species", "antibiotic", "resistant_phenotype", "feature_type", "annotation",
+    "evidence", "source", "organism", "host_name", "host_species", "isolation_country",
+    "collection_country", "country", "region", "month", "lineage", "exp_type", "bioset_type",
+    "result_type", "assay_type", "epitope_type", "ontology", "family_type", "id_type",
+    "sf_category", "taxon_rank", "division", "interaction_type", "category", "pathway_class",
+    "superclass", "property", "subtype", "test_type", "method", "mol_type", "sequence_type",
+    "taxon_id", "genome_id",
+)
+_SUGGESTED_FACETS = 3
+_SUGGESTED_VALUES = 5
+
+
+class QueryTooLargeError(Exception):
+    """Raised when a query matches more records than the export limit."""
+
+    def __init__(self, core: str, q_expr: str, num_found: int,
+                 suggested_facets: Dict[str, List[Dict[str, Any]]] = None):
+        self.core = core
+        self.q_expr = q_expr
+        self.num_found = num_found
+        self.suggested_facets = suggested_facets or {}
+        super().__init__(f"estimated {num_found} docs, narrow your query")
+
+    def payload(self) -> Dict[str, Any]:
+        """Return the JSON payload describing the refused query."""
+        return {
+            "error": f"Query too large: estimated {self.num_found} docs in {self.core}, "
+                     f"narrow your query (limit {_export_max})",
+            "estimated_count": self.num_found,
+            "core": self.core,
+            "query": self.q_expr,
+            "suggested_facets": self.suggested_facets,
+        }
+
+
+def configure_preflight(enabled: bool = None, proceed_max: int = None, export_max: int = None) -> None:
+    """
+    Configure the preflight probe and its thresholds.
+
+    Args:
+        enabled: Run the numFound probe before streaming queries (optional)
+        proceed_max: Largest result set streamed into memory normally (optional)
+        export_max: Largest result set streamed to a spill file; larger ones
+            are refused (optional)
+    """
+    global _enabled, _proceed_max, _export_max
+    if enabled is not None:
+        _enabled = bool(enabled)
+    if proceed_max is not None:
+        _proceed_max = int(proceed_max)
+    if export_max is not None:
+        _export_max = int(export_max)
+
+
+def preflight_enabled() -> bool:
+    """Return whether queries are probed before streaming."""
+    return _enabled
+
+
+def preflight_mode(num_found: int) -> str:
+    """
+    Decide how a query runs from its estimated result count.
+
+    Args:
+        num_found: Records matching the query
+
+    Returns:
+        PROCEED, EXPORT or REFUSE
+    """
+    if num_found <= _proceed_max:
+        return PROCEED
+    if num_found <= _export_max:
+        return EXPORT
+    return REFUSE
+
+
+def suggested_facet_fields(core: str) -> List[str]:
+    """
+    Choose fields whose value counts help narrow a query on a core.
+
+    Args:
+        core: The core/collection name
+
+    Returns:
+        Up to three queryable fields of the core
+    """
+    try:
+        module = importlib.import_module(f".{core}_functions", __package__)
+    except ImportError:
+        return []
+    fields = [spec["field"] for spec in getattr(module, "QUERY_SPECS", []) if spec.get("field")]
+    return [field for field in _FACET_PREFERENCES if field in fields][:_SUGGESTED_FACETS]
+
+
+def suggest_facets(core: str, q_expr: str, base_url: str = None,
+                   headers: Dict[str, str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Count the most frequent values of the suggested fields among the matches.
+
+    Args:
+        core: The core/collection name
+        q_expr: Solr query expression
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Dictionary of field to list of {"value", "count"}; fields whose facet
+        request fails are left out
+    """
+    # Imported here: common_functions imports this module
+    from .common_functions import solr_facet
+
+    suggestions = {}
+    for field in suggested_facet_fields(core):
+        try:
+            facets, _ = solr_facet(core, field, q_expr, _SUGGESTED_VALUES, base_url, headers)
+        except Exception:
+            continue
+        suggestions[field] = facets
+    return suggestions
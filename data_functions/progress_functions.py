@@ -0,0 +1,133 @@
+"""
+BV-BRC Progress Functions
+
+This module lets a long query report its progress and be cancelled. A caller
+(such as the MCP progress middleware) installs a QueryProgress for the
+current context; stream_query() then reports the records fetched so far out
+of numFound after each page, and stops with QueryCancelledError at the next
+page once the progress is cancelled, closing its upstream stream.
+"""
+
+import contextlib
+import contextvars
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+ProgressCallback = Callable[[int, Optional[int], str], None]
+
+_current: contextvars.ContextVar[Optional["QueryProgress"]] = contextvars.ContextVar(
+    "bvbrc_query_progress", default=None
+)
+
+
+class QueryCancelledError(Exception):
+    """Raised inside a query whose caller cancelled it."""
+
+
+class QueryProgress:
+    """
+    Records fetched and expected by the queries of one call, and its cancellation.
+
+    Queries of the same call (e.g., a batch) add up, so the reported progress
+    only ever increases; each can report to a child progress of the call.
+    """
+
+    def __init__(self, callback: ProgressCallback = None, parent: "QueryProgress" = None):
+        self.callback = callback
+        self.parent = parent
+        self.done = 0
+        self.total: Optional[int] = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def child(self) -> "QueryProgress":
+        """Return a progress for one query of the call, cancellable on its own."""
+        return QueryProgress(parent=self)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def cancel(self) -> None:
+        """Cancel the queries of the call at their next page."""
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """Raise QueryCancelledError if the call was cancelled."""
+        if self.cancelled:
+            raise QueryCancelledError("Query cancelled")
+
+    def expect(self, count: int) -> None:
+        """Add the record count of a query to the total."""
+        with self._lock:
+            self.total = (self.total or 0) + count
+        if self.parent is not None:
+            self.parent.expect(count)
+
+    def advance(self, count: int, label: str = "records") -> None:
+        """Add fetched records and report the progress."""
+        with self._lock:
+            self.done += count
+            done, total = self.done, self.total
+        if self.parent is not None:
+            self.parent.advance(count, label)
+        if self.callback is not None:
+            of_total = f" of {total:,}" if total is not None else ""
+            self.callback(done, total, f"{label}: {done:,}{of_total} records fetched")
+
+
+@contextlib.contextmanager
+def query_progress(progress: QueryProgress) -> Iterator[QueryProgress]:
+    """
+    Report the progress of the queries run in this context to a QueryProgress.
+
+    Args:
+        progress: Progress to report to
+
+    Yields:
+        The progress
+    """
+    token = _current.set(progress)
+    try:
+        yield progress
+    finally:
+        _current.reset(token)
+
+
+def current_progress() -> Optional[QueryProgress]:
+    """Return the QueryProgress of the current context, if any."""
+    return _current.get()
+
+
+def track_progress(docs: Iterable[Any], page_size: int, label: str,
+                   progress: QueryProgress = None) -> Iterator[Any]:
+    """
+    Report progress once per page of a record stream and stop it on cancellation.
+
+    Args:
+        docs: Record stream
+        page_size: Records per upstream page
+        label: Description of the query in progress messages (e.g., the core)
+        progress: Progress to report to (optional, the current one otherwise)
+
+    Yields:
+        The records of the stream
+
+    Raises:
+        QueryCancelledError: If the call is cancelled (checked between pages)
+    """
+    progress = progress or current_progress()
+    if progress is None:
+        yield from docs
+        return
+    progress.check()
+    pending = 0
+    for doc in docs:
+        yield doc
+        pending += 1
+        if pending == page_size:
+            progress.advance(pending, label)
+            pending = 0
+            progress.check()
+    if pending:
+        progress.advance(pending, label)
@@ -0,0 +1,324 @@
+"""
+BV-BRC Query Spec Functions
+
+This module generates the per-field query functions of every core from a
+declarative spec. Each spec names the public function, the kind of field it
+queries (exact, phrase, range, date range, keyword, boolean, filters or all)
+and the Solr field, and every generated function streams through the single
+stream_query() implementation in common_functions.
+"""
+
+import importlib
+import inspect
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .common_functions import stream_query
+from .sequence_store_functions import is_sequence_md5_field, sequence_md5_query
+from .taxonomy_tree_functions import taxon_query
+
+# Field kinds
+EXACT = "exact"            # field:value
+PHRASE = "phrase"          # field:"value"
+RANGE = "range"            # field:[low TO high]
+DATE_RANGE = "date_range"  # field:[start TO end]
+KEYWORD = "keyword"        # *keyword*
+BOOLEAN = "boolean"        # field:true / field:false
+FILTERS = "filters"        # {field: value, ...} combined with AND
+ALL = "all"                # *:*
+
+FIELD_KINDS = (EXACT, PHRASE, RANGE, DATE_RANGE, KEYWORD, BOOLEAN, FILTERS, ALL)
+
+_KIND_TEMPLATES = {
+    EXACT: "{field}:{0}",
+    PHRASE: '{field}:"{0}"',
+    RANGE: "{field}:[{0} TO {1}]",
+    DATE_RANGE: "{field}:[{0} TO {1}]",
+    KEYWORD: "*{0}*",
+    BOOLEAN: "{field}:{0}",
+}
+
+_QUERY_ANNOTATIONS = {
+    "options": Dict[str, Any],
+    "base_url": str,
+    "headers": Dict[str, str],
+    "return": Tuple[List[Dict[str, Any]], int],
+}
+_QUERY_DEFAULTS = {"options": None, "base_url": None, "headers": None}
+
+# Registry of generated specs: {core: [spec, ...]} and {function name: spec}
+CORE_SPECS: Dict[str, List[Dict[str, Any]]] = {}
+_FUNCTION_SPECS: Dict[str, Dict[str, Any]] = {}
+
+
+def _spec(name: str, kind: str, field: Optional[str], params: Sequence[Tuple[str, type]],
+          summary: Optional[str], template: Optional[str]) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "kind": kind,
+        "field": field,
+        "params": list(params),
+        "summary": summary,
+        "template": template,
+    }
+
+
+def exact(name: str, field: str, param: str = None, param_type: type = str,
+          summary: str = None, template: str = None) -> Dict[str, Any]:
+    """Spec for an exact match query (field:value)."""
+    return _spec(name, EXACT, field, [(param or field, param_type)], summary, template)
+
+
+def phrase(name: str, field: str, param: str = None, param_type: type = str,
+           summary: str = None, template: str = None) -> Dict[str, Any]:
+    """Spec for a quoted phrase query (field:"value")."""
+    return _spec(name, PHRASE, field, [(param or field, param_type)], summary, template)
+
+
+def taxon(name: str, field: str = "taxon_id", param: str = None,
+          summary: str = None) -> Dict[str, Any]:
+    """Spec for a taxon ID query (field:value), expandable to the descendant taxa."""
+    return dict(exact(name, field, param, int, summary), taxon=True)
+
+
+def value_range(name: str, field: str, params: Sequence[str], param_type: type = float,
+                summary: str = None, template: str = None) -> Dict[str, Any]:
+    """Spec for an inclusive numeric range query (field:[low TO high])."""
+    return _spec(name, RANGE, field, [(p, param_type) for p in params], summary, template)
+
+
+def date_range(name: str, field: str, params: Sequence[str] = ("start_date", "end_date"),
+               summary: str = None, template: str = None) -> Dict[str, Any]:
+    """Spec for an inclusive date range query (field:[start TO end])."""
+    return _spec(name, DATE_RANGE, field, [(p, str) for p in params], summary, template)
+
+
+def keyword(name: str, param: str = "keyword", summary: str = None,
+            template: str = None) -> Dict[str, Any]:
+    """Spec for a wildcard keyword search (*keyword*)."""
+    return _spec(name, KEYWORD, None, [(param, str)], summary, template)
+
+
+def boolean(name: str, field: str, param: str = "is_public", summary: str = None) -> Dict[str, Any]:
+    """Spec for a boolean field query (field:true|false)."""
+    return _spec(name, BOOLEAN, field, [(param, bool)], summary, None)
+
+
+def filters(name: str, summary: str = None) -> Dict[str, Any]:
+    """Spec for a query built from a dictionary of field filters."""
+    return _spec(name, FILTERS, None, [("filters", Dict[str, Any])], summary, None)
+
+
+def all_records(name: str, summary: str = None) -> Dict[str, Any]:
+    """Spec for a query over every record of the core."""
+    return _spec(name, ALL, None, [], summary, None)
+
+
+def filters_q_expr(filters: Dict[str, Any]) -> str:
+    """
+    Build a query expression from a dictionary of filters.
+
+    Args:
+        filters: Dictionary of filter criteria; string values are quoted
+
+    Returns:
+        Query expression combining the filters with AND logic
+    """
+    filter_parts = []
+    for key, value in filters.items():
+        if isinstance(value, str):
+            filter_parts.append(f'{key}:"{value}"')
+        else:
+            filter_parts.append(f"{key}:{value}")
+
+    if len(filter_parts) == 1:
+        return filter_parts[0]
+    return " AND ".join(f"({part})" for part in filter_parts)
+
+
+def build_q_expr(spec: Dict[str, Any], values: Sequence[Any]) -> str:
+    """
+    Build the query expression for a spec from its argument values.
+
+    Args:
+        spec: Query spec
+        values: Positional values of the spec parameters
+
+    Returns:
+        Solr query expression
+    """
+    kind = spec["kind"]
+    if kind == ALL:
+        return "*:*"
+    if kind == FILTERS:
+        return filters_q_expr(values[0])
+    if kind == BOOLEAN:
+        values = [str(values[0]).lower()]
+    template = spec["template"] or _KIND_TEMPLATES[kind].replace("{field}", spec["field"] or "")
+    return template.format(*values)
+
+
+def _param_doc(spec: Dict[str, Any]) -> List[str]:
+    kind = spec["kind"]
+    params = [p for p, _ in spec["params"]]
+    if kind == FILTERS:
+        return ["filters: Dictionary of filter criteria"]
+    if kind == KEYWORD:
+        return [f"{params[0]}: The keyword to search for"]
+    if kind in (RANGE, DATE_RANGE):
+        return [f"{params[0]}: Lower bound of {spec['field']}",
+                f"{params[1]}: Upper bound of {spec['field']}"]
+    return [f"{p}: The {spec['field']} value to query" for p in params]
+
+
+def _function_doc(spec: Dict[str, Any]) -> str:
+    lines = [f"{spec['summary']} using cursor-based streaming.", "", "Args:"]
+    lines += [f"    {line}" for line in _param_doc(spec)]
+    if spec.get("taxon"):
+        lines.append("    options: Optional query options (limit, select, sort, etc.; descendants to "
+                     "include every taxon below)")
+    else:
+        lines.append("    options: Optional query options (limit, select, sort, etc.)")
+    lines += [
+        "    base_url: Optional base URL override",
+        "    headers: Optional headers override",
+        "",
+        "Returns:",
+        "    Tuple of (list of records, count of results)",
+    ]
+    return "\n".join(lines)
+
+
+def specialize_function(impl: Callable[..., Any], name: str, annotations: Dict[str, Any],
+                        defaults: Dict[str, Any] = None, module: str = None,
+                        doc: str = None) -> Callable[..., Any]:
+    """
+    Create a named function with an explicit signature that calls impl.
+
+    The parameters are the keys of annotations, in order (but "return"), with
+    their annotation and, from defaults, their default value. The function
+    binds its arguments to that signature and calls impl with all of them
+    positionally, in signature order. inspect and FastMCP read the
+    parameters from __signature__, so each function still supports
+    introspection and keyword arguments.
+
+    Args:
+        impl: Function called with the bound arguments
+        name: Name of the new function
+        annotations: Annotation of each parameter, in order, and of "return"
+        defaults: Default value of the optional parameters (optional)
+        module: Module the function is attributed to (optional)
+        doc: Docstring of the new function (optional)
+
+    Returns:
+        New function
+    """
+    defaults = defaults or {}
+    signature = inspect.Signature(
+        [
+            inspect.Parameter(param, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                              default=defaults.get(param, inspect.Parameter.empty), annotation=annotation)
+            for param, annotation in annotations.items() if param != "return"
+        ],
+        return_annotation=annotations.get("return", inspect.Signature.empty)
+    )
+
+    def fn(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return impl(*bound.args)
+
+    fn.__name__ = fn.__qualname__ = name
+    fn.__module__ = module or impl.__module__
+    fn.__doc__ = doc
+    fn.__annotations__ = dict(annotations)
+    fn.__signature__ = signature
+    return fn
+
+
+def make_query_function(core: str, spec: Dict[str, Any], module: str = None) -> Callable[..., Any]:
+    """
+    Generate the query function for a spec.
+
+    The function has the spec parameters followed by (options, base_url,
+    headers) and returns (list of records, count of results), exactly like
+    the hand-written query functions it replaces.
+
+    Args:
+        core: The core/collection name
+        spec: Query spec
+        module: Module the function is attributed to (optional)
+
+    Returns:
+        Generated query function
+    """
+    annotations = dict(spec["params"])
+    annotations.update(_QUERY_ANNOTATIONS)
+    count = len(spec["params"])
+    # Lookups by sequence MD5 take the sequence from the local sequence store
+    if spec["kind"] in (EXACT, PHRASE) and is_sequence_md5_field(core, spec["field"]):
+        def impl(value, options, base_url, headers):
+            return sequence_md5_query(core, value, options, base_url, headers)
+    # Taxon ID lookups can be expanded to the descendant taxa
+    elif spec.get("taxon"):
+        def impl(value, options, base_url, headers):
+            return taxon_query(core, spec["field"], value, options, base_url, headers)
+    else:
+        def impl(*args):
+            return stream_query(core, build_q_expr(spec, args[:count]), *args[count:])
+    return specialize_function(
+        impl,
+        spec["name"],
+        annotations,
+        _QUERY_DEFAULTS,
+        module or __name__,
+        _function_doc(spec)
+    )
+
+
+def build_query_functions(core: str, specs: List[Dict[str, Any]], module: str = None) -> Dict[str, Callable[..., Any]]:
+    """
+    Generate and register the query functions of a core.
+
+    Args:
+        core: The core/collection name
+        specs: Query specs of the core
+        module: Module the functions are attributed to (usually __name__)
+
+    Returns:
+        Dictionary of function name to generated function
+    """
+    functions = {}
+    for spec in specs:
+        spec["core"] = core
+        functions[spec["name"]] = make_query_function(core, spec, module)
+        _FUNCTION_SPECS[spec["name"]] = spec
+    CORE_SPECS[core] = specs
+    return functions
+
+
+def get_query_spec(name: str) -> Dict[str, Any]:
+    """
+    Look up the spec of a generated query function.
+
+    Args:
+        name: Query function name (e.g., "query_genome_by_id")
+
+    Returns:
+        Query spec, including its core
+    """
+    return _FUNCTION_SPECS[name]
+
+
+def load_all_query_specs() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Import every core module so that CORE_SPECS covers all cores.
+
+    Returns:
+        The CORE_SPECS registry
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    for filename in sorted(os.listdir(package_dir)):
+        if filename.endswith("_functions.py") and filename != "query_spec_functions.py":
+            importlib.import_module(f".{filename[:-3]}", __package__)
+    return CORE_SPECS
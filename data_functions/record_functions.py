@@ -0,0 +1,376 @@
+"""
+BV-BRC Record Functions
+
+This module decodes Solr documents into compact typed records instead of
+dictionaries. A record class has one slot per field, taken from the field
+schema of its core (genome, genome_feature, genome_amr and bioset_result are
+built in) or from the selected fields, so records carry no per-record key
+table, and the strings of fields whose values repeat across records (genome
+names, vocabulary terms) are shared between records. Records read like
+mappings and serialize to the same JSON objects as the documents they were
+decoded from.
+
+When msgspec is installed, record classes are msgspec Structs and raw upstream
+docs arrays are decoded straight into them, faster than json.loads. Otherwise
+they are plain __slots__ classes filled from decoded dictionaries, which saves
+the same memory at the cost of a conversion pass. A document with a field
+outside the schema is kept as a dictionary, so decoding never drops data.
+"""
+
+import json
+import keyword
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Stored fields of the high-volume cores
+RECORD_SCHEMAS: Dict[str, Tuple[str, ...]] = {
+    "genome": (
+        "genome_id", "genome_name", "taxon_id", "taxon_lineage_ids", "taxon_lineage_names",
+        "superkingdom", "kingdom", "phylum", "class", "order", "family", "genus", "species",
+        "strain", "serovar", "biovar", "pathovar", "mlst", "segment", "subtype", "h_type",
+        "n_type", "h1_clade_global", "h1_clade_us", "h3_clade", "h5_clade", "ph1n1_like",
+        "lineage", "clade", "subclade", "other_typing", "culture_collection", "type_strain",
+        "reference_genome", "completion_date", "publication", "authors", "bioproject_accession",
+        "biosample_accession", "assembly_accession", "sra_accession", "genbank_accessions",
+        "refseq_accessions", "sequencing_centers", "sequencing_status", "sequencing_platform",
+        "sequencing_depth", "assembly_method", "chromosomes", "plasmids", "contigs",
+        "genome_length", "gc_content", "contig_l50", "contig_n50", "trna", "rrna", "cds",
+        "cds_ratio", "hypothetical_cds", "hypothetical_cds_ratio", "partial_cds",
+        "partial_cds_ratio", "plfam_cds", "plfam_cds_ratio", "patric_cds", "brc1_cds",
+        "refseq_cds", "core_families", "core_family_ratio", "missing_core_family_ids",
+        "coarse_consistency", "fine_consistency", "checkm_completeness",
+        "checkm_contamination", "genome_quality", "genome_quality_flags", "genome_status",
+        "nearest_genomes", "outgroup_genomes", "isolation_site", "isolation_source",
+        "isolation_comments", "collection_date", "collection_year", "season",
+        "isolation_country", "state_province", "geographic_group", "geographic_location",
+        "latitude", "longitude", "altitude", "depth", "other_environmental", "host_name",
+        "host_common_name", "host_scientific_name", "host_taxon_id", "host_group",
+        "host_gender", "host_age", "host_health", "lab_host", "passage", "body_sample_site",
+        "body_sample_subsite", "other_clinical", "antimicrobial_resistance",
+        "antimicrobial_resistance_evidence", "gram_stain", "cell_shape", "motility",
+        "sporulation", "temperature_range", "optimal_temperature", "salinity",
+        "oxygen_requirement", "habitat", "disease", "comments", "additional_metadata",
+        "p2_genome_id", "public", "owner", "user_read", "user_write", "date_inserted",
+        "date_modified", "_version_",
+    ),
+    "genome_feature": (
+        "feature_id", "genome_id", "genome_name", "taxon_id", "annotation", "feature_type",
+        "patric_id", "refseq_locus_tag", "alt_locus_tag", "brc_id", "p2_feature_id",
+        "protein_id", "gene_id", "gi", "gene", "product", "sequence_id", "accession", "start",
+        "end", "strand", "location", "segments", "pos_group", "codon_start", "na_length",
+        "aa_length", "na_sequence_md5", "aa_sequence_md5", "figfam_id", "pgfam_id", "plfam_id",
+        "og_id", "sog_id", "go", "ec", "pathway", "property", "notes", "classifier_score",
+        "classifier_round", "uniprotkb_accession", "pdb_accession", "public", "owner",
+        "user_read", "user_write", "date_inserted", "date_modified", "_version_",
+    ),
+    "genome_amr": (
+        "id", "genome_id", "genome_name", "taxon_id", "antibiotic", "resistant_phenotype",
+        "measurement", "measurement_sign", "measurement_value", "measurement_unit",
+        "laboratory_typing_method", "laboratory_typing_method_version",
+        "laboratory_typing_platform", "vendor", "testing_standard", "testing_standard_year",
+        "computational_method", "computational_method_version",
+        "computational_method_performance", "evidence", "source", "pmid", "public", "owner",
+        "user_read", "user_write", "date_inserted", "date_modified", "_version_",
+    ),
+    "bioset_result": (
+        "id", "bioset_id", "bioset_name", "bioset_description", "bioset_type", "exp_id",
+        "exp_name", "exp_title", "exp_type", "entity_id", "entity_name", "entity_type",
+        "result_type", "genome_id", "taxon_id", "organism", "strain", "feature_id", "patric_id",
+        "gene_id", "gene", "locus_tag", "protein_id", "uniprot_id", "product", "other_id",
+        "other_value", "counts", "fpkm", "tpm", "log2_fc", "p_value", "z_score",
+        "treatment_name", "treatment_type", "treatment_amount", "treatment_duration",
+        "version", "public", "owner", "user_read", "user_write", "date_inserted",
+        "date_modified", "_version_",
+    ),
+}
+
+# Fields whose values repeat across the records of a result set (same genome,
+# experiment or vocabulary term); their strings are interned so that every
+# record shares one copy
+SHARED_VALUE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "genome": (
+        "superkingdom", "kingdom", "phylum", "class", "order", "family", "genus", "species",
+        "genome_status", "sequencing_status", "sequencing_platform", "assembly_method",
+        "genome_quality", "isolation_country", "host_name", "host_common_name", "host_group",
+        "owner",
+    ),
+    "genome_feature": (
+        "genome_id", "genome_name", "accession", "sequence_id", "annotation", "feature_type",
+        "product", "gene", "owner",
+    ),
+    "genome_amr": (
+        "genome_id", "genome_name", "antibiotic", "resistant_phenotype", "measurement_sign",
+        "measurement_unit", "laboratory_typing_method", "laboratory_typing_platform", "vendor",
+        "testing_standard", "computational_method", "evidence", "source", "owner",
+    ),
+    "bioset_result": (
+        "bioset_id", "bioset_name", "bioset_description", "bioset_type", "exp_id", "exp_name",
+        "exp_title", "exp_type", "entity_type", "result_type", "genome_id", "organism", "strain",
+        "treatment_name", "treatment_type", "owner",
+    ),
+}
+
+_record_classes: Dict[Tuple[str, Tuple[str, ...]], type] = {}
+_record_classes_lock = threading.Lock()
+
+
+class _Unset:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+
+# Value of a field missing from a record
+UNSET = msgspec.UNSET if msgspec is not None else _Unset()
+
+
+class Record:
+    """
+    Mapping interface shared by every typed record class.
+
+    Fields missing from the document are unset and absent from the mapping,
+    so a record compares and serializes exactly like its document.
+    """
+
+    __slots__ = ()
+
+    # Field names in schema order, the attribute holding each field and the
+    # attributes of the shared value fields
+    _fields: Tuple[str, ...] = ()
+    _attrs: Dict[str, str] = {}
+    _shared: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, self._attrs[key], UNSET)
+        if value is UNSET:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        attrs = self._attrs
+        return (field for field in self._fields if getattr(self, attrs[field], UNSET) is not UNSET)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        attr = self._attrs.get(key)
+        return attr is not None and getattr(self, attr, UNSET) is not UNSET
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._attrs.get(key)
+        value = UNSET if attr is None else getattr(self, attr, UNSET)
+        return default if value is UNSET else value
+
+    def keys(self) -> List[str]:
+        return list(self)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self.to_dict().items())
+
+    def values(self) -> List[Any]:
+        return list(self.to_dict().values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the document the record was decoded from."""
+        doc = {}
+        for field in self._fields:
+            value = getattr(self, self._attrs[field], UNSET)
+            if value is not UNSET:
+                doc[field] = value
+        return doc
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+Mapping.register(Record)
+
+_RESERVED_ATTRS = frozenset(dir(Record))
+
+
+def _attr_name(field: str) -> str:
+    attr = re.sub(r"\W", "_", field)
+    if not attr or attr[0].isdigit() or keyword.iskeyword(attr) or attr in _RESERVED_ATTRS:
+        attr += "_"
+    return attr
+
+
+def _class_name(core: str) -> str:
+    return "".join(part.capitalize() for part in core.split("_")) + "Record"
+
+
+def _make_record_class(core: str, fields: Tuple[str, ...]) -> type:
+    attrs = {}
+    for field in fields:
+        attr = _attr_name(field)
+        while attr in attrs.values():
+            attr += "_"
+        attrs[field] = attr
+
+    if msgspec is not None:
+        # gc=False: records only reference decoded JSON values, never cycles
+        cls = msgspec.defstruct(
+            _class_name(core),
+            [(attrs[field], Any, msgspec.field(default=UNSET, name=field)) for field in fields],
+            bases=(Record,),
+            omit_defaults=True,
+            forbid_unknown_fields=True,
+            gc=False,
+        )
+    else:
+        cls = type(_class_name(core), (Record,), {"__slots__": tuple(attrs.values())})
+    cls._fields = fields
+    cls._attrs = attrs
+    shared = SHARED_VALUE_FIELDS.get(core, ())
+    cls._shared = tuple(attrs[field] for field in fields if field in shared)
+    return cls
+
+
+def _share_values(records: List[Any], cls: type) -> List[Any]:
+    intern = sys.intern
+    for record in records:
+        if type(record) is cls:
+            for attr in cls._shared:
+                value = getattr(record, attr, UNSET)
+                if type(value) is str:
+                    setattr(record, attr, intern(value))
+    return records
+
+
+def record_class(core: str, fields: Sequence[str] = None) -> Optional[type]:
+    """
+    Return the record class of a core, or of a field selection.
+
+    Args:
+        core: The core/collection name
+        fields: Selected fields (optional, the core's field schema otherwise)
+
+    Returns:
+        Record class, or None when no fields are selected and the core has no
+        field schema
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    fields = tuple(dict.fromkeys(fields)) if fields else RECORD_SCHEMAS.get(core)
+    if not fields:
+        return None
+    key = (core, fields)
+    cls = _record_classes.get(key)
+    if cls is None:
+        with _record_classes_lock:
+            cls = _record_classes.get(key)
+            if cls is None:
+                cls = _record_classes[key] = _make_record_class(core, fields)
+    return cls
+
+
+def record_converter(core: str, fields: Sequence[str] = None) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Return a function converting one decoded document into a typed record.
+
+    Args:
+        core: The core/collection name
+        fields: Selected fields (optional, the core's field schema otherwise)
+
+    Returns:
+        Function returning the record, or the document itself when it has a
+        field outside the schema (or the core has no schema)
+    """
+    cls = record_class(core, fields)
+    if cls is None:
+        return lambda doc: doc
+
+    if msgspec is not None:
+        def convert(doc: Dict[str, Any]) -> Any:
+            try:
+                return _share_values([msgspec.convert(doc, cls)], cls)[0]
+            except msgspec.ValidationError:
+                return doc
+        return convert
+
+    attrs = cls._attrs
+    shared = frozenset(cls._shared)
+    intern = sys.intern
+
+    def convert(doc: Dict[str, Any]) -> Any:
+        record = cls.__new__(cls)
+        try:
+            for field, value in doc.items():
+                attr = attrs[field]
+                if attr in shared and type(value) is str:
+                    value = intern(value)
+                setattr(record, attr, value)
+        except KeyError:
+            return doc
+        return record
+    return convert
+
+
+def to_records(core: str, docs: List[Dict[str, Any]], fields: Sequence[str] = None) -> List[Any]:
+    """
+    Convert decoded documents into typed records.
+
+    Args:
+        core: The core/collection name
+        docs: Decoded documents
+        fields: Selected fields (optional, the core's field schema otherwise)
+
+    Returns:
+        List of records (documents outside the schema stay dictionaries)
+    """
+    convert = record_converter(core, fields)
+    return [convert(doc) for doc in docs]
+
+
+def decode_records(core: str, data: bytes, fields: Sequence[str] = None) -> List[Any]:
+    """
+    Decode a raw JSON docs array into typed records.
+
+    Args:
+        core: The core/collection name
+        data: Raw JSON docs array (e.g., from raw_query)
+        fields: Selected fields (optional, the core's field schema otherwise)
+
+    Returns:
+        List of records (documents outside the schema stay dictionaries)
+    """
+    cls = record_class(core, fields)
+    if msgspec is not None and cls is not None:
+        try:
+            return _share_values(msgspec.json.decode(data, type=List[cls]), cls)
+        except msgspec.ValidationError:
+            # Some document has a field outside the schema: convert one by one
+            pass
+    return to_records(core, json.loads(data), fields)
+
+
+def record_json_default(obj: Any) -> Any:
+    """
+    json.dumps default hook serializing typed records as their documents.
+
+    Args:
+        obj: Object json cannot serialize natively
+
+    Returns:
+        The record's document
+    """
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,152 @@
+"""
+BV-BRC Sample Functions
+
+This module draws reproducible random samples of the records matching a
+query, for exploring cores too large to scan. When the core schema has a
+random sort field (a random_* dynamic field), Solr orders the matches by a
+seeded random key and the first n are a uniform sample, fetched in one
+request. Otherwise the matches, in unique key order, are split into up to
+100 shards of equal size and a small page is fetched from each at a seeded
+random offset: an approximate sample, spread over the whole result set.
+"""
+
+import concurrent.futures
+import json
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from .cassette_functions import get_cassette_mode
+from .common_functions import _post_solr, _solr_sort, count_query, solr_docs_bytes
+from .record_functions import decode_records
+from .schema_functions import get_field_schema, validate_query
+
+# Largest sample returned by one call
+MAX_SAMPLE_SIZE = 10000
+
+# Shards (one page fetch each) of the offset sampling fallback; samples of
+# at most this many records are single records at random offsets
+_SAMPLE_SHARDS = 100
+
+# Page fetches of the offset sampling fallback run concurrently
+_SAMPLE_WORKERS = 8
+
+RANDOM_SORT = "random_sort"
+SHARD_OFFSETS = "shard_offsets"
+
+
+def sample_method(core: str, seed: int, base_url: str = None) -> str:
+    """
+    Return how a core is sampled.
+
+    Args:
+        core: The core/collection name
+        seed: Sample seed
+        base_url: Optional base URL override
+
+    Returns:
+        RANDOM_SORT when the core schema has a random sort field, SHARD_OFFSETS
+        otherwise
+    """
+    schema = get_field_schema(core, base_url)
+    return RANDOM_SORT if schema is not None and f"random_{seed}" in schema else SHARD_OFFSETS
+
+
+def _fetch_page(core: str, params: Dict[str, Any], base_url: str,
+                headers: Dict[str, str]) -> Tuple[bytes, int]:
+    return solr_docs_bytes(_post_solr(core, params, base_url, headers).content)
+
+
+def _shard_pages(num_found: int, n: int, seed: int) -> List[Tuple[int, int]]:
+    # (start, rows) of one page per shard, at a seeded random offset in each shard
+    rng = random.Random(seed)
+    shards = min(_SAMPLE_SHARDS, n)
+    pages = []
+    for shard in range(shards):
+        low = num_found * shard // shards
+        high = num_found * (shard + 1) // shards
+        rows = n * (shard + 1) // shards - n * shard // shards
+        start = low + rng.randrange(max(high - low - rows, 0) + 1)
+        pages.append((start, min(rows, high - start)))
+    return pages
+
+
+def _join_docs(arrays: List[bytes]) -> bytes:
+    # Concatenate raw JSON docs arrays into one array
+    items = [array.strip()[1:-1].strip() for array in arrays]
+    return b"[" + b",".join(item for item in items if item) + b"]"
+
+
+def sample_query(core: str, q_expr: str = "*:*", n: int = 100, seed: int = 0,
+                 options: Dict[str, Any] = None, base_url: str = None,
+                 headers: Dict[str, str] = None) -> Tuple[Any, int, Dict[str, Any]]:
+    """
+    Draw a reproducible random sample of the records matching a query.
+
+    Args:
+        core: The core/collection name (e.g., "genome_feature")
+        q_expr: Solr query expression
+        n: Sample size (at most MAX_SAMPLE_SIZE)
+        seed: Seed of the sample; the same seed draws the same sample while
+            the core is unchanged
+        options: Optional query options (select, raw, typed)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Tuple of (sampled records, count of records sampled, sample info).
+        The info holds the method (RANDOM_SORT or SHARD_OFFSETS) and total,
+        the count of records matching the query. With the "raw" option the
+        records are the undecoded JSON docs array (bytes).
+
+    Raises:
+        ValueError: If n is out of range or cassettes are being replayed
+        UnknownFieldError: If the query or select names an unknown field
+    """
+    options = options or {}
+    if not 0 < n <= MAX_SAMPLE_SIZE:
+        raise ValueError(f"Sample size must be between 1 and {MAX_SAMPLE_SIZE}")
+    if get_cassette_mode():
+        raise ValueError("Sampling queries Solr directly and is not available with cassettes")
+    validate_query(core, q_expr, options, base_url)
+
+    params: Dict[str, Any] = {"q": q_expr}
+    fields: Optional[List[str]] = options.get("select")
+    if fields:
+        params["fl"] = fields if isinstance(fields, str) else ",".join(fields)
+
+    method = sample_method(core, seed, base_url)
+    total = None
+    if method == RANDOM_SORT:
+        # Uniform: the first n matches in seeded random order
+        pages = [(0, n, {"sort": _solr_sort(f"random_{seed}")})]
+    else:
+        # Approximate: small pages at random offsets of the matches in unique
+        # key order, which does not depend on the index layout
+        schema = get_field_schema(core, base_url)
+        extra = {"sort": f"{schema.unique_key} asc"} if schema is not None and schema.unique_key else {}
+        total = count_query(core, q_expr, base_url, headers)
+        if total <= n:
+            pages = [(0, total, extra)] if total else []
+        else:
+            pages = [(start, rows, extra) for start, rows in _shard_pages(total, n, seed)]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(_SAMPLE_WORKERS, len(pages) or 1)) as executor:
+        fetched = list(executor.map(_fetch_page, [core] * len(pages),
+                                    [dict(params, start=start, rows=rows, **extra) for start, rows, extra in pages],
+                                    [base_url] * len(pages), [headers] * len(pages)))
+
+    arrays = []
+    count = 0
+    for (start, rows, _), (page, num_found) in zip(pages, fetched):
+        arrays.append(page)
+        # Solr returns the rows of the page that fall before numFound
+        count += min(rows, max(num_found - start, 0))
+        if total is None:
+            total = num_found
+
+    info = {"method": method, "total": total or 0}
+    docs = _join_docs(arrays)
+    if options.get("raw"):
+        return docs, count, info
+    records = decode_records(core, docs, fields) if options.get("typed") else json.loads(docs)
+    return records, len(records), info
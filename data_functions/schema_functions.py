@@ -0,0 +1,258 @@
+"""
+BV-BRC Schema Functions
+
+This module fetches the field schema of each core from the upstream Solr
+schema API on first use and caches it in memory and in the shared cache, so
+that the fields named by a query (select, sort and the fields of the query
+expression, which includes filters) are checked locally before anything is
+sent upstream. An unknown field is rejected at once with the closest field
+names as suggestions. When a schema cannot be fetched the query is sent
+unchecked, so validation never blocks a query the upstream would accept.
+"""
+
+import difflib
+import fnmatch
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .cassette_functions import get_cassette_mode
+from .shared_cache_functions import get_shared_cache, response_cache_key
+
+# Module level configuration (overridable via configure_schema_validation)
+_enabled = os.getenv("BVBRC_SCHEMA_VALIDATION", "1") != "0"
+_schema_ttl = float(os.getenv("BVBRC_SCHEMA_TTL", "86400"))
+
+# A failed schema fetch is retried after this many seconds
+_FAILURE_TTL = 60.0
+
+# {(core, base_url): (expires, FieldSchema or None)}
+_schemas: Dict[Tuple[str, Optional[str]], Tuple[float, Optional["FieldSchema"]]] = {}
+_schemas_lock = threading.Lock()
+
+# Names that are valid in select/sort without being schema fields
+_PSEUDO_FIELDS = frozenset(("*", "score", "_query_", "_val_"))
+
+# field: in a query expression, outside quoted strings (not escaped, not inside a
+# word or a value)
+_QUOTED = re.compile(r'"(?:\\.|[^"\\])*"')
+_QUERY_FIELD = re.compile(r"(?<![\w.\\*?:])([A-Za-z_][\w.]*)\s*:")
+
+_SUGGESTIONS = 3
+
+
+class FieldSchema:
+    """Field names, dynamic field patterns and unique key of a core."""
+
+    def __init__(self, fields: Iterable[str], dynamic_fields: Iterable[str] = (), unique_key: str = None):
+        self.fields: FrozenSet[str] = frozenset(fields)
+        self.dynamic_fields: Tuple[str, ...] = tuple(dynamic_fields)
+        self.unique_key = unique_key
+
+    def __contains__(self, name: str) -> bool:
+        if name in self.fields or name in _PSEUDO_FIELDS:
+            return True
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.dynamic_fields)
+
+    def matches(self, pattern: str) -> bool:
+        """Return whether a field glob (e.g., "genome_*" in select) names any field."""
+        return pattern in self or any(fnmatch.fnmatchcase(field, pattern) for field in self.fields)
+
+    def suggest(self, name: str) -> List[str]:
+        """Return the field names closest to an unknown name."""
+        return difflib.get_close_matches(name, sorted(self.fields), n=_SUGGESTIONS, cutoff=0.6)
+
+
+class UnknownFieldError(ValueError):
+    """Raised when a query names fields that the core does not have."""
+
+    def __init__(self, core: str, unknown: Dict[str, List[str]], where: str):
+        self.core = core
+        self.unknown = unknown
+        self.where = where
+        super().__init__(f"Unknown field(s) in {where} for {core}: {', '.join(unknown)}")
+
+    def payload(self) -> Dict[str, Any]:
+        """Return the JSON payload describing the rejected query."""
+        return {
+            "error": str(self),
+            "core": self.core,
+            "unknown_fields": list(self.unknown),
+            "suggestions": self.unknown,
+        }
+
+
+def configure_schema_validation(enabled: bool = None, ttl: float = None) -> None:
+    """
+    Configure local validation of query fields.
+
+    Args:
+        enabled: Check query fields against the core schemas (optional)
+        ttl: Seconds a fetched schema stays cached (optional)
+    """
+    global _enabled, _schema_ttl
+    if enabled is not None:
+        _enabled = bool(enabled)
+    if ttl is not None:
+        _schema_ttl = float(ttl)
+    with _schemas_lock:
+        _schemas.clear()
+
+
+def fetch_field_schema(core: str, base_url: str = None) -> FieldSchema:
+    """
+    Fetch the field schema of a core from the upstream Solr schema API.
+
+    Args:
+        core: The core/collection name
+        base_url: Optional base URL override
+
+    Returns:
+        FieldSchema of the core
+    """
+    # Imported here: common_functions imports this module
+    from .common_functions import DEFAULT_BASE_URL, get_http_client
+
+    url = f"{(base_url or DEFAULT_BASE_URL).rstrip('/')}/{core}/schema"
+    response = get_http_client().get(url, headers={"Accept": "application/solr+json"})
+    response.raise_for_status()
+    schema = response.json()
+    schema = schema.get("schema", schema)
+    fields = [field["name"] for field in schema.get("fields", [])]
+    if not fields:
+        raise ValueError(f"Schema of {core} lists no fields")
+    return FieldSchema(fields, [field["name"] for field in schema.get("dynamicFields", [])],
+                       schema.get("uniqueKey"))
+
+
+def get_field_schema(core: str, base_url: str = None) -> Optional[FieldSchema]:
+    """
+    Return the cached field schema of a core, fetching it on first use.
+
+    Args:
+        core: The core/collection name
+        base_url: Optional base URL override
+
+    Returns:
+        FieldSchema, or None when the schema is unavailable (cassette replay,
+        or the fetch failed)
+    """
+    if get_cassette_mode() == "replay":
+        return None
+    key = (core, base_url)
+    entry = _schemas.get(key)
+    if entry is not None and entry[0] > time.time():
+        return entry[1]
+
+    cache = get_shared_cache()
+    cache_key = response_cache_key(core, {"schema": True}, base_url)
+    stored = cache.get(cache_key) if cache is not None else None
+    if stored is not None:
+        schema = FieldSchema(stored["fields"], stored["dynamic_fields"], stored.get("unique_key"))
+        ttl = _schema_ttl
+    else:
+        try:
+            schema = fetch_field_schema(core, base_url)
+            ttl = _schema_ttl
+            if cache is not None:
+                cache.set(cache_key, {"fields": sorted(schema.fields),
+                                      "dynamic_fields": list(schema.dynamic_fields),
+                                      "unique_key": schema.unique_key}, ttl, "schema")
+        except Exception as e:
+            print(f"Warning: schema of {core} unavailable, fields not checked: {e}", file=sys.stderr)
+            schema, ttl = None, _FAILURE_TTL
+
+    with _schemas_lock:
+        _schemas[key] = (time.time() + ttl, schema)
+    return schema
+
+
+def query_fields(q_expr: str) -> List[str]:
+    """
+    Extract the field names of a Solr query expression.
+
+    Args:
+        q_expr: Solr query expression (e.g., '(genus:"Escherichia") AND (taxon_id:562)')
+
+    Returns:
+        Field names in order of first appearance
+    """
+    return list(dict.fromkeys(_QUERY_FIELD.findall(_QUOTED.sub('""', q_expr or ""))))
+
+
+def sort_fields(sort: str) -> List[str]:
+    """
+    Extract the field names of a sort option ("-field", "field desc", "a,b").
+
+    Args:
+        sort: Sort option
+
+    Returns:
+        Field names
+    """
+    fields = []
+    for clause in sort.split(","):
+        name = clause.strip().split(" ")[0].lstrip("+-")
+        if name:
+            fields.append(name)
+    return fields
+
+
+def unknown_fields(core: str, fields: Iterable[str], globs: bool = False,
+                   base_url: str = None) -> Dict[str, List[str]]:
+    """
+    Find the field names that are not in the schema of a core.
+
+    Args:
+        core: The core/collection name
+        fields: Field names
+        globs: Accept globs naming at least one field (e.g., "genome_*" in select)
+        base_url: Optional base URL override
+
+    Returns:
+        Dictionary of unknown field to its closest field names (empty when
+        every field is known or the schema is unavailable)
+    """
+    fields = list(fields)
+    schema = get_field_schema(core, base_url) if fields else None
+    if schema is None:
+        return {}
+    check = schema.matches if globs else schema.__contains__
+    return {field: schema.suggest(field) for field in fields if not check(field)}
+
+
+def validate_query(core: str, q_expr: str, options: Dict[str, Any] = None, base_url: str = None) -> None:
+    """
+    Check the fields of a query expression and of its select and sort options.
+
+    Args:
+        core: The core/collection name
+        q_expr: Solr query expression
+        options: Optional query options (select, sort)
+        base_url: Optional base URL override
+
+    Raises:
+        UnknownFieldError: If the query names fields the core does not have
+    """
+    if not _enabled:
+        return
+    options = options or {}
+    unknown: Dict[str, List[str]] = {}
+    where = []
+    select = options.get("select")
+    if select:
+        fields = select.split(",") if isinstance(select, str) else select
+        # [transformers] are not fields
+        fields = [field.strip() for field in fields if field.strip() and not field.strip().startswith("[")]
+        found = unknown_fields(core, fields, True, base_url)
+        unknown.update(found)
+        where += ["select"] if found else []
+    for part, fields in (("sort", sort_fields(options.get("sort") or "")), ("query", query_fields(q_expr))):
+        found = unknown_fields(core, fields, False, base_url)
+        unknown.update(found)
+        where += [part] if found else []
+    if unknown:
+        raise UnknownFieldError(core, unknown, " and ".join(where))
@@ -0,0 +1,379 @@
+"""
+BV-BRC Sequence Store Functions
+
+This module keeps a local content-addressed store of sequences keyed by
+their MD5, so that a sequence shared by thousands of genomes or features is
+downloaded once. The store is an append-only blob of zlib-compressed
+sequences, read through a memory map, and an index of fixed-width entries
+(MD5 digest, offset, length) loaded into memory. Sequences are only stored
+when their MD5 matches the key, and entries appended by other processes are
+picked up on a miss.
+
+Queries by sequence MD5 (sequence_md5_query) fetch the matching records
+without their sequence field and fill it in from the store, fetching it
+upstream once on a miss; fetch_sequences() resolves many MD5s at once,
+deduplicated, with one upstream request per batch of misses; a sequence
+being fetched by another thread is waited for rather than fetched again.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from .common_functions import _solr_page, stream_query
+from .schema_functions import get_field_schema
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# MD5 and sequence fields of the cores holding sequences
+SEQUENCE_FIELDS = {
+    "genome_sequence": ("sequence_md5", "sequence"),
+    "protein_feature": ("aa_sequence_md5", "sequence"),
+    "sequence_feature": ("aa_sequence_md5", "source_aa_sequence"),
+    "feature_sequence": ("md5", "sequence"),
+}
+
+# Module level configuration (overridable via configure_sequence_store); the
+# store is off unless a directory is given
+_store_path = os.getenv("BVBRC_SEQUENCE_STORE", "")
+_store_max_bytes = int(float(os.getenv("BVBRC_SEQUENCE_STORE_MAX_MB", "1024")) * 1024 * 1024)
+
+_store: Optional["SequenceStore"] = None
+_store_lock = threading.Lock()
+
+# Index entry: MD5 digest, blob offset, compressed length
+_ENTRY = struct.Struct(">16sQI")
+
+_MD5 = re.compile(r"^[0-9a-fA-F]{32}$")
+
+# MD5s resolved per upstream request by fetch_sequences
+_FETCH_BATCH = 100
+
+# MD5s being fetched upstream, and the events set once they are stored
+_pending: Dict[str, threading.Event] = {}
+_pending_lock = threading.Lock()
+
+# Key order of full records per (core, base URL), learned from one record
+_key_orders: Dict[Tuple[str, str], List[str]] = {}
+
+
+class SequenceStore:
+    """Append-only store of compressed sequences addressed by their MD5."""
+
+    def __init__(self, directory: str, max_bytes: int = _store_max_bytes):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, Tuple[int, int]] = {}
+        self._index_read = 0
+        self._blob = open(os.path.join(directory, "sequences.bin"), "a+b")
+        self._index_file = open(os.path.join(directory, "sequences.idx"), "a+b")
+        self._map: Optional[mmap.mmap] = None
+        self._refresh()
+
+    def _refresh(self) -> None:
+        # Load index entries appended since the last refresh (by any process)
+        blob_size = os.fstat(self._blob.fileno()).st_size
+        self._index_file.seek(self._index_read)
+        data = self._index_file.read()
+        whole = len(data) - len(data) % _ENTRY.size
+        for digest, offset, length in _ENTRY.iter_unpack(data[:whole]):
+            # Entries are written after their data, so a valid entry is always in the blob
+            if offset + length <= blob_size:
+                self._index[digest] = (offset, length)
+        self._index_read += whole
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._map is None or offset + length > len(self._map):
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._blob.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    def get(self, md5: str) -> Optional[str]:
+        """
+        Return the sequence with an MD5, or None when it is not stored.
+
+        Args:
+            md5: Hexadecimal MD5 of the sequence
+        """
+        if not _MD5.match(md5):
+            return None
+        digest = bytes.fromhex(md5)
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is None:
+                self._refresh()
+                entry = self._index.get(digest)
+                if entry is None:
+                    return None
+            data = self._read(*entry)
+        return zlib.decompress(data).decode("ascii")
+
+    def put(self, md5: str, sequence: str) -> bool:
+        """
+        Store a sequence under its MD5.
+
+        Args:
+            md5: Hexadecimal MD5 of the sequence
+            sequence: The sequence
+
+        Returns:
+            True if the sequence is stored (now or already); False if the MD5
+            does not match it (in any letter case) or the store is full
+        """
+        if not _MD5.match(md5) or not sequence:
+            return False
+        data = sequence.encode("ascii")
+        md5 = md5.lower()
+        if md5 not in (hashlib.md5(data).hexdigest(), hashlib.md5(data.upper()).hexdigest(),
+                       hashlib.md5(data.lower()).hexdigest()):
+            return False
+        digest = bytes.fromhex(md5)
+        compressed = zlib.compress(data, 6)
+        with self._lock:
+            if digest in self._index:
+                return True
+            if fcntl is not None:
+                fcntl.flock(self._index_file.fileno(), fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                if digest in self._index:
+                    return True
+                self._blob.seek(0, os.SEEK_END)
+                offset = self._blob.tell()
+                if offset + len(compressed) > self.max_bytes:
+                    return False
+                self._blob.write(compressed)
+                self._blob.flush()
+                self._index_file.write(_ENTRY.pack(digest, offset, len(compressed)))
+                self._index_file.flush()
+                self._index[digest] = (offset, len(compressed))
+                self._index_read += _ENTRY.size
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._index_file.fileno(), fcntl.LOCK_UN)
+        return True
+
+    def __contains__(self, md5: str) -> bool:
+        return _MD5.match(md5) is not None and bytes.fromhex(md5) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of sequences and the size of the store."""
+        return {
+            "path": self.directory,
+            "sequences": len(self._index),
+            "bytes": os.fstat(self._blob.fileno()).st_size,
+        }
+
+
+def is_sequence_md5_field(core: str, field: str) -> bool:
+    """Return whether a field of a core is the MD5 of its sequence field."""
+    return core in SEQUENCE_FIELDS and SEQUENCE_FIELDS[core][0] == field
+
+
+def configure_sequence_store(path: str = None, max_mb: float = None) -> None:
+    """
+    Configure the local sequence store.
+
+    Args:
+        path: Directory of the store, or "" to disable it (optional)
+        max_mb: Size past which no more sequences are stored, in MB (optional)
+    """
+    global _store_path, _store_max_bytes, _store
+    with _store_lock:
+        if path is not None:
+            _store_path = path
+        if max_mb is not None:
+            _store_max_bytes = int(float(max_mb) * 1024 * 1024)
+        _store = None
+
+
+def get_sequence_store() -> Optional[SequenceStore]:
+    """Return the sequence store, or None when it is disabled."""
+    global _store
+    if not _store_path:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SequenceStore(_store_path, _store_max_bytes)
+    return _store
+
+
+def fetch_sequence(core: str, md5: str, base_url: str = None,
+                   headers: Dict[str, str] = None) -> Optional[str]:
+    """
+    Return the sequence with an MD5, from the store or else from one upstream record.
+
+    Args:
+        core: A core of SEQUENCE_FIELDS (e.g., "protein_feature")
+        md5: Hexadecimal MD5 of the sequence
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        The sequence, or None if no record of the core has it
+    """
+    return fetch_sequences(core, [md5], base_url, headers).get(md5)
+
+
+def _fetch_batch(core: str, md5s: List[str], base_url: str,
+                 headers: Dict[str, str]) -> Dict[str, str]:
+    # One record per MD5 (Solr collapse), or one request per MD5 if collapsing is unsupported
+    md5_field, sequence_field = SEQUENCE_FIELDS[core]
+    params = {"fl": f"{md5_field},{sequence_field}"}
+    try:
+        response = _solr_page(core, dict(params, q=f"{md5_field}:({' OR '.join(md5s)})", rows=len(md5s),
+                                         fq=f"{{!collapse field={md5_field}}}"), base_url, headers)
+        docs = response.get("response", {}).get("docs", [])
+    except httpx.HTTPStatusError as e:
+        print(f"Warning: collapsed sequence fetch failed for {core}: {e}", file=sys.stderr)
+        docs = []
+        for md5 in md5s:
+            response = _solr_page(core, dict(params, q=f'{md5_field}:"{md5}"', rows=1), base_url, headers)
+            docs.extend(response.get("response", {}).get("docs", []))
+    return {doc[md5_field]: doc[sequence_field] for doc in docs if doc.get(md5_field) and doc.get(sequence_field)}
+
+
+def fetch_sequences(core: str, md5s: Iterable[str], base_url: str = None,
+                    headers: Dict[str, str] = None) -> Dict[str, str]:
+    """
+    Resolve sequences by MD5, downloading each distinct missing sequence once.
+
+    Args:
+        core: A core of SEQUENCE_FIELDS (e.g., "feature_sequence")
+        md5s: Hexadecimal MD5s (duplicates are fetched once)
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Dictionary of MD5 to sequence; MD5s no record has are left out
+
+    Raises:
+        ValueError: If the core has no sequence MD5 field
+    """
+    if core not in SEQUENCE_FIELDS:
+        raise ValueError(f"No sequence MD5 field is known for {core}")
+    store = get_sequence_store()
+    sequences: Dict[str, str] = {}
+    missing = []
+    for md5 in dict.fromkeys(md5s):
+        if not md5 or not _MD5.match(md5):
+            continue
+        sequence = store.get(md5) if store is not None else None
+        if sequence is None:
+            missing.append(md5)
+        else:
+            sequences[md5] = sequence
+    if store is None:
+        for start in range(0, len(missing), _FETCH_BATCH):
+            sequences.update(_fetch_batch(core, missing[start:start + _FETCH_BATCH], base_url, headers))
+        return sequences
+
+    # A sequence already being fetched by another thread is waited for, not fetched again
+    claimed, waiting = [], []
+    with _pending_lock:
+        for md5 in missing:
+            event = _pending.get(md5)
+            if event is None:
+                _pending[md5] = threading.Event()
+                claimed.append(md5)
+            else:
+                waiting.append((md5, event))
+    try:
+        for start in range(0, len(claimed), _FETCH_BATCH):
+            for md5, sequence in _fetch_batch(core, claimed[start:start + _FETCH_BATCH], base_url, headers).items():
+                sequences[md5] = sequence
+                store.put(md5, sequence)
+    finally:
+        with _pending_lock:
+            for md5 in claimed:
+                _pending.pop(md5).set()
+    retry = []
+    for md5, event in waiting:
+        event.wait()
+        sequence = store.get(md5)
+        if sequence is None:
+            retry.append(md5)
+        else:
+            sequences[md5] = sequence
+    for start in range(0, len(retry), _FETCH_BATCH):
+        sequences.update(_fetch_batch(core, retry[start:start + _FETCH_BATCH], base_url, headers))
+    return sequences
+
+
+def _record_key_order(core: str, q_expr: str, base_url: str,
+                      headers: Dict[str, str]) -> Optional[List[str]]:
+    # Field order of the upstream records of a core, from one full record
+    key = (core, base_url or "")
+    if key not in _key_orders:
+        response = _solr_page(core, {"q": q_expr, "rows": 1}, base_url, headers)
+        docs = response.get("response", {}).get("docs", [])
+        if not docs:
+            return None
+        _key_orders[key] = list(docs[0])
+    return _key_orders[key]
+
+
+def sequence_md5_query(core: str, md5: str, options: Dict[str, Any] = None, base_url: str = None,
+                       headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Query the records of a core by sequence MD5, with the sequence from the store.
+
+    The records are fetched without their sequence field, which is filled in
+    from the local store (or fetched once from upstream and stored), so a
+    sequence shared by many records is never downloaded per record. The
+    filled field keeps its position among the fields of upstream records.
+
+    Args:
+        core: A core of SEQUENCE_FIELDS
+        md5: Hexadecimal MD5 of the sequence
+        options: Optional query options, as for stream_query
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Tuple of (list of records, count of results), as stream_query
+    """
+    md5_field, sequence_field = SEQUENCE_FIELDS[core]
+    q_expr = f'{md5_field}:"{md5}"'
+    options = dict(options or {})
+    fields = options.get("select")
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    # Typed records and summaries keep the plain path, as does a select without the sequence
+    plain = (get_sequence_store() is None or not _MD5.match(md5) or options.get("typed")
+             or options.get("summarize") or options.get("fill")
+             or (fields and (sequence_field not in fields or any("*" in field or "?" in field for field in fields))))
+    if not plain and not fields:
+        schema = get_field_schema(core, base_url)
+        if schema is None:
+            plain = True
+        else:
+            fields = sorted(schema.fields)
+    if plain:
+        return stream_query(core, q_expr, options, base_url, headers)
+
+    sequence = fetch_sequence(core, md5, base_url, headers)
+    if sequence is None:
+        return stream_query(core, q_expr, options, base_url, headers)
+    options["select"] = [field for field in fields if field != sequence_field]
+    options["fill"] = {sequence_field: sequence}
+    options["fill_order"] = _record_key_order(core, q_expr, base_url, headers)
+    return stream_query(core, q_expr, options, base_url, headers)
@@ -0,0 +1,256 @@
+"""
+BV-BRC Shared Cache Functions
+
+This module provides a response cache shared by every server process on the
+host. Entries live in a SQLite database in WAL mode (read through a memory
+map), so the worker processes of a multi-worker http_server see each other's
+results. Reference cores (*_ref), whose data rarely changes, are cached with a
+longer time-to-live than the other cores.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from .record_functions import record_json_default
+
+# Module level configuration (overridable via configure_shared_cache)
+_cache_path = os.getenv("BVBRC_CACHE_PATH", "")
+_cache_ttl = float(os.getenv("BVBRC_CACHE_TTL", "300"))
+_reference_ttl = float(os.getenv("BVBRC_REFERENCE_CACHE_TTL", "86400"))
+_max_entry_bytes = int(os.getenv("BVBRC_CACHE_MAX_ENTRY_BYTES", str(16 * 1024 * 1024)))
+
+_cache: Optional["SharedCache"] = None
+_cache_lock = threading.Lock()
+
+# Expired entries are purged once every this many writes
+_PURGE_INTERVAL = 200
+
+
+class SharedCache:
+    """Key/value cache in a SQLite file shared between processes."""
+
+    def __init__(self, path: str, max_entry_bytes: int = _max_entry_bytes):
+        self.path = path
+        self.max_entry_bytes = max_entry_bytes
+        self._local = threading.local()
+        self._writes = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, "
+            "expires REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None when missing or expired
+        """
+        data = self.get_bytes(key)
+        return None if data is None else json.loads(data)
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Look up a cached value stored as bytes.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored bytes, or None when missing or expired
+        """
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, value: Any, ttl: float, namespace: str = "response") -> bool:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value (typed records are stored as documents)
+            ttl: Time-to-live in seconds
+            namespace: Entry namespace (e.g., "response" or "reference")
+
+        Returns:
+            True if stored, False if the encoded value exceeds the entry size limit
+        """
+        data = json.dumps(value, default=record_json_default).encode("utf-8")
+        return self.set_bytes(key, data, ttl, namespace)
+
+    def set_bytes(self, key: str, data: bytes, ttl: float, namespace: str = "response") -> bool:
+        """
+        Store bytes as they are (e.g., an undecoded upstream response).
+
+        Args:
+            key: Cache key
+            data: Bytes to store
+            ttl: Time-to-live in seconds
+            namespace: Entry namespace (e.g., "response" or "reference")
+
+        Returns:
+            True if stored, False if the compressed bytes exceed the entry size limit
+        """
+        blob = zlib.compress(data, 1)
+        if len(blob) > self.max_entry_bytes:
+            return False
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, namespace, expires, value) VALUES (?, ?, ?, ?)",
+            (key, namespace, time.time() + ttl, blob)
+        )
+        self._writes += 1
+        if self._writes % _PURGE_INTERVAL == 0:
+            self.purge_expired()
+        return True
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        cursor = self._connection().execute("DELETE FROM cache WHERE expires <= ?", (time.time(),))
+        return cursor.rowcount
+
+    def clear(self, namespace: str = None) -> None:
+        """Delete every entry, or every entry of one namespace."""
+        if namespace is None:
+            self._connection().execute("DELETE FROM cache")
+        else:
+            self._connection().execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the entry count and stored bytes per namespace."""
+        rows = self._connection().execute(
+            "SELECT namespace, COUNT(*), SUM(LENGTH(value)) FROM cache "
+            "WHERE expires > ? GROUP BY namespace", (time.time(),)
+        ).fetchall()
+        return {namespace: {"entries": count, "bytes": size} for namespace, count, size in rows}
+
+
+def configure_shared_cache(path: str = None, ttl: float = None, reference_ttl: float = None,
+                           max_entry_bytes: int = None) -> None:
+    """
+    Configure the shared response cache.
+
+    Args:
+        path: SQLite file holding the cache, or "" to disable it (optional)
+        ttl: Time-to-live of cached responses in seconds (optional)
+        reference_ttl: Time-to-live of cached reference core responses in seconds (optional)
+        max_entry_bytes: Largest compressed response that is cached (optional)
+    """
+    global _cache_path, _cache_ttl, _reference_ttl, _max_entry_bytes, _cache
+    with _cache_lock:
+        if path is not None:
+            _cache_path = path
+        if ttl is not None:
+            _cache_ttl = float(ttl)
+        if reference_ttl is not None:
+            _reference_ttl = float(reference_ttl)
+        if max_entry_bytes is not None:
+            _max_entry_bytes = int(max_entry_bytes)
+        _cache = None
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """Return the shared cache, or None when it is disabled."""
+    global _cache
+    if not _cache_path:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SharedCache(_cache_path, _max_entry_bytes)
+    return _cache
+
+
+def shared_cache_entry_limit() -> int:
+    """Return the largest entry the shared cache stores, in bytes (0 when it is disabled)."""
+    return _max_entry_bytes if _cache_path else 0
+
+
+def response_cache_key(core: str, request: Dict[str, Any], base_url: str = None) -> str:
+    """
+    Compute the cache key of an upstream request.
+
+    Args:
+        core: The core/collection name
+        request: Request parameters
+        base_url: Base URL the request is sent to
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = json.dumps({"core": core, "base_url": base_url, **request}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_response(core: str, request: Dict[str, Any], base_url: str = None,
+                    raw: bool = False) -> Optional[Any]:
+    """
+    Look up a cached upstream response.
+
+    Args:
+        core: The core/collection name
+        request: Request parameters
+        base_url: Base URL the request is sent to
+        raw: Look up an undecoded (bytes) response
+
+    Returns:
+        Cached response, or None on a miss or when the cache is disabled
+    """
+    cache = get_shared_cache()
+    if cache is None:
+        return None
+    if raw:
+        return cache.get_bytes(response_cache_key(core, dict(request, raw=True), base_url))
+    return cache.get(response_cache_key(core, request, base_url))
+
+
+def cache_response(core: str, request: Dict[str, Any], response: Any, base_url: str = None,
+                   raw: bool = False) -> None:
+    """
+    Store an upstream response in the shared cache (no-op when disabled).
+
+    Args:
+        core: The core/collection name
+        request: Request parameters
+        response: JSON-serializable response, or bytes when raw
+        base_url: Base URL the request is sent to
+        raw: Store an undecoded (bytes) response as it is
+    """
+    cache = get_shared_cache()
+    if cache is None:
+        return
+    ttl, namespace = (_reference_ttl, "reference") if core.endswith("_ref") else (_cache_ttl, "response")
+    if raw:
+        cache.set_bytes(response_cache_key(core, dict(request, raw=True), base_url), response, ttl, namespace)
+    else:
+        cache.set(response_cache_key(core, request, base_url), response, ttl, namespace)
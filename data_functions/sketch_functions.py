@@ -0,0 +1,254 @@
+"""
+BV-BRC Sketch Functions
+
+This module summarizes result sets too large to hold, in bounded memory, as
+the records stream past: HyperLogLog distinct counts, t-digest quantiles of
+numeric fields and the most frequent values of each field (Misra-Gries).
+stream_query() feeds the records of a query to a StreamSummary when given
+the "summarize" option and returns only the summary.
+"""
+
+import hashlib
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Quantiles reported by default
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+# HyperLogLog precision: 2^14 registers (16 KB per field, ~0.8% standard error)
+_HLL_PRECISION = 14
+
+# t-digest compression (more centroids, more accurate tails)
+_TDIGEST_COMPRESSION = 200
+
+# Counters kept per field for the most frequent values
+_TOP_CAPACITY = 1000
+
+
+class HyperLogLog:
+    """Approximate distinct count of hashable values in fixed memory."""
+
+    def __init__(self, precision: int = _HLL_PRECISION):
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, value: Any) -> None:
+        digest = hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+        h = int.from_bytes(digest, "big")
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self) -> int:
+        """Return the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small cardinalities: linear counting is more accurate
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class TDigest:
+    """Approximate quantiles of a numeric stream (merging t-digest)."""
+
+    def __init__(self, compression: float = _TDIGEST_COMPRESSION):
+        self.compression = compression
+        self.centroids: List[Tuple[float, float]] = []
+        self.buffer: List[float] = []
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.buffer.append(value)
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self.buffer) >= self.compression * 10:
+            self._merge()
+
+    def _k_limit(self, q: float) -> float:
+        # Quantile up to which a centroid starting at q may grow (k1 scale function)
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _merge(self) -> None:
+        if not self.buffer:
+            return
+        points = sorted(self.centroids + [(value, 1.0) for value in self.buffer])
+        self.buffer = []
+        weight = sum(w for _, w in points)
+        merged = []
+        mean, w = points[0]
+        cumulative = 0.0
+        limit = self._k_limit(0.0) * weight
+        for point_mean, point_weight in points[1:]:
+            if cumulative + w + point_weight <= limit:
+                w += point_weight
+                mean += (point_mean - mean) * point_weight / w
+            else:
+                merged.append((mean, w))
+                cumulative += w
+                limit = self._k_limit(cumulative / weight) * weight
+                mean, w = point_mean, point_weight
+        merged.append((mean, w))
+        self.centroids = merged
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the estimated value at quantile q (0 to 1)."""
+        self._merge()
+        if not self.centroids:
+            return None
+        if len(self.centroids) == 1:
+            return self.centroids[0][0]
+        target = q * self.count
+        # Interpolate between centroid centers (and the extremes)
+        previous_mean, previous_center = self.min, 0.0
+        cumulative = 0.0
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                if center == previous_center:
+                    return mean
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_mean, previous_center = mean, center
+            cumulative += weight
+        if cumulative == previous_center:
+            return self.max
+        fraction = (target - previous_center) / (cumulative - previous_center)
+        return previous_mean + fraction * (self.max - previous_mean)
+
+
+class TopValues:
+    """Most frequent values of a stream (Misra-Gries), exact while few values are distinct."""
+
+    def __init__(self, capacity: int = _TOP_CAPACITY):
+        self.capacity = capacity
+        self.counts: Dict[Any, int] = {}
+        self.exact = True
+
+    def add(self, value: Any) -> None:
+        counts = self.counts
+        if value in counts:
+            counts[value] += 1
+        elif len(counts) < self.capacity:
+            counts[value] = 1
+        else:
+            # Decrement every counter; counts become lower bounds
+            self.exact = False
+            for key in list(counts):
+                if counts[key] == 1:
+                    del counts[key]
+                else:
+                    counts[key] -= 1
+
+    def top(self, n: int) -> List[Tuple[Any, int]]:
+        """Return the n most frequent values and their counts."""
+        return sorted(self.counts.items(), key=lambda item: (-item[1], str(item[0])))[:n]
+
+
+class FieldSummary:
+    """Sketches of the values of one field."""
+
+    def __init__(self):
+        self.values = 0
+        self.missing = 0
+        self.distinct = HyperLogLog()
+        self.top = TopValues()
+        self.numeric: Optional[TDigest] = None
+
+    def add(self, value: Any) -> None:
+        if value is None:
+            self.missing += 1
+            return
+        # Multi-valued fields count each of their values
+        for item in value if isinstance(value, list) else (value,):
+            self.values += 1
+            self.distinct.add(item)
+            # Measurements (floats) rarely repeat: they get quantiles, not top values
+            if not isinstance(item, float):
+                self.top.add(item)
+            if isinstance(item, (int, float)) and not isinstance(item, bool):
+                if self.numeric is None:
+                    self.numeric = TDigest()
+                self.numeric.add(item)
+
+    def result(self, top: int, quantiles: Sequence[float]) -> Dict[str, Any]:
+        result = {
+            "values": self.values,
+            "missing": self.missing,
+            "distinct": self.distinct.count() if self.values else 0,
+        }
+        if self.top.counts:
+            result["top"] = [{"value": value, "count": count} for value, count in self.top.top(top)]
+            result["top_exact"] = self.top.exact
+        digest = self.numeric
+        if digest is not None:
+            result["min"] = digest.min
+            result["max"] = digest.max
+            result["mean"] = digest.total / digest.count
+            result["quantiles"] = {f"p{q * 100:g}": digest.quantile(q) for q in quantiles}
+        return result
+
+
+class StreamSummary:
+    """Sketches of the fields of a record stream."""
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = {field: FieldSummary() for field in fields}
+        self.count = 0
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        self.count += 1
+        for field, summary in self.fields.items():
+            summary.add(doc.get(field))
+
+    def result(self, top: int = 10, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """
+        Return the summary of the records seen so far.
+
+        Args:
+            top: Number of most frequent values per field
+            quantiles: Quantiles of numeric fields (0 to 1)
+
+        Returns:
+            Dictionary with the record count and, per field, the value and
+            missing counts, distinct count, most frequent values, and min,
+            max, mean and quantiles of numeric values
+        """
+        return {
+            "records": self.count,
+            "fields": {field: summary.result(top, quantiles) for field, summary in self.fields.items()},
+        }
+
+
+def summarize_records(docs: Iterable[Dict[str, Any]], fields: Sequence[str], top: int = 10,
+                      quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+    """
+    Summarize the fields of a record stream.
+
+    Args:
+        docs: Records
+        fields: Fields to summarize
+        top: Number of most frequent values per field
+        quantiles: Quantiles of numeric fields (0 to 1)
+
+    Returns:
+        Summary (see StreamSummary.result)
+    """
+    summary = StreamSummary(fields)
+    for doc in docs:
+        summary.add(doc)
+    return summary.result(top, quantiles)
@@ -0,0 +1,407 @@
+"""
+BV-BRC Spill Functions
+
+This module bounds the memory used by materialized query results. Every
+streaming query accounts the estimated size of the records it collects
+against a per-call budget and a global budget shared by all concurrent calls.
+When a result set would exceed either budget, the records collected so far
+and the rest of the stream are written to an NDJSON spill file instead, and
+the query returns a SpilledResults handle holding only the first page; later
+pages are read back from disk with read_spill_page(). Records kept in memory
+hold their reservation of the global budget until query_result_json has
+serialized them, or until they are garbage collected.
+"""
+
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .record_functions import Record, record_json_default
+
+# Module level configuration (overridable via configure_memory_budget)
+_call_budget = int(float(os.getenv("BVBRC_CALL_MEMORY_BUDGET_MB", "512")) * 1024 * 1024)
+_global_budget = int(float(os.getenv("BVBRC_MEMORY_BUDGET_MB", "2048")) * 1024 * 1024)
+_spill_dir = os.getenv("BVBRC_SPILL_DIR", "") or os.path.join(tempfile.gettempdir(), "bvbrc-spill")
+_spill_ttl = float(os.getenv("BVBRC_SPILL_TTL", "3600"))
+_page_size = int(os.getenv("BVBRC_SPILL_PAGE_SIZE", "100"))
+
+# Bytes currently reserved by in-flight calls
+_reserved = 0
+_reserved_lock = threading.Lock()
+
+# Record sizes are measured on the first records and then on a sample
+_EXACT_SAMPLES = 32
+_SAMPLE_EVERY = 64
+
+# One byte offset is indexed every this many spilled records
+_INDEX_INTERVAL = 1000
+
+
+def configure_memory_budget(call_mb: float = None, global_mb: float = None, spill_dir: str = None,
+                            spill_ttl: float = None, page_size: int = None) -> None:
+    """
+    Configure the result memory budgets and the spill directory.
+
+    Args:
+        call_mb: Largest result a single call may hold in memory, in MB (optional)
+        global_mb: Largest total of results held by all calls, in MB (optional)
+        spill_dir: Directory for spill files (optional)
+        spill_ttl: Seconds before an unreleased spill file is deleted (optional)
+        page_size: Records returned inline with a spilled result (optional)
+    """
+    global _call_budget, _global_budget, _spill_dir, _spill_ttl, _page_size
+    if call_mb is not None:
+        _call_budget = int(float(call_mb) * 1024 * 1024)
+    if global_mb is not None:
+        _global_budget = int(float(global_mb) * 1024 * 1024)
+    if spill_dir is not None:
+        _spill_dir = spill_dir
+    if spill_ttl is not None:
+        _spill_ttl = float(spill_ttl)
+    if page_size is not None:
+        _page_size = int(page_size)
+
+
+def reserved_bytes() -> int:
+    """Return the result bytes currently held by in-flight calls."""
+    return _reserved
+
+
+def _json_default(obj: Any) -> Any:
+    # Typed records are written as their documents, anything else as a string
+    return obj.to_dict() if isinstance(obj, Record) else str(obj)
+
+
+class ResultAccumulator:
+    """Tracks the estimated size of one call's records against the budgets."""
+
+    def __init__(self):
+        self.records = 0
+        self.bytes = 0
+        self._reserved = 0
+        self._sampled_bytes = 0
+        self._samples = 0
+
+    def add(self, doc: Dict[str, Any]) -> bool:
+        """
+        Account one more record.
+
+        Args:
+            doc: Record added to the result
+
+        Returns:
+            False when the record does not fit in the per-call or global budget
+        """
+        global _reserved
+        if self.records < _EXACT_SAMPLES or self.records % _SAMPLE_EVERY == 0:
+            self._sampled_bytes += len(json.dumps(doc, default=_json_default))
+            self._samples += 1
+        self.records += 1
+        size = self._sampled_bytes // self._samples
+        self.bytes += size
+
+        if self.bytes > _call_budget:
+            return False
+        with _reserved_lock:
+            if _reserved + size > _global_budget:
+                return False
+            _reserved += size
+        self._reserved += size
+        return True
+
+    def reserve(self, size: int) -> bool:
+        """
+        Account a result of known size, such as an undecoded docs array.
+
+        Args:
+            size: Size of the result in bytes
+
+        Returns:
+            False when the result does not fit in the per-call or global budget
+        """
+        global _reserved
+        if self.bytes + size > _call_budget:
+            return False
+        with _reserved_lock:
+            if _reserved + size > _global_budget:
+                return False
+            _reserved += size
+        self._reserved += size
+        self.bytes += size
+        return True
+
+    def release(self) -> None:
+        """Return this call's reservation to the global budget."""
+        global _reserved
+        with _reserved_lock:
+            _reserved -= self._reserved
+        self._reserved = 0
+
+    def hold(self, results: List[Any]) -> List[Any]:
+        """
+        Tie this call's reservation to the records it accounted.
+
+        Args:
+            results: The records, as a list or list subclass, or raw JSON bytes
+
+        Returns:
+            The records, as a list (or bytes) subclass whose release() returns
+            the reservation; it is also returned when they are garbage collected
+        """
+        if isinstance(results, bytes):
+            results = HeldBytes(results)
+            results.release = self.release
+            return results
+        if type(results) is list:
+            results = HeldResults(results)
+        results.release = weakref.finalize(results, self.release)
+        return results
+
+
+class HeldResults(list):
+    """Records collected in memory, holding their reservation of the global budget (see ResultAccumulator.hold)."""
+
+
+class HeldBytes(bytes):
+    """
+    Undecoded docs array holding its reservation of the global budget (see
+    ResultAccumulator.hold). Bytes take no weak references, so the
+    reservation is returned when the object is deleted.
+    """
+
+    def __del__(self):
+        self.release()
+
+
+class SpilledResults(list):
+    """
+    First page of a result set that was spilled to disk.
+
+    The list holds the first page of records; the whole result set is in the
+    NDJSON spill file identified by handle.
+    """
+
+    def __init__(self, page: List[Dict[str, Any]], handle: str, path: str, count: int,
+                 size: int, fields: List[str]):
+        super().__init__(page)
+        self.handle = handle
+        self.path = path
+        self.count = count
+        self.bytes = size
+        self.fields = fields
+
+    # Set by mark_partial when the query ran out of its time budget
+    partial = False
+    continuation: Optional[str] = None
+    total: Optional[int] = None
+
+    def mark_partial(self, continuation: Optional[str], total: Optional[int]) -> None:
+        """Mark the spilled records as the partial result of a query (see PartialResults)."""
+        self.partial = True
+        self.continuation = continuation
+        self.total = total
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the handle and shape of the spilled result set."""
+        return {
+            "handle": self.handle,
+            "count": self.count,
+            "returned": len(self),
+            "bytes": self.bytes,
+            "fields": self.fields,
+        }
+
+
+def _spill_path(handle: str) -> str:
+    if not handle or not all(c in "0123456789abcdef" for c in handle):
+        raise ValueError(f"Invalid spill handle: {handle}")
+    return os.path.join(_spill_dir, f"{handle}.ndjson")
+
+
+def purge_spills(max_age: float = None) -> int:
+    """
+    Delete spill files older than the spill TTL.
+
+    Args:
+        max_age: Age in seconds (optional, the configured spill TTL otherwise)
+
+    Returns:
+        Number of spill files deleted
+    """
+    cutoff = time.time() - (_spill_ttl if max_age is None else max_age)
+    removed = 0
+    for path in glob.glob(os.path.join(_spill_dir, "*.ndjson")):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+                if os.path.exists(f"{path}.idx"):
+                    os.remove(f"{path}.idx")
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+def spill_results(collected: List[Dict[str, Any]], remaining: Iterable[Dict[str, Any]]) -> SpilledResults:
+    """
+    Write a result set to an NDJSON spill file.
+
+    Args:
+        collected: Records already collected in memory (consumed and cleared)
+        remaining: Iterator over the rest of the stream
+
+    Returns:
+        SpilledResults holding the first page and the spill handle
+    """
+    os.makedirs(_spill_dir, exist_ok=True)
+    purge_spills()
+
+    handle = uuid.uuid4().hex
+    path = _spill_path(handle)
+    page: List[Dict[str, Any]] = []
+    fields: Dict[str, None] = {}
+    index = []
+    count = 0
+
+    try:
+        with open(path, "w") as f:
+            def write(doc: Dict[str, Any]) -> None:
+                nonlocal count
+                if count % _INDEX_INTERVAL == 0:
+                    index.append(f.tell())
+                if count < _page_size:
+                    page.append(doc)
+                    fields.update(dict.fromkeys(doc))
+                f.write(json.dumps(doc, default=_json_default))
+                f.write("\n")
+                count += 1
+
+            for doc in collected:
+                write(doc)
+            collected.clear()
+            for doc in remaining:
+                write(doc)
+            size = f.tell()
+    except BaseException:
+        # A failed or cancelled stream leaves no partial spill behind
+        os.remove(path)
+        raise
+
+    with open(f"{path}.idx", "w") as f:
+        json.dump({"count": count, "interval": _INDEX_INTERVAL, "offsets": index}, f)
+    return SpilledResults(page, handle, path, count, size, list(fields))
+
+
+def read_spill_page(handle: str, offset: int = 0, limit: int = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Read a page of records from a spill file.
+
+    Args:
+        handle: Spill handle returned with a spilled result
+        offset: Index of the first record to return
+        limit: Maximum number of records (optional, the spill page size otherwise)
+
+    Returns:
+        Tuple of (list of records, total count of spilled records)
+    """
+    path = _spill_path(handle)
+    limit = _page_size if limit is None else limit
+    try:
+        with open(f"{path}.idx", "r") as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        raise LookupError(f"Spill handle {handle} not found or expired")
+
+    records = []
+    if 0 <= offset < index["count"] and limit > 0:
+        checkpoint = offset // index["interval"]
+        with open(path, "r") as f:
+            f.seek(index["offsets"][checkpoint])
+            for _ in range(offset - checkpoint * index["interval"]):
+                f.readline()
+            for line in f:
+                records.append(json.loads(line))
+                if len(records) >= limit:
+                    break
+    return records, index["count"]
+
+
+def release_spill(handle: str) -> bool:
+    """
+    Delete a spill file.
+
+    Args:
+        handle: Spill handle
+
+    Returns:
+        True if the spill file existed
+    """
+    path = _spill_path(handle)
+    existed = os.path.exists(path)
+    for name in (path, f"{path}.idx"):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+    return existed
+
+
+def query_result_payload(results: List[Dict[str, Any]], count: int,
+                         extra: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Build the JSON payload of a query tool result.
+
+    Args:
+        results: Records returned by a query function
+        count: Count of results
+        extra: Optional fields added to the envelope after count
+
+    Returns:
+        Dictionary with count and results, plus the spill summary (handle,
+        returned, bytes, fields) when the result set was spilled to disk, and
+        partial, continuation and total when the query ran out of its time
+        budget
+    """
+    payload = {"count": count, **(extra or {}), "results": results}
+    if isinstance(results, SpilledResults):
+        payload["spilled"] = results.summary()
+    if getattr(results, "partial", False):
+        payload["partial"] = True
+        payload["continuation"] = results.continuation
+        if results.total is not None:
+            payload["total"] = results.total
+    return payload
+
+
+def query_result_json(results: Any, count: int, extra: Dict[str, Any] = None) -> str:
+    """
+    Serialize a query tool result.
+
+    Raw results (the undecoded upstream docs array returned by raw_query) are
+    spliced into the envelope as they are; other results are encoded from
+    query_result_payload.
+
+    Args:
+        results: Records returned by a query function, or raw JSON bytes
+        count: Count of results
+        extra: Optional fields added to the envelope after count
+
+    Returns:
+        JSON string with count and results (and the spill summary)
+    """
+    release = getattr(results, "release", None)
+    try:
+        if isinstance(results, bytes):
+            fields = "".join(f'  {json.dumps(key)}: {json.dumps(value)},\n' for key, value in (extra or {}).items())
+            return f'{{\n  "count": {count},\n{fields}  "results": {results.decode("utf-8")}\n}}'
+        return json.dumps(query_result_payload(results, count, extra), indent=2, default=record_json_default)
+    finally:
+        # The records are serialized: return their memory reservation
+        if release is not None:
+            release()
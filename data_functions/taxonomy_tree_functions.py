@@ -0,0 +1,639 @@
+"""
+BV-BRC Taxonomy Tree Functions
+
+This module keeps the whole NCBI taxonomy of BV-BRC in memory as a compact
+array-backed tree, built once from the taxonomy core and persisted to disk.
+Taxa are numbered in depth-first preorder, so the descendants of a taxon are
+the contiguous range of positions before the end of its subtree (its
+Euler-tour interval). Ancestor checks compare two intervals in O(1),
+descendants are enumerated by slicing, and lineages and lowest common
+ancestors climb the parent pointers, a few dozen steps at most.
+
+It also expands taxon_id queries to the whole subtree of a taxon: through
+the taxon_lineage_ids field where the core has one, and otherwise through
+the cached set of descendant taxa, matched by one terms query.
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .common_functions import DEFAULT_BASE_URL, _cursor_walk, stream_query
+from .progress_functions import current_progress, track_progress
+from .schema_functions import get_field_schema
+
+CORE = "taxonomy"
+
+_FORMAT_VERSION = 1
+_PAGE_SIZE = 10000
+
+# Module level configuration (overridable via configure_taxonomy_tree)
+_tree_path = os.getenv("BVBRC_TAXONOMY_TREE", os.path.join(tempfile.gettempdir(), "bvbrc-taxonomy-tree.bin"))
+_tree_max_age = float(os.getenv("BVBRC_TAXONOMY_TREE_MAX_AGE", "604800"))
+
+# Endpoint whose tree is persisted to _tree_path; other endpoints get a
+# file of their own next to it
+_tree_base_url = DEFAULT_BASE_URL.rstrip("/")
+
+# Trees per endpoint, and the events of the loads and rebuilds in progress
+_trees: Dict[str, "TaxonomyTree"] = {}
+_building: Dict[str, threading.Event] = {}
+_tree_lock = threading.Lock()
+
+# Field listing the taxon IDs of the whole lineage of a record
+LINEAGE_FIELD = "taxon_lineage_ids"
+
+# Module level configuration (overridable via configure_taxon_expansion)
+_expansion_max = int(os.getenv("BVBRC_TAXON_EXPANSION_MAX", "20000"))
+_descendants_ttl = float(os.getenv("BVBRC_TAXON_DESCENDANTS_TTL", "3600"))
+
+_descendant_sets: "OrderedDict[Tuple[int, Optional[str]], Tuple[float, array]]" = OrderedDict()
+_descendant_sets_lock = threading.Lock()
+_MAX_DESCENDANT_SETS = 64
+
+# Arrays persisted, in file order
+_ARRAYS = ("taxon_ids", "parents", "ends", "depths", "ranks", "name_offsets", "sorted_ids", "sorted_positions")
+
+
+class TaxonomyTree:
+    """
+    Taxonomy tree in depth-first preorder.
+
+    Position i holds taxon_ids[i], the position of its parent (-1 for a
+    root), the end of its subtree (its descendants are the positions
+    i + 1 .. ends[i] - 1), its depth, the index of its rank in rank_names
+    and its name. sorted_ids and sorted_positions map a taxon ID back to
+    its position by binary search.
+    """
+
+    def __init__(self, arrays: Dict[str, array], rank_names: List[str], names: bytes, built: float):
+        for name in _ARRAYS:
+            setattr(self, name, arrays[name])
+        self.rank_names = rank_names
+        self.names = names
+        self.built = built
+
+    def __len__(self) -> int:
+        return len(self.taxon_ids)
+
+    def __contains__(self, taxon_id: int) -> bool:
+        return self.position(taxon_id) is not None
+
+    def position(self, taxon_id: int) -> Optional[int]:
+        """Return the preorder position of a taxon, or None if it is unknown."""
+        i = bisect.bisect_left(self.sorted_ids, taxon_id)
+        if i < len(self.sorted_ids) and self.sorted_ids[i] == taxon_id:
+            return self.sorted_positions[i]
+        return None
+
+    def _position(self, taxon_id: int) -> int:
+        position = self.position(int(taxon_id))
+        if position is None:
+            raise ValueError(f"Unknown taxon_id {taxon_id}")
+        return position
+
+    def node(self, position: int) -> Dict[str, Any]:
+        """Return the taxon_id, name, rank and depth of the taxon at a position."""
+        return {
+            "taxon_id": self.taxon_ids[position],
+            "taxon_name": self.names[self.name_offsets[position]:self.name_offsets[position + 1]].decode("utf-8"),
+            "taxon_rank": self.rank_names[self.ranks[position]],
+            "depth": self.depths[position],
+        }
+
+    def is_ancestor(self, ancestor_id: int, taxon_id: int) -> bool:
+        """Return whether ancestor_id is taxon_id or one of its ancestors."""
+        ancestor, position = self._position(ancestor_id), self._position(taxon_id)
+        return ancestor <= position < self.ends[ancestor]
+
+    def lineage(self, taxon_id: int) -> List[int]:
+        """Return the positions from the root down to a taxon."""
+        position = self._position(taxon_id)
+        path = []
+        while position >= 0:
+            path.append(position)
+            position = self.parents[position]
+        path.reverse()
+        return path
+
+    def descendants(self, taxon_id: int, include_self: bool = False) -> range:
+        """Return the positions of the descendants of a taxon, in preorder."""
+        position = self._position(taxon_id)
+        return range(position if include_self else position + 1, self.ends[position])
+
+    def descendant_ids(self, taxon_id: int, include_self: bool = True) -> array:
+        """Return the taxon IDs of the descendants of a taxon, in preorder."""
+        positions = self.descendants(taxon_id, include_self)
+        return self.taxon_ids[positions.start:positions.stop]
+
+    def lca(self, taxon_ids: Iterable[int]) -> Optional[int]:
+        """Return the position of the lowest common ancestor of taxa, or None in a forest."""
+        positions = [self._position(taxon_id) for taxon_id in taxon_ids]
+        if not positions:
+            raise ValueError("Give at least one taxon_id")
+        # Every taxon lies within the interval of the smallest and largest positions
+        low, high = min(positions), max(positions)
+        ancestor = positions[0]
+        while ancestor >= 0 and not (ancestor <= low and high < self.ends[ancestor]):
+            ancestor = self.parents[ancestor]
+        return ancestor if ancestor >= 0 else None
+
+
+def _build_tree(docs: Iterable[Dict[str, Any]]) -> TaxonomyTree:
+    # Gather the taxa, then number them in depth-first preorder
+    ids, parent_ids, names, ranks = array("q"), array("q"), [], []
+    rank_index: Dict[str, int] = {}
+    for doc in docs:
+        taxon_id = doc.get("taxon_id")
+        if taxon_id is None:
+            continue
+        parent_id = doc.get("parent_id")
+        ids.append(int(taxon_id))
+        parent_ids.append(-1 if parent_id is None else int(parent_id))
+        names.append((doc.get("taxon_name") or "").encode("utf-8"))
+        ranks.append(rank_index.setdefault(doc.get("taxon_rank") or "no rank", len(rank_index)))
+    count = len(ids)
+    index = {taxon_id: i for i, taxon_id in enumerate(ids)}
+    parent = [-1] * count
+    for i in range(count):
+        p = index.get(parent_ids[i], -1)
+        # The root of NCBI taxonomy is its own parent
+        parent[i] = -1 if p == i else p
+    del index
+
+    # Children in CSR form, each list in the (taxon_id) order of the input
+    child_start = [0] * (count + 1)
+    for p in parent:
+        if p >= 0:
+            child_start[p + 1] += 1
+    for i in range(count):
+        child_start[i + 1] += child_start[i]
+    children = [0] * child_start[count]
+    fill = child_start[:count]
+    for i, p in enumerate(parent):
+        if p >= 0:
+            children[fill[p]] = i
+            fill[p] += 1
+    del fill
+
+    order = array("l")
+    stack = [i for i in reversed(range(count)) if parent[i] < 0]
+    while stack:
+        i = stack.pop()
+        order.append(i)
+        stack.extend(reversed(children[child_start[i]:child_start[i + 1]]))
+    # Taxa in a parent cycle are unreachable from any root and left out
+    count = len(order)
+    position = [-1] * len(ids)
+    for k, i in enumerate(order):
+        position[i] = k
+
+    taxon_ids, parents, ends = array("q"), array("l"), array("l", range(1, count + 1))
+    depths, rank_codes, name_offsets = array("H"), array("H"), array("Q", [0])
+    for k, i in enumerate(order):
+        taxon_ids.append(ids[i])
+        p = position[parent[i]] if parent[i] >= 0 else -1
+        parents.append(p)
+        depths.append(depths[p] + 1 if p >= 0 else 0)
+        rank_codes.append(ranks[i])
+        name_offsets.append(name_offsets[-1] + len(names[i]))
+    for k in reversed(range(count)):
+        p = parents[k]
+        if p >= 0 and ends[k] > ends[p]:
+            ends[p] = ends[k]
+    sorted_positions = array("l", sorted(range(count), key=taxon_ids.__getitem__))
+    sorted_ids = array("q", (taxon_ids[k] for k in sorted_positions))
+    arrays = {
+        "taxon_ids": taxon_ids,
+        "parents": parents,
+        "ends": ends,
+        "depths": depths,
+        "ranks": rank_codes,
+        "name_offsets": name_offsets,
+        "sorted_ids": sorted_ids,
+        "sorted_positions": sorted_positions,
+    }
+    return TaxonomyTree(arrays, list(rank_index), b"".join(names[i] for i in order), time.time())
+
+
+def save_taxonomy_tree(tree: TaxonomyTree, path: str) -> None:
+    """
+    Write a taxonomy tree to a file: a JSON header line, then the raw arrays
+    and the names.
+
+    Args:
+        tree: The tree to write
+        path: File path, replaced atomically
+    """
+    header = {
+        "version": _FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "built": tree.built,
+        "rank_names": tree.rank_names,
+        "arrays": [[name, getattr(tree, name).typecode, len(getattr(tree, name))] for name in _ARRAYS],
+        "names": len(tree.names),
+    }
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".taxonomy-tree-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            for name in _ARRAYS:
+                getattr(tree, name).tofile(f)
+            f.write(tree.names)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_taxonomy_tree(path: str) -> Optional[TaxonomyTree]:
+    """
+    Read a taxonomy tree written by save_taxonomy_tree.
+
+    Args:
+        path: File path
+
+    Returns:
+        TaxonomyTree, or None if the file is missing or of another format
+    """
+    try:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != _FORMAT_VERSION or header.get("byteorder") != sys.byteorder:
+                return None
+            arrays = {}
+            for name, typecode, length in header["arrays"]:
+                values = array(typecode)
+                values.fromfile(f, length)
+                arrays[name] = values
+            names = f.read(header["names"])
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    if len(names) != header["names"] or set(arrays) != set(_ARRAYS):
+        return None
+    return TaxonomyTree(arrays, header["rank_names"], names, header["built"])
+
+
+def build_taxonomy_tree(base_url: str = None, headers: Dict[str, str] = None) -> TaxonomyTree:
+    """
+    Build the taxonomy tree from every taxon of the taxonomy core.
+
+    Args:
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        TaxonomyTree of all taxa reachable from a root
+    """
+    params = {
+        "q": "*:*",
+        "fl": "taxon_id,parent_id,taxon_name,taxon_rank",
+        "rows": _PAGE_SIZE,
+        "sort": "taxon_id asc",
+    }
+    docs = _cursor_walk(CORE, params, {"cursor": "*"}, None, base_url, headers)
+    progress = current_progress()
+    if progress is not None:
+        docs = track_progress(docs, _PAGE_SIZE, CORE, progress)
+    return _build_tree(docs)
+
+
+def configure_taxonomy_tree(path: str = None, max_age: float = None, preload: bool = False,
+                            base_url: str = None) -> None:
+    """
+    Configure the taxonomy tree.
+
+    Args:
+        path: File the tree is persisted to ("" keeps it in memory only) (optional)
+        max_age: Seconds before a persisted tree is rebuilt from upstream (optional)
+        preload: Load or build the tree now, in a background thread
+        base_url: Base URL whose tree is persisted to path, and preloaded
+            (optional)
+    """
+    global _tree_path, _tree_max_age, _tree_base_url
+    with _tree_lock:
+        if path is not None:
+            _tree_path = path
+        if max_age is not None:
+            _tree_max_age = float(max_age)
+        if base_url:
+            _tree_base_url = base_url.rstrip("/")
+        _trees.clear()
+    if preload:
+        threading.Thread(target=_preload, args=(base_url,), name="taxonomy-tree", daemon=True).start()
+
+
+def _preload(base_url: str = None) -> None:
+    try:
+        get_taxonomy_tree(base_url)
+    except Exception as e:
+        print(f"Warning: taxonomy tree preload failed: {e}", file=sys.stderr)
+
+
+def _tree_key(base_url: Optional[str]) -> str:
+    return (base_url or DEFAULT_BASE_URL).rstrip("/")
+
+
+def _tree_file(key: str) -> str:
+    # Persisted tree of an endpoint ("" when trees are kept in memory only)
+    if not _tree_path or key == _tree_base_url:
+        return _tree_path
+    root, extension = os.path.splitext(_tree_path)
+    return f"{root}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]}{extension}"
+
+
+def _is_fresh(tree: TaxonomyTree) -> bool:
+    return time.time() - tree.built < _tree_max_age
+
+
+def _finish_build(key: str, event: threading.Event) -> None:
+    with _tree_lock:
+        if _building.get(key) is event:
+            del _building[key]
+    event.set()
+
+
+def _rebuild_tree(key: str, base_url: Optional[str], event: threading.Event) -> TaxonomyTree:
+    # Build the tree of an endpoint from upstream, persist it and publish it
+    try:
+        tree = build_taxonomy_tree(base_url)
+        path = _tree_file(key)
+        if path:
+            save_taxonomy_tree(tree, path)
+        with _tree_lock:
+            _trees[key] = tree
+        return tree
+    finally:
+        _finish_build(key, event)
+
+
+def _refresh_tree(key: str, base_url: Optional[str], event: threading.Event) -> None:
+    try:
+        _rebuild_tree(key, base_url, event)
+    except Exception as e:
+        print(f"Warning: taxonomy tree refresh failed: {e}", file=sys.stderr)
+
+
+def get_taxonomy_tree(base_url: str = None) -> TaxonomyTree:
+    """
+    Return the taxonomy tree of an endpoint, loading or building it on first use.
+
+    The persisted tree is used while younger than the configured max age.
+    An older tree keeps being served while a background thread rebuilds it
+    from upstream and persists it again; only a caller finding no tree at all
+    waits for the build, and concurrent callers share one build.
+
+    Args:
+        base_url: Optional base URL override; each endpoint has its own tree
+
+    Returns:
+        TaxonomyTree of all taxa
+    """
+    key = _tree_key(base_url)
+    while True:
+        with _tree_lock:
+            tree = _trees.get(key)
+            if tree is not None and _is_fresh(tree):
+                return tree
+            event = _building.get(key)
+            if event is None:
+                event = _building[key] = threading.Event()
+                break
+        # Another caller is loading or rebuilding the tree
+        if tree is not None:
+            return tree
+        event.wait()
+
+    if tree is None:
+        path = _tree_file(key)
+        try:
+            tree = load_taxonomy_tree(path) if path else None
+        except BaseException:
+            _finish_build(key, event)
+            raise
+        if tree is None:
+            return _rebuild_tree(key, base_url, event)
+        with _tree_lock:
+            _trees[key] = tree
+    if _is_fresh(tree):
+        _finish_build(key, event)
+    else:
+        threading.Thread(target=_refresh_tree, args=(key, base_url, event),
+                         name="taxonomy-tree", daemon=True).start()
+    return tree
+
+
+def taxonomy_lineage(taxon_id: int, base_url: str = None) -> List[Dict[str, Any]]:
+    """
+    Get the lineage of a taxon from the taxonomy tree.
+
+    Args:
+        taxon_id: Taxon ID (e.g., 1773)
+        base_url: Optional base URL override
+
+    Returns:
+        List of taxa (taxon_id, taxon_name, taxon_rank, depth) from the root
+        down to the taxon itself
+
+    Raises:
+        ValueError: If the taxon is unknown
+    """
+    tree = get_taxonomy_tree(base_url)
+    return [tree.node(position) for position in tree.lineage(taxon_id)]
+
+
+def taxonomy_descendants(taxon_id: int, rank: str = None, limit: int = None, offset: int = 0,
+                         base_url: str = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Get the descendants of a taxon from the taxonomy tree.
+
+    Args:
+        taxon_id: Taxon ID (e.g., 1763)
+        rank: Only descendants of this rank, e.g. "species" (optional)
+        limit: Most descendants returned (optional, all)
+        offset: Descendants skipped before the first returned (default 0)
+        base_url: Optional base URL override
+
+    Returns:
+        Tuple of (list of taxa in depth-first order, count of descendants
+        matching the rank)
+
+    Raises:
+        ValueError: If the taxon is unknown
+    """
+    tree = get_taxonomy_tree(base_url)
+    positions = tree.descendants(taxon_id)
+    if rank is not None:
+        code = tree.rank_names.index(rank) if rank in tree.rank_names else -1
+        ranks = tree.ranks
+        positions = [position for position in positions if ranks[position] == code]
+    stop = len(positions) if limit is None else offset + limit
+    return [tree.node(position) for position in positions[offset:stop]], len(positions)
+
+
+def taxonomy_lca(taxon_ids: List[int], base_url: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Get the lowest common ancestor of taxa from the taxonomy tree.
+
+    Args:
+        taxon_ids: Taxon IDs
+        base_url: Optional base URL override
+
+    Returns:
+        The lowest common ancestor (taxon_id, taxon_name, taxon_rank,
+        depth), or None when the taxa share no root
+
+    Raises:
+        ValueError: If a taxon is unknown or none is given
+    """
+    tree = get_taxonomy_tree(base_url)
+    ancestor = tree.lca(taxon_ids)
+    return tree.node(ancestor) if ancestor is not None else None
+
+
+def taxonomy_is_ancestor(ancestor_id: int, taxon_ids: List[int], base_url: str = None) -> Dict[int, bool]:
+    """
+    Check whether a taxon is an ancestor of other taxa, from the taxonomy tree.
+
+    Args:
+        ancestor_id: Taxon ID of the candidate ancestor
+        taxon_ids: Taxon IDs checked
+        base_url: Optional base URL override
+
+    Returns:
+        Dict of each taxon ID to whether ancestor_id is the taxon itself or
+        one of its ancestors
+
+    Raises:
+        ValueError: If a taxon is unknown
+    """
+    tree = get_taxonomy_tree(base_url)
+    return {int(taxon_id): tree.is_ancestor(ancestor_id, taxon_id) for taxon_id in taxon_ids}
+
+
+def configure_taxon_expansion(max_taxa: int = None, ttl: float = None) -> None:
+    """
+    Configure the expansion of taxon_id queries to descendant taxa.
+
+    Args:
+        max_taxa: Most descendant taxa a query is expanded to on a core
+            without taxon_lineage_ids (optional)
+        ttl: Seconds a descendant set is cached (optional)
+    """
+    global _expansion_max, _descendants_ttl
+    with _descendant_sets_lock:
+        if max_taxa is not None:
+            _expansion_max = int(max_taxa)
+        if ttl is not None:
+            _descendants_ttl = float(ttl)
+        _descendant_sets.clear()
+
+
+def taxon_descendant_ids(taxon_id: int, base_url: str = None, headers: Dict[str, str] = None) -> array:
+    """
+    Get the IDs of a taxon and all its descendants.
+
+    They come from the taxonomy tree when it is loaded, and otherwise from a
+    single taxonomy query on lineage_ids, cached for the configured TTL.
+
+    Args:
+        taxon_id: Taxon ID
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Array of taxon IDs, the taxon itself included
+    """
+    taxon_id = int(taxon_id)
+    tree = _trees.get(_tree_key(base_url))
+    if tree is not None and taxon_id in tree:
+        return tree.descendant_ids(taxon_id)
+    # Requests with headers may carry credentials, so their sets are never cached
+    key = (taxon_id, base_url)
+    now = time.monotonic()
+    if not headers:
+        with _descendant_sets_lock:
+            entry = _descendant_sets.get(key)
+            if entry is not None and entry[0] > now:
+                _descendant_sets.move_to_end(key)
+                return entry[1]
+    params = {"q": f"lineage_ids:{taxon_id}", "fl": "taxon_id", "rows": _PAGE_SIZE, "sort": "taxon_id asc"}
+    ids = array("q", [taxon_id])
+    for doc in _cursor_walk(CORE, params, {"cursor": "*"}, None, base_url, headers):
+        if doc.get("taxon_id") is not None and int(doc["taxon_id"]) != taxon_id:
+            ids.append(int(doc["taxon_id"]))
+    if not headers:
+        with _descendant_sets_lock:
+            _descendant_sets[key] = (now + _descendants_ttl, ids)
+            _descendant_sets.move_to_end(key)
+            while len(_descendant_sets) > _MAX_DESCENDANT_SETS:
+                _descendant_sets.popitem(last=False)
+    return ids
+
+
+def taxon_subtree_q_expr(core: str, field: str, taxon_id: int, base_url: str = None,
+                         headers: Dict[str, str] = None) -> str:
+    """
+    Build the query expression matching a taxon and all its descendants.
+
+    Args:
+        core: The core/collection name
+        field: The taxon ID field of the core (usually taxon_id)
+        taxon_id: Taxon ID
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        taxon_lineage_ids:<taxon_id> when the core has that field, and
+        otherwise a terms query ({!terms f=<field>}) of the descendant taxon
+        IDs, which is not subject to the boolean clause limit of Solr
+
+    Raises:
+        ValueError: If the taxon has more descendants than can be expanded
+    """
+    taxon_id = int(taxon_id)
+    schema = get_field_schema(core, base_url)
+    if field == "taxon_id" and schema is not None and LINEAGE_FIELD in schema:
+        return f"{LINEAGE_FIELD}:{taxon_id}"
+    ids = taxon_descendant_ids(taxon_id, base_url, headers)
+    if len(ids) > _expansion_max:
+        raise ValueError(f"Taxon {taxon_id} has {len(ids):,} taxa in its subtree, more than the {_expansion_max:,} "
+                         f"a {core} query is expanded to; query a lower taxon")
+    if len(ids) == 1:
+        return f"{field}:{taxon_id}"
+    return f"{{!terms f={field}}}{','.join(map(str, ids))}"
+
+
+def taxon_query(core: str, field: str, taxon_id: int, options: Dict[str, Any] = None,
+                base_url: str = None, headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Query a core by taxon ID, optionally expanded to the descendant taxa.
+
+    Args:
+        core: The core/collection name
+        field: The taxon ID field of the core (usually taxon_id)
+        taxon_id: Taxon ID
+        options: Optional query options, as for stream_query, plus
+            "descendants" to match the records of every taxon below taxon_id
+        base_url: Optional base URL override
+        headers: Optional headers override
+
+    Returns:
+        Tuple of (list of records, count of results)
+    """
+    options = dict(options or {})
+    if options.pop("descendants", False):
+        q_expr = taxon_subtree_q_expr(core, field, taxon_id, base_url, headers)
+    else:
+        q_expr = f"{field}:{taxon_id}"
+    return stream_query(core, q_expr, options, base_url, headers)
@@ -12,44 +12,30 @@ import sys
 from typing import Any, Dict, List, Optional
 
 from fastmcp import FastMCP
+from starlette.middleware import Middleware
 
-# Import tool modules
-from tools import (
-    register_genome_tools,
-    register_genome_feature_tools,
-    register_antibiotics_tools,
-    register_bioset_tools,
-    register_bioset_result_tools,
-    register_enzyme_class_ref_tools,
-    register_epitope_assay_tools,
-    register_epitope_tools,
-    register_experiment_tools,
-    register_gene_ontology_ref_tools,
-    register_genome_amr_tools,
-    register_genome_sequence_tools,
-    register_id_ref_tools,
-    register_misc_niaid_sgc_tools,
-    register_pathway_ref_tools,
-    register_pathway_tools,
-    register_ppi_tools,
-    register_protein_family_ref_tools,
-    register_protein_feature_tools,
-    register_protein_structure_tools,
-    register_sequence_feature_vt_tools,
-    register_sequence_feature_tools,
-    register_serology_tools,
-    register_sp_gene_ref_tools,
-    register_sp_gene_tools,
-    register_spike_lineage_tools,
-    register_spike_variant_tools,
-    register_strain_tools,
-    register_structured_assertion_tools,
-    register_subsystem_ref_tools,
-    register_subsystem_tools,
-    register_surveillance_tools,
-    register_taxonomy_tools,
-    register_common_tools
+# Import tool registration
+from tools import register_tool_catalog
+from data_functions import (
+    configure_cassette,
+    configure_shared_cache,
+    configure_memory_budget,
+    configure_preflight,
+    configure_raw_results,
+    configure_schema_validation,
+    configure_batch,
+    configure_time_budget,
+    configure_fasta,
+    configure_sequence_store,
+    configure_interval_index,
+    configure_taxonomy_tree,
+    configure_taxon_expansion,
+    configure_ppi_graph
 )
+from tool_call_log import ToolCallLogMiddleware
+from tool_progress import ToolProgressMiddleware
+from worker_pool import run_worker_pool
+from compression import CompressionMiddleware
 
 # Load configuration
 try:
@@ -67,45 +53,145 @@ except FileNotFoundError:
 base_url = config.get("base_url", "https://www.bv-brc.org/api-bulk")
 mcp_url = config.get("mcp_url", "127.0.0.1")
 port = config.get("port", 8059)
+workers = config.get("workers", 1)
+
+# Optional record/replay of upstream traffic (see README "Record/Replay")
+configure_cassette(
+    mode=config.get("cassette_mode"),
+    directory=config.get("cassette_dir"),
+    speed=config.get("replay_speed")
+)
+
+# Response and reference cache shared by the worker processes (see README
+# "Multiple Workers"); enabled by default when running more than one worker
+configure_shared_cache(
+    path=config.get("cache_path", "cache/shared_cache.sqlite" if workers > 1 else None),
+    ttl=config.get("cache_ttl"),
+    reference_ttl=config.get("reference_cache_ttl"),
+    max_entry_bytes=config.get("cache_max_entry_bytes")
+)
+
+# Memory budgets for materialized results; larger result sets spill to disk
+configure_memory_budget(
+    call_mb=config.get("call_memory_budget_mb"),
+    global_mb=config.get("memory_budget_mb"),
+    spill_dir=config.get("spill_dir"),
+    spill_ttl=config.get("spill_ttl"),
+    page_size=config.get("spill_page_size")
+)
+
+# Check query fields against the cached core schemas before sending queries
+configure_schema_validation(
+    enabled=config.get("schema_validation"),
+    ttl=config.get("schema_ttl")
+)
+
+# numFound probe before streaming: proceed, export to a spill file or refuse
+configure_preflight(
+    enabled=config.get("preflight"),
+    proceed_max=config.get("preflight_proceed_max"),
+    export_max=config.get("preflight_export_max")
+)
+
+# Small results are passed through as the upstream JSON, without decoding
+configure_raw_results(
+    enabled=config.get("raw_results"),
+    max_rows=config.get("raw_max_rows")
+)
+
+# Seconds a query tool may page before returning partial results (0: no limit)
+configure_time_budget(default=config.get("time_budget"))
+
+# Concurrent queries of bvbrc_batch: shared worker pool and default deadline
+configure_batch(
+    max_workers=config.get("batch_workers"),
+    deadline=config.get("batch_deadline"),
+    cap=config.get("batch_cap")
+)
+
+# FASTA files written by the FASTA tools (deleted after fasta_ttl seconds),
+# the largest inline FASTA and the genomes of an export fetched in parallel.
+# HTTP clients cannot open server paths, so files are named and paged instead.
+configure_fasta(
+    directory=config.get("fasta_dir"),
+    inline_bases=config.get("fasta_inline_bases"),
+    workers=config.get("fasta_workers"),
+    ttl=config.get("fasta_ttl"),
+    local_paths=False
+)
+
+# Local content-addressed store of sequences fetched by MD5 (off unless a
+# directory is given)
+configure_sequence_store(
+    path=config.get("sequence_store"),
+    max_mb=config.get("sequence_store_max_mb")
+)
+
+# Per-protein interval indexes of bvbrc_feature_intervals, kept in memory
+configure_interval_index(
+    max_indexes=config.get("interval_indexes"),
+    ttl=config.get("interval_ttl")
+)
+
+# Taxonomy tree of the bvbrc_taxonomy_tree_* tools, persisted and optionally
+# loaded at startup instead of on first use
+configure_taxonomy_tree(
+    path=config.get("taxonomy_tree"),
+    max_age=config.get("taxonomy_tree_max_age"),
+    preload=config.get("taxonomy_tree_preload", False),
+    base_url=base_url
+)
+
+# Taxon ID queries expanded to descendant taxa on cores without taxon_lineage_ids
+configure_taxon_expansion(
+    max_taxa=config.get("taxon_expansion_max"),
+    ttl=config.get("taxon_descendants_ttl")
+)
+
+# Interaction graphs of the PPI graph tools, kept in memory and persisted
+configure_ppi_graph(
+    directory=config.get("ppi_graph_dir"),
+    max_graphs=config.get("ppi_graphs"),
+    ttl=config.get("ppi_graph_ttl"),
+    max_edges=config.get("ppi_graph_max_edges")
+)
 
 # Create FastMCP server
 mcp = FastMCP("BV-BRC Data MCP Server")
 
-# Register all tools from the modular files
-register_common_tools(mcp, base_url)
-register_antibiotics_tools(mcp, base_url)
-register_bioset_tools(mcp, base_url)
-register_bioset_result_tools(mcp, base_url)
-register_enzyme_class_ref_tools(mcp, base_url)
-register_epitope_assay_tools(mcp, base_url)
-register_epitope_tools(mcp, base_url)
-register_experiment_tools(mcp, base_url)
-register_gene_ontology_ref_tools(mcp, base_url)
-register_genome_tools(mcp, base_url)
-register_genome_feature_tools(mcp, base_url)
-register_genome_amr_tools(mcp, base_url)
-register_genome_sequence_tools(mcp, base_url)
-register_id_ref_tools(mcp, base_url)
-register_misc_niaid_sgc_tools(mcp, base_url)
-register_pathway_ref_tools(mcp, base_url)
-register_pathway_tools(mcp, base_url)
-register_ppi_tools(mcp, base_url)
-register_protein_family_ref_tools(mcp, base_url)
-register_protein_feature_tools(mcp, base_url)
-register_protein_structure_tools(mcp, base_url)
-register_sequence_feature_vt_tools(mcp, base_url)
-register_sequence_feature_tools(mcp, base_url)
-register_serology_tools(mcp, base_url)
-register_sp_gene_ref_tools(mcp, base_url)
-register_spike_lineage_tools(mcp, base_url)
-register_spike_variant_tools(mcp, base_url)
-register_sp_gene_tools(mcp, base_url)
-register_strain_tools(mcp, base_url)
-register_structured_assertion_tools(mcp, base_url)
-register_subsystem_ref_tools(mcp, base_url)
-register_subsystem_tools(mcp, base_url)
-register_surveillance_tools(mcp, base_url)
-register_taxonomy_tools(mcp, base_url)
+# Optional JSONL log of every tool call (replayable with replay_workload.py)
+tool_call_log = config.get("tool_call_log")
+if tool_call_log:
+    mcp.add_middleware(ToolCallLogMiddleware(tool_call_log))
+
+# Tool calls run off the event loop, with progress notifications and cancellation
+if config.get("tool_progress", True):
+    mcp.add_middleware(ToolProgressMiddleware())
+
+# Register all tools from the modular files. Lazy registration builds the
+# tool list from the cached manifest and imports each tool module on first use.
+# The compact catalog exposes five generic tools per core instead.
+lazy_tools = config.get("lazy_tools", True)
+tool_catalog = config.get("tool_catalog", "full")
+register_tool_catalog(mcp, base_url, tool_catalog, lazy_tools)
+
+
+# HTTP response compression (see README "Response Compression")
+compression = config.get("compression", {})
+http_middleware = []
+if compression.get("enabled", True):
+    http_middleware.append(Middleware(
+        CompressionMiddleware,
+        encodings=compression.get("encodings"),
+        minimum_size=compression.get("minimum_size", 1024),
+        levels=compression.get("levels"),
+        streams=compression.get("streams", True)
+    ))
+
+
+def run_worker(worker_port: int) -> None:
+    """Serve one worker of the multi-worker server on a loopback port."""
+    mcp.run(transport="http", host="127.0.0.1", port=worker_port, middleware=http_middleware)
 
 
 def main() -> int:
@@ -113,7 +199,10 @@ def main() -> int:
     print(f"Starting BV-BRC Data MCP Server...", file=sys.stderr)
     
     try:
-        mcp.run(transport="http", host=mcp_url, port=port)
+        if workers > 1:
+            return run_worker_pool(run_worker, mcp_url, port, workers, config.get("worker_base_port"),
+                                   config.get("worker_session_ttl"), config.get("worker_max_sessions"))
+        mcp.run(transport="http", host=mcp_url, port=port, middleware=http_middleware)
     except KeyboardInterrupt:
         print("Server stopped.", file=sys.stderr)
     except Exception as e:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Workload Replay
+
+Re-issues a JSONL tool-call log (written by the http_server "tool_call_log"
+option) against a running MCP server at a configurable concurrency and
+speed-up factor, then reports throughput, latency percentiles and error
+rates per tool.
+
+Usage:
+    python replay_workload.py tool_calls.jsonl --url http://127.0.0.1:8059/mcp \\
+        --concurrency 8 --speedup 10
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from fastmcp import Client
+
+from tool_call_log import result_is_error
+
+
+def load_workload(path: str, tools: List[str] = None, limit: int = None) -> List[Dict[str, Any]]:
+    """
+    Load tool calls from a JSONL log.
+
+    Args:
+        path: Path to the JSONL log
+        tools: Only replay these tool names (optional)
+        limit: Maximum number of calls to replay (optional)
+
+    Returns:
+        List of call records ordered by timestamp
+    """
+    calls = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if tools and record["tool"] not in tools:
+                continue
+            calls.append(record)
+    calls.sort(key=lambda r: r.get("ts", 0))
+    if limit:
+        calls = calls[:limit]
+    return calls
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def replay(calls: List[Dict[str, Any]], url: str, concurrency: int = 4,
+                 speedup: float = 1.0, timeout: float = None) -> Dict[str, Any]:
+    """
+    Replay a workload against an MCP server.
+
+    Args:
+        calls: Call records from load_workload
+        url: MCP server URL
+        concurrency: Maximum number of in-flight calls
+        speedup: Divide the recorded inter-arrival times by this factor;
+            0 issues calls as fast as the concurrency limit allows
+        timeout: Per-call timeout in seconds (optional)
+
+    Returns:
+        Dictionary with the wall time and per-call samples
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: List[Dict[str, Any]] = []
+    t0 = calls[0].get("ts", 0) if calls else 0
+
+    async with Client(url) as client:
+        start = time.perf_counter()
+
+        async def issue(record: Dict[str, Any]) -> None:
+            if speedup > 0:
+                delay = (record.get("ts", t0) - t0) / speedup - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            async with semaphore:
+                call_start = time.perf_counter()
+                error = False
+                size = 0
+                try:
+                    result = await client.call_tool_mcp(record["tool"], record.get("args") or {},
+                                                        timeout=timeout)
+                    error = result_is_error(result)
+                    size = sum(len((getattr(b, "text", "") or "").encode("utf-8"))
+                               for b in result.content or [])
+                except Exception:
+                    error = True
+                samples.append({
+                    "tool": record["tool"],
+                    "latency_ms": (time.perf_counter() - call_start) * 1000,
+                    "error": error,
+                    "result_bytes": size,
+                })
+
+        await asyncio.gather(*(issue(record) for record in calls))
+        wall = time.perf_counter() - start
+
+    return {"wall_seconds": wall, "samples": samples}
+
+
+def summarize(run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Aggregate replay samples into throughput, latency and error statistics.
+
+    Args:
+        run: Output of replay()
+
+    Returns:
+        Dictionary with overall and per-tool statistics
+    """
+    by_tool: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for sample in run["samples"]:
+        by_tool[sample["tool"]].append(sample)
+
+    def stats(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        latencies = [s["latency_ms"] for s in samples]
+        errors = sum(1 for s in samples if s["error"])
+        return {
+            "calls": len(samples),
+            "errors": errors,
+            "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "result_bytes": sum(s["result_bytes"] for s in samples),
+        }
+
+    wall = run["wall_seconds"]
+    overall = stats(run["samples"])
+    overall["wall_seconds"] = round(wall, 3)
+    overall["throughput_per_s"] = round(len(run["samples"]) / wall, 3) if wall > 0 else 0.0
+    return {
+        "overall": overall,
+        "tools": {tool: stats(samples) for tool, samples in sorted(by_tool.items())},
+    }
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """Format a replay summary as a fixed-width table."""
+    overall = summary["overall"]
+    lines = [
+        f"Replayed {overall['calls']} call(s) in {overall['wall_seconds']}s "
+        f"({overall['throughput_per_s']} calls/s), error rate {overall['error_rate']:.2%}",
+        "",
+        f"{'tool':<60} {'calls':>6} {'err%':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}",
+    ]
+    for tool, s in summary["tools"].items():
+        lines.append(
+            f"{tool:<60} {s['calls']:>6} {s['error_rate']:>7.2%} "
+            f"{s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Command line entry point for the workload replay harness."""
+    parser = argparse.ArgumentParser(description="Replay a BV-BRC MCP tool-call log")
+    parser.add_argument("log", help="JSONL tool-call log")
+    parser.add_argument("--url", default="http://127.0.0.1:8059/mcp", help="MCP server URL")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum in-flight calls")
+    parser.add_argument("--speedup", type=float, default=1.0,
+                        help="Speed-up factor for recorded arrival times (0 = as fast as possible)")
+    parser.add_argument("--timeout", type=float, default=None, help="Per-call timeout in seconds")
+    parser.add_argument("--tool", action="append", dest="tools", help="Only replay this tool (repeatable)")
+    parser.add_argument("--limit", type=int, default=None, help="Replay at most this many calls")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    calls = load_workload(args.log, args.tools, args.limit)
+    if not calls:
+        print("No tool calls to replay.", file=sys.stderr)
+        return 1
+
+    run = asyncio.run(replay(calls, args.url, args.concurrency, args.speedup, args.timeout))
+    summary = summarize(run)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_summary(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,43 +13,10 @@ from typing import Any, Dict, List, Optional
 
 from fastmcp import FastMCP
 
-# Import tool modules
-from tools import (
-    register_genome_tools,
-    register_genome_feature_tools,
-    register_antibiotics_tools,
-    register_bioset_tools,
-    register_bioset_result_tools,
-    register_enzyme_class_ref_tools,
-    register_epitope_assay_tools,
-    register_epitope_tools,
-    register_experiment_tools,
-    register_gene_ontology_ref_tools,
-    register_genome_amr_tools,
-    register_genome_sequence_tools,
-    register_id_ref_tools,
-    register_misc_niaid_sgc_tools,
-    register_pathway_ref_tools,
-    register_pathway_tools,
-    register_ppi_tools,
-    register_protein_family_ref_tools,
-    register_protein_feature_tools,
-    register_protein_structure_tools,
-    register_sequence_feature_vt_tools,
-    register_sequence_feature_tools,
-    register_serology_tools,
-    register_sp_gene_ref_tools,
-    register_sp_gene_tools,
-    register_spike_lineage_tools,
-    register_spike_variant_tools,
-    register_strain_tools,
-    register_structured_assertion_tools,
-    register_subsystem_ref_tools,
-    register_subsystem_tools,
-    register_surveillance_tools,
-    register_taxonomy_tools,
-    register_common_tools
-)
+# Import tool registration
+from tools import register_tool_catalog
+from data_functions import configure_taxonomy_tree
+from tool_progress import ToolProgressMiddleware
 
 # Load configuration from environment variables
 base_url = os.getenv("BVBRC_BASE_URL", "https://www.bv-brc.org/api-bulk")
@@ -58,41 +25,20 @@ default_limit = int(os.getenv("BVBRC_DEFAULT_LIMIT", "1000"))
 # Create FastMCP server
 mcp = FastMCP("BV-BRC Data MCP Server (STDIO)")
 
-# Register all tools from the modular files
-register_common_tools(mcp, base_url)
-register_antibiotics_tools(mcp, base_url)
-register_bioset_tools(mcp, base_url)
-register_bioset_result_tools(mcp, base_url)
-register_enzyme_class_ref_tools(mcp, base_url)
-register_epitope_assay_tools(mcp, base_url)
-register_epitope_tools(mcp, base_url)
-register_experiment_tools(mcp, base_url)
-register_gene_ontology_ref_tools(mcp, base_url)
-register_genome_tools(mcp, base_url)
-register_genome_feature_tools(mcp, base_url)
-register_genome_amr_tools(mcp, base_url)
-register_genome_sequence_tools(mcp, base_url)
-register_id_ref_tools(mcp, base_url)
-register_misc_niaid_sgc_tools(mcp, base_url)
-register_pathway_ref_tools(mcp, base_url)
-register_pathway_tools(mcp, base_url)
-register_ppi_tools(mcp, base_url)
-register_protein_family_ref_tools(mcp, base_url)
-register_protein_feature_tools(mcp, base_url)
-register_protein_structure_tools(mcp, base_url)
-register_sequence_feature_vt_tools(mcp, base_url)
-register_sequence_feature_tools(mcp, base_url)
-register_serology_tools(mcp, base_url)
-register_sp_gene_ref_tools(mcp, base_url)
-register_spike_lineage_tools(mcp, base_url)
-register_spike_variant_tools(mcp, base_url)
-register_sp_gene_tools(mcp, base_url)
-register_strain_tools(mcp, base_url)
-register_structured_assertion_tools(mcp, base_url)
-register_subsystem_ref_tools(mcp, base_url)
-register_subsystem_tools(mcp, base_url)
-register_surveillance_tools(mcp, base_url)
-register_taxonomy_tools(mcp, base_url)
+# Tool calls run off the event loop, with progress notifications and cancellation
+if os.getenv("BVBRC_TOOL_PROGRESS", "1") != "0":
+    mcp.add_middleware(ToolProgressMiddleware())
+
+# Register all tools from the modular files. Lazy registration builds the
+# tool list from the cached manifest and imports each tool module on first use.
+# The compact catalog exposes five generic tools per core instead.
+lazy_tools = os.getenv("BVBRC_LAZY_TOOLS", "1") != "0"
+tool_catalog = os.getenv("BVBRC_TOOL_CATALOG", "full")
+register_tool_catalog(mcp, base_url, tool_catalog, lazy_tools)
+
+# Load the taxonomy tree at startup instead of on first use
+if os.getenv("BVBRC_TAXONOMY_TREE_PRELOAD", "0") != "0":
+    configure_taxonomy_tree(preload=True, base_url=base_url)
 
 
 def main() -> int:
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Tool Call Log
+
+This module provides a FastMCP middleware that appends every MCP tool
+invocation (tool name, arguments, latency and result size) to a JSONL file.
+The log can be replayed against a server with replay_workload.py.
+"""
+
+import json
+import threading
+import time
+from typing import Any
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+
+def _result_size(result: Any) -> int:
+    """Return the size in bytes of the text content of a tool result."""
+    size = 0
+    for block in getattr(result, "content", None) or []:
+        text = getattr(block, "text", None)
+        if text is not None:
+            size += len(text.encode("utf-8"))
+    return size
+
+
+def result_is_error(result: Any) -> bool:
+    """
+    Return whether a tool result is an error.
+
+    Args:
+        result: Tool result (ToolResult on the server, CallToolResult on a client)
+
+    Returns:
+        True if the result is flagged as an error or its text content is the
+        {"error": ...} envelope returned by the BV-BRC tools
+    """
+    if getattr(result, "isError", False):
+        return True
+    for block in getattr(result, "content", None) or []:
+        text = getattr(block, "text", None)
+        # Only texts naming an error key are parsed
+        if not text or '"error"' not in text:
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        if isinstance(payload, dict) and "error" in payload:
+            return True
+    return False
+
+
+class ToolCallLogMiddleware(Middleware):
+    """Middleware that logs every tool call to a JSONL file."""
+
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._file = open(log_path, "a", buffering=1)
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        started_at = time.time()
+        start = time.perf_counter()
+        record = {
+            "ts": started_at,
+            "tool": context.message.name,
+            "args": context.message.arguments or {},
+        }
+        try:
+            result = await call_next(context)
+        except Exception as e:
+            record["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            record["result_bytes"] = 0
+            record["error"] = True
+            record["error_message"] = str(e)
+            self._write(record)
+            raise
+
+        record["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        record["result_bytes"] = _result_size(result)
+        record["error"] = result_is_error(result)
+        self._write(record)
+        return result
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Tool Progress
+
+This module provides a FastMCP middleware that installs a QueryProgress (see
+data_functions/progress_functions.py) for each tool call. The middleware
+chain runs on the event loop; tool functions run in a worker thread (see
+tools.thread_tool_function), which inherits the progress of the call.
+Progress reported by the query streams is sent to the client as MCP progress
+notifications when the request carries a progress token, and a cancelled
+request cancels its queries at their next page.
+"""
+
+import asyncio
+import sys
+from typing import Any, Optional
+
+import anyio
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from data_functions.progress_functions import QueryProgress, query_progress
+
+
+def _progress_token(context: MiddlewareContext) -> Optional[Any]:
+    """Return the progress token of the request, if the client sent one."""
+    fastmcp_context = context.fastmcp_context
+    if fastmcp_context is None:
+        return None
+    try:
+        meta = fastmcp_context.request_context.meta
+    except (AttributeError, ValueError):
+        return None
+    return getattr(meta, "progressToken", None) if meta else None
+
+
+class ToolProgressMiddleware(Middleware):
+    """Middleware that reports query progress and honors cancellation of tool calls."""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        loop = asyncio.get_running_loop()
+        callback = None
+        if _progress_token(context) is not None:
+            fastmcp_context = context.fastmcp_context
+
+            def callback(done: int, total: Optional[int], message: str) -> None:
+                # Called from the worker thread; the notification is sent on the event loop
+                future = asyncio.run_coroutine_threadsafe(
+                    fastmcp_context.report_progress(done, total, message), loop
+                )
+                future.add_done_callback(_log_failure)
+
+        progress = QueryProgress(callback)
+        with query_progress(progress):
+            try:
+                return await call_next(context)
+            except anyio.get_cancelled_exc_class():
+                # The worker stops at its next page and releases its connection
+                progress.cancel()
+                raise
+
+
+def _log_failure(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled() and future.exception() is not None:
+        print(f"Warning: progress notification failed: {future.exception()}", file=sys.stderr)
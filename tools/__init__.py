@@ -4,40 +4,125 @@ BV-BRC MCP Tools
 This module contains all MCP tool registration functions for the BV-BRC data server.
 """
 
-from .genome_tools import register_genome_tools
-from .genome_feature_tools import register_genome_feature_tools
-from .antibiotics_tools import register_antibiotics_tools
-from .bioset_tools import register_bioset_tools
-from .bioset_result_tools import register_bioset_result_tools
-from .enzyme_class_ref_tools import register_enzyme_class_ref_tools
-from .epitope_assay_tools import register_epitope_assay_tools
-from .epitope_tools import register_epitope_tools
-from .experiment_tools import register_experiment_tools
-from .gene_ontology_ref_tools import register_gene_ontology_ref_tools
-from .genome_amr_tools import register_genome_amr_tools
-from .genome_sequence_tools import register_genome_sequence_tools
-from .id_ref_tools import register_id_ref_tools
-from .misc_niaid_sgc_tools import register_misc_niaid_sgc_tools
-from .pathway_ref_tools import register_pathway_ref_tools
-from .pathway_tools import register_pathway_tools
-from .ppi_tools import register_ppi_tools
-from .protein_family_ref_tools import register_protein_family_ref_tools
-from .protein_feature_tools import register_protein_feature_tools
-from .protein_structure_tools import register_protein_structure_tools
-from .sequence_feature_vt_tools import register_sequence_feature_vt_tools
-from .sequence_feature_tools import register_sequence_feature_tools
-from .serology_tools import register_serology_tools
-from .sp_gene_ref_tools import register_sp_gene_ref_tools
-from .sp_gene_tools import register_sp_gene_tools
-from .spike_lineage_tools import register_spike_lineage_tools
-from .spike_variant_tools import register_spike_variant_tools
-from .strain_tools import register_strain_tools
-from .structured_assertion_tools import register_structured_assertion_tools
-from .subsystem_ref_tools import register_subsystem_ref_tools
-from .subsystem_tools import register_subsystem_tools
-from .surveillance_tools import register_surveillance_tools
-from .taxonomy_tools import register_taxonomy_tools
-from .common_tools import register_common_tools
+import importlib
+from typing import Any, List
+
+# Tool modules and their register functions, in server registration order
+TOOL_MODULES = [
+    ("common_tools", "register_common_tools"),
+    ("antibiotics_tools", "register_antibiotics_tools"),
+    ("bioset_tools", "register_bioset_tools"),
+    ("bioset_result_tools", "register_bioset_result_tools"),
+    ("enzyme_class_ref_tools", "register_enzyme_class_ref_tools"),
+    ("epitope_assay_tools", "register_epitope_assay_tools"),
+    ("epitope_tools", "register_epitope_tools"),
+    ("experiment_tools", "register_experiment_tools"),
+    ("gene_ontology_ref_tools", "register_gene_ontology_ref_tools"),
+    ("genome_tools", "register_genome_tools"),
+    ("genome_feature_tools", "register_genome_feature_tools"),
+    ("genome_amr_tools", "register_genome_amr_tools"),
+    ("genome_sequence_tools", "register_genome_sequence_tools"),
+    ("id_ref_tools", "register_id_ref_tools"),
+    ("misc_niaid_sgc_tools", "register_misc_niaid_sgc_tools"),
+    ("pathway_ref_tools", "register_pathway_ref_tools"),
+    ("pathway_tools", "register_pathway_tools"),
+    ("ppi_tools", "register_ppi_tools"),
+    ("protein_family_ref_tools", "register_protein_family_ref_tools"),
+    ("protein_feature_tools", "register_protein_feature_tools"),
+    ("protein_structure_tools", "register_protein_structure_tools"),
+    ("sequence_feature_vt_tools", "register_sequence_feature_vt_tools"),
+    ("sequence_feature_tools", "register_sequence_feature_tools"),
+    ("serology_tools", "register_serology_tools"),
+    ("sp_gene_ref_tools", "register_sp_gene_ref_tools"),
+    ("spike_lineage_tools", "register_spike_lineage_tools"),
+    ("spike_variant_tools", "register_spike_variant_tools"),
+    ("sp_gene_tools", "register_sp_gene_tools"),
+    ("strain_tools", "register_strain_tools"),
+    ("structured_assertion_tools", "register_structured_assertion_tools"),
+    ("subsystem_ref_tools", "register_subsystem_ref_tools"),
+    ("subsystem_tools", "register_subsystem_tools"),
+    ("surveillance_tools", "register_surveillance_tools"),
+    ("taxonomy_tools", "register_taxonomy_tools"),
+    ("spill_tools", "register_spill_tools"),
+    ("batch_tools", "register_batch_tools"),
+    ("summary_tools", "register_summary_tools"),
+    ("sample_tools", "register_sample_tools"),
+    ("fasta_tools", "register_fasta_tools"),
+    ("interval_tools", "register_interval_tools"),
+    ("taxonomy_tree_tools", "register_taxonomy_tree_tools"),
+    ("ppi_graph_tools", "register_ppi_graph_tools"),
+]
+
+_REGISTER_MODULES = {register: module for module, register in TOOL_MODULES}
+_REGISTER_MODULES["register_compact_tools"] = "compact_tools"
+
+# Tool catalogs: one tool per query function, or five generic tools per core
+TOOL_CATALOGS = ("full", "compact")
+
+# Register functions of the compact catalog, in registration order
+COMPACT_REGISTERS = (
+    "register_common_tools", "register_spill_tools", "register_batch_tools", "register_summary_tools",
+    "register_sample_tools", "register_fasta_tools", "register_interval_tools", "register_taxonomy_tree_tools",
+    "register_ppi_graph_tools", "register_compact_tools"
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a tool module on first access to its register function."""
+    module = _REGISTER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_REGISTER_MODULES))
+
+
+def register_all_tools(mcp: Any, base_url: str):
+    """Eagerly import every tool module and register all of its tools."""
+    for module, register in TOOL_MODULES:
+        register_fn = getattr(importlib.import_module(f".{module}", __name__), register)
+        register_fn(mcp, base_url)
+
+
+from .lazy_tools import (
+    register_lazy_tools,
+    build_tool_manifest,
+    load_tool_manifest,
+    write_tool_manifest,
+    check_tool_manifest,
+    serve_precomputed_tool_list,
+    thread_tool_function,
+    threaded_tool_registrar,
+)
+
+
+def register_tool_catalog(mcp: Any, base_url: str, catalog: str = "full", lazy: bool = True):
+    """
+    Register the configured tool catalog.
+
+    Args:
+        mcp: FastMCP server
+        base_url: BV-BRC API base URL
+        catalog: "full" (one tool per query function) or "compact" (generic tools per core)
+        lazy: Register the full catalog from the precomputed tool catalog
+
+    Tool functions are registered to run in a worker thread.
+    """
+    if catalog not in TOOL_CATALOGS:
+        raise ValueError(f"Unknown tool catalog: {catalog}")
+    if catalog == "compact":
+        for register in COMPACT_REGISTERS:
+            __getattr__(register)(threaded_tool_registrar(mcp), base_url)
+    elif lazy:
+        register_lazy_tools(mcp, base_url)
+    else:
+        register_all_tools(threaded_tool_registrar(mcp), base_url)
+    serve_precomputed_tool_list(mcp)
+
 
 __all__ = [
     'register_genome_tools',
@@ -73,5 +158,26 @@ __all__ = [
     'register_subsystem_tools',
     'register_surveillance_tools',
     'register_taxonomy_tools',
-    'register_common_tools'
+    'register_common_tools',
+    'register_spill_tools',
+    'register_batch_tools',
+    'register_summary_tools',
+    'register_sample_tools',
+    'register_fasta_tools',
+    'register_interval_tools',
+    'register_taxonomy_tree_tools',
+    'register_ppi_graph_tools',
+    'TOOL_MODULES',
+    'register_all_tools',
+    'register_lazy_tools',
+    'build_tool_manifest',
+    'load_tool_manifest',
+    'write_tool_manifest',
+    'check_tool_manifest',
+    'serve_precomputed_tool_list',
+    'thread_tool_function',
+    'threaded_tool_registrar',
+    'TOOL_CATALOGS',
+    'register_compact_tools',
+    'register_tool_catalog'
 ]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Batch Tools
+
+This module contains the MCP tool running many independent queries
+concurrently in one call.
+"""
+
+import json
+import time
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from data_functions import run_batch, query_result_json
+
+
+def register_batch_tools(mcp: FastMCP, base_url: str):
+    """Register batch query MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_batch(queries_json: str, deadline: Optional[float] = None) -> str:
+        """
+        Run several independent queries, on any cores, concurrently in one call.
+
+        Args:
+            queries_json: JSON list of queries, each {"id", "core", "q" or
+                "filters", "select", "sort", "cap"}; only core is required.
+                q is a Solr query (e.g. "genome_id:83332.12"), filters an
+                object of field filters combined with AND, select a
+                comma-separated field list, and cap the maximum number of
+                records (default 1000). Example: '[{"id": "genome", "core":
+                "genome", "q": "genome_id:83332.12"}, {"id": "amr", "core":
+                "genome_amr", "filters": {"genome_id": "83332.12"}}]'
+            deadline: Seconds the whole batch may take (optional, default 60)
+
+        Returns:
+            JSON string with the results of each query keyed by its id; a
+            query still paging late in the deadline returns the records
+            fetched so far, marked partial with a continuation token, and a
+            query that failed or did not finish has an error instead
+        """
+        try:
+            queries = json.loads(queries_json)
+        except json.JSONDecodeError as e:
+            return json.dumps({
+                "error": f"Error parsing queries JSON: {str(e)}"
+            }, indent=2)
+
+        start = time.perf_counter()
+        try:
+            outcomes = run_batch(queries, deadline, {"raw": True}, base_url)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error running batch: {str(e)}"
+            }, indent=2)
+
+        # Each query result is already JSON (raw results are spliced in unparsed)
+        entries = []
+        for query_id, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                payload = outcome.payload() if hasattr(outcome, "payload") else {"error": str(outcome)}
+                body = json.dumps(payload, indent=2)
+            else:
+                body = query_result_json(*outcome)
+            # JSON strings hold no raw newlines, so re-indenting lines is safe
+            entries.append(f'    {json.dumps(query_id)}: {body.replace(chr(10), chr(10) + "    ")}')
+
+        return (
+            f'{{\n  "count": {len(entries)},\n'
+            f'  "elapsed_ms": {round((time.perf_counter() - start) * 1000, 1)},\n'
+            f'  "results": {{\n' + ",\n".join(entries) + "\n  }\n}"
+        )
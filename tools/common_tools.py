@@ -15,8 +15,13 @@ _default_limit = None
 
 from data_functions import (
     query_direct,
-    format_query_result
+    continue_query,
+    format_query_result,
+    query_result_json,
+    QueryTooLargeError,
+    UnknownFieldError
 )
+from .spec_tools import build_tool_options
 
 
 def register_common_tools(mcp: FastMCP, base_url: str):
@@ -26,7 +31,8 @@ def register_common_tools(mcp: FastMCP, base_url: str):
     
     @mcp.tool()
     def bvbrc_query_direct(core: str, filter_str: str = "",
-                          select: Optional[str] = None, sort: Optional[str] = None) -> str:
+                          select: Optional[str] = None, sort: Optional[str] = None,
+                          time_budget: Optional[float] = None) -> str:
         """
         Query BV-BRC data directly using core name and filter string.
         
@@ -35,23 +41,48 @@ def register_common_tools(mcp: FastMCP, base_url: str):
             filter_str: RQL filter string (e.g., "eq(genome_id,123.45)")
             select: Comma-separated list of fields to select (optional)
             sort: Field to sort by (optional)
+            time_budget: Seconds to spend fetching records before returning the
+                records fetched so far with a continuation token (optional,
+                server default if omitted)
         
         Returns:
             Formatted query results
         """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
+        options = build_tool_options(select, sort, time_budget)
         
         try:
             result, count = query_direct(core, filter_str, options, _base_url)
+            return query_result_json(result, count)
+        except (QueryTooLargeError, UnknownFieldError) as e:
+            return json.dumps(e.payload(), indent=2)
+        except Exception as e:
             return json.dumps({
-                "count": count,
-                "results": result
+                "error": f"Error querying {core}: {str(e)}"
             }, indent=2)
+    
+    @mcp.tool()
+    def bvbrc_continue_query(continuation: str, time_budget: Optional[float] = None) -> str:
+        """
+        Fetch the next records of a query that returned partial results.
+        
+        Args:
+            continuation: Continuation token of a result marked "partial": true
+            time_budget: Seconds to spend fetching records before returning the
+                records fetched so far with a new continuation token (optional,
+                server default if omitted)
+        
+        Returns:
+            JSON string with count and the next results, partial again with a
+            new continuation token if the time budget runs out
+        """
+        options = build_tool_options(None, None, time_budget)
+        
+        try:
+            result, count = continue_query(continuation, options, _base_url)
+            return query_result_json(result, count)
+        except (QueryTooLargeError, UnknownFieldError) as e:
+            return json.dumps(e.payload(), indent=2)
         except Exception as e:
             return json.dumps({
-                "error": f"Error querying {core}: {str(e)}"
+                "error": f"Error continuing query: {str(e)}"
             }, indent=2)
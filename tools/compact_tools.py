@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Compact Tools
+
+This module provides the compact tool catalog: five generic tools per core
+(get, search, range, facet and export) instead of one tool per field. The
+queryable fields of each core are enumerated in the tool schemas, taken from
+the same query specs that generate the full catalog, so both catalogs accept
+exactly the same queries while tools/list stays small.
+"""
+
+import json
+from functools import partial
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+from fastmcp import FastMCP
+
+from data_functions.common_functions import solr_facet, stream_query
+from data_functions.schema_functions import UnknownFieldError, validate_query
+from data_functions.sequence_store_functions import is_sequence_md5_field, sequence_md5_query
+from data_functions.query_spec_functions import (
+    BOOLEAN,
+    DATE_RANGE,
+    EXACT,
+    KEYWORD,
+    PHRASE,
+    RANGE,
+    build_q_expr,
+    filters_q_expr,
+    load_all_query_specs,
+    specialize_function,
+)
+from .spec_tools import run_query_tool
+
+_SELECT_DOC = "select: Comma-separated list of fields to select (optional)"
+_SORT_DOC = "sort: Field to sort by (optional)"
+_TIME_BUDGET_DOC = ("time_budget: Seconds to spend fetching records before returning the records "
+                    "fetched so far with a continuation token (optional, server default if omitted)")
+_FILTERS_DOC = ('filters_json: JSON string of field filters combined with AND, '
+                'e.g. \'{"genus": "Escherichia"}\' (optional, all records if omitted)')
+_RESULTS_DOC = "JSON string with count and results"
+
+# Defaults of the optional query tool parameters
+_QUERY_DEFAULTS = {"select": None, "sort": None, "time_budget": None}
+
+
+def _parse_filters(filters_json: Optional[str]) -> str:
+    if not filters_json:
+        return "*:*"
+    filters = json.loads(filters_json)
+    return filters_q_expr(filters) if filters else "*:*"
+
+
+def _filters_error(e: json.JSONDecodeError) -> str:
+    return json.dumps({
+        "error": f"Error parsing filters JSON: {str(e)}"
+    }, indent=2)
+
+
+def _run_spec(core: str, error: str, base_url: str, spec: Dict[str, Any], values: tuple,
+              select: Optional[str], sort: Optional[str], time_budget: Optional[float]) -> str:
+    if spec["kind"] in (EXACT, PHRASE) and is_sequence_md5_field(core, spec["field"]):
+        return run_query_tool(partial(sequence_md5_query, core), error, base_url, values, select, sort, time_budget)
+    q_expr = build_q_expr(spec, values)
+    return run_query_tool(partial(stream_query, core), error, base_url, (q_expr,), select, sort, time_budget)
+
+
+def _run_export(core: str, error: str, base_url: str, filters_json: Optional[str],
+                select: Optional[str], sort: Optional[str], time_budget: Optional[float]) -> str:
+    try:
+        q_expr = _parse_filters(filters_json)
+    except json.JSONDecodeError as e:
+        return _filters_error(e)
+    return run_query_tool(partial(stream_query, core), error, base_url, (q_expr,), select, sort, time_budget)
+
+
+def _run_facet(core: str, error: str, base_url: str, field: str,
+               filters_json: Optional[str], limit: int) -> str:
+    try:
+        q_expr = _parse_filters(filters_json)
+    except json.JSONDecodeError as e:
+        return _filters_error(e)
+
+    try:
+        validate_query(core, q_expr, None, base_url)
+        facets, count = solr_facet(core, field, q_expr, limit, base_url)
+        return json.dumps({
+            "count": count,
+            "results": facets
+        }, indent=2)
+    except UnknownFieldError as e:
+        return json.dumps(e.payload(), indent=2)
+    except Exception as e:
+        return json.dumps({
+            "error": f"{error}: {str(e)}"
+        }, indent=2)
+
+
+def _doc(summary: str, params: List[str], returns: str = _RESULTS_DOC) -> str:
+    lines = [summary, "", "Args:"]
+    lines += [f"    {param}" for param in params]
+    lines += ["", "Returns:", f"    {returns}"]
+    return "\n".join(lines)
+
+
+def _first_specs(specs: List[Dict[str, Any]], kinds: tuple) -> Dict[str, Dict[str, Any]]:
+    fields: Dict[str, Dict[str, Any]] = {}
+    for spec in specs:
+        if spec["kind"] in kinds and spec["field"] not in fields:
+            fields[spec["field"]] = spec
+    return fields
+
+
+def make_compact_tools(core: str, specs: List[Dict[str, Any]], base_url: str) -> List[Callable[..., str]]:
+    """
+    Generate the compact tools of a core from its query specs.
+
+    Args:
+        core: The core/collection name
+        specs: Query specs of the core
+        base_url: BV-BRC API base URL
+
+    Returns:
+        List of tool functions with typed signatures and docstrings
+    """
+    match_specs = _first_specs(specs, (EXACT, PHRASE, BOOLEAN))
+    range_specs = _first_specs(specs, (RANGE, DATE_RANGE))
+    keyword_spec = next((spec for spec in specs if spec["kind"] == KEYWORD), None)
+    all_fields = list(dict.fromkeys(list(match_specs) + list(range_specs)))
+    label = core.replace("_", " ")
+    tools = []
+
+    def run_spec(error: str) -> Callable[..., str]:
+        return partial(_run_spec, core, error, base_url)
+
+    # get: the first match spec of every core is its primary identifier
+    id_spec = next(spec for spec in specs if spec["kind"] in (EXACT, PHRASE))
+    run_get = run_spec(f"Error querying {label} by {id_spec['field']}")
+
+    def get(id, select, sort, time_budget):
+        return run_get(id_spec, (id,), select, sort, time_budget)
+
+    tools.append(specialize_function(
+        get, f"bvbrc_{core}_get",
+        {"id": str, "select": Optional[str], "sort": Optional[str],
+         "time_budget": Optional[float], "return": str},
+        _QUERY_DEFAULTS, __name__,
+        _doc(f"Get {label} records by {id_spec['field']}.",
+             [f"id: The {id_spec['field']} value to query", _SELECT_DOC, _SORT_DOC, _TIME_BUDGET_DOC])
+    ))
+
+    # search: exact, phrase and boolean fields, plus the keyword search when the core has one
+    search_field = Literal[tuple(match_specs)]
+    run_search = run_spec(f"Error searching {label}")
+    if keyword_spec:
+        def keyword_search(value, field, select, sort, time_budget):
+            spec = keyword_spec if field is None else match_specs[field]
+            return run_search(spec, (value,), select, sort, time_budget)
+
+        tools.append(specialize_function(
+            keyword_search, f"bvbrc_{core}_search",
+            {"value": str, "field": Optional[search_field], "select": Optional[str],
+             "sort": Optional[str], "time_budget": Optional[float], "return": str},
+            dict(_QUERY_DEFAULTS, field=None), __name__,
+            _doc(f"Search {label} records by field value, or by keyword across all fields.",
+                 ["value: The value to match (true/false for boolean fields)",
+                  "field: Field to match (optional, keyword search if omitted)",
+                  _SELECT_DOC, _SORT_DOC, _TIME_BUDGET_DOC])
+        ))
+    else:
+        def search(field, value, select, sort, time_budget):
+            return run_search(match_specs[field], (value,), select, sort, time_budget)
+
+        tools.append(specialize_function(
+            search, f"bvbrc_{core}_search",
+            {"field": search_field, "value": str, "select": Optional[str],
+             "sort": Optional[str], "time_budget": Optional[float], "return": str},
+            _QUERY_DEFAULTS, __name__,
+            _doc(f"Search {label} records by field value.",
+                 ["field: Field to match",
+                  "value: The value to match (true/false for boolean fields)",
+                  _SELECT_DOC, _SORT_DOC, _TIME_BUDGET_DOC])
+        ))
+
+    # range: numeric and date fields
+    if range_specs:
+        bound = Union[int, float, str]
+        run_range = run_spec(f"Error querying {label} by range")
+
+        def range_query(field, low, high, select, sort, time_budget):
+            return run_range(range_specs[field], (low, high), select, sort, time_budget)
+
+        tools.append(specialize_function(
+            range_query, f"bvbrc_{core}_range",
+            {"field": Literal[tuple(range_specs)], "low": bound, "high": bound,
+             "select": Optional[str], "sort": Optional[str], "time_budget": Optional[float],
+             "return": str},
+            _QUERY_DEFAULTS, __name__,
+            _doc(f"Get {label} records with a field in an inclusive range.",
+                 ["field: Numeric or date field to bound",
+                  "low: Lower bound (number, or ISO date such as 2020-01-01T00:00:00Z)",
+                  "high: Upper bound (number, or ISO date such as 2020-12-31T23:59:59Z)",
+                  _SELECT_DOC, _SORT_DOC, _TIME_BUDGET_DOC])
+        ))
+
+    # facet: value counts of any queryable field
+    tools.append(specialize_function(
+        partial(_run_facet, core, f"Error faceting {label}", base_url), f"bvbrc_{core}_facet",
+        {"field": Literal[tuple(all_fields)], "filters_json": Optional[str], "limit": int,
+         "return": str},
+        {"filters_json": None, "limit": 20}, __name__,
+        _doc(f"Count the most frequent values of a {label} field.",
+             ["field: Field to count values of", _FILTERS_DOC,
+              "limit: Maximum number of values to return (default 20)"],
+             "JSON string with the count of matching records and results of value counts")
+    ))
+
+    # export: every record matching a set of filters
+    tools.append(specialize_function(
+        partial(_run_export, core, f"Error exporting {label}", base_url), f"bvbrc_{core}_export",
+        {"filters_json": Optional[str], "select": Optional[str], "sort": Optional[str],
+         "time_budget": Optional[float], "return": str},
+        dict(_QUERY_DEFAULTS, filters_json=None), __name__,
+        _doc(f"Export all {label} records matching a set of filters.",
+             [_FILTERS_DOC, _SELECT_DOC, _SORT_DOC, _TIME_BUDGET_DOC])
+    ))
+    return tools
+
+
+def register_compact_tools(mcp: FastMCP, base_url: str) -> List[str]:
+    """
+    Register the compact tool catalog (get, search, range, facet, export per core).
+
+    Args:
+        mcp: FastMCP server
+        base_url: BV-BRC API base URL
+
+    Returns:
+        List of registered tool names
+    """
+    names = []
+    for core, specs in sorted(load_all_query_specs().items()):
+        for fn in make_compact_tools(core, specs, base_url):
+            mcp.tool()(fn)
+            names.append(fn.__name__)
+    return names
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+BV-BRC FASTA Tools
+
+This module contains the MCP tools streaming genome sequences as FASTA,
+exporting the FASTA of many genomes and paging through the FASTA files
+written.
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Literal, Optional
+
+from fastmcp import FastMCP
+
+from data_functions import (
+    export_genome_fasta,
+    fasta_chunks,
+    fasta_inline_bases,
+    fasta_local_paths,
+    fasta_path,
+    read_fasta_page,
+    write_fasta
+)
+
+
+def _file_reference(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Remote clients get the file name to page with bvbrc_fasta_page, not a server path
+    if "path" in result and not fasta_local_paths():
+        result["file"] = os.path.basename(result.pop("path"))
+    return result
+
+
+def register_fasta_tools(mcp: FastMCP, base_url: str):
+    """Register FASTA MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_genome_fasta(genome_id: Optional[str] = None, regions: Optional[str] = None,
+                           file_name: Optional[str] = None, width: int = 60) -> str:
+        """
+        Get genome sequences as FASTA, whole contigs or windows of them.
+
+        Prefer this to bvbrc_genome_sequence_get_by_genome_id or
+        bvbrc_genome_sequence_get_by_accession when the sequence itself is
+        needed: bases are streamed, and a window returns only its bases.
+
+        Args:
+            genome_id: Genome ID whose contigs are returned (e.g., "83332.12");
+                with regions, only used to pick among genomes sharing an
+                accession (optional)
+            regions: Comma-separated accessions or 1-based inclusive windows
+                "accession:start-end", e.g. "NC_000962:1-1524,NC_000962:4000-4500"
+                (optional)
+            file_name: Write the FASTA to this file in the server's FASTA
+                directory instead of returning it (optional; required when
+                the sequences exceed the inline limit)
+            width: Bases per FASTA line (default 60)
+
+        Returns:
+            JSON string with the sequences and bases returned and the FASTA
+            text, or the FASTA file written: its path, or on a remote server
+            its file name, to read with bvbrc_fasta_page
+        """
+        try:
+            region_list = [region for region in re.split(r"[,\s]+", regions or "") if region]
+            if not genome_id and not region_list:
+                raise ValueError("Give a genome_id or regions")
+            if width < 1:
+                raise ValueError("width must be at least 1")
+            q_expr = f'genome_id:"{genome_id}"' if genome_id else None
+            path = fasta_path(file_name) if file_name else None
+        except ValueError as e:
+            return json.dumps({
+                "error": f"Error parsing FASTA request: {str(e)}"
+            }, indent=2)
+
+        try:
+            if path:
+                return json.dumps(_file_reference(dict({"path": path},
+                                                        **write_fasta(path, q_expr, region_list, width, base_url))),
+                                  indent=2)
+            stats = {}
+            chunks = []
+            limit = fasta_inline_bases()
+            for chunk in fasta_chunks(q_expr, region_list, width, stats, base_url):
+                if stats["bases"] > limit:
+                    return json.dumps({
+                        "error": f"The sequences exceed {limit:,} bases; give a file_name or narrower regions"
+                    }, indent=2)
+                chunks.append(chunk)
+            return json.dumps({
+                "sequences": stats["sequences"],
+                "bases": stats["bases"],
+                "fasta": b"".join(chunks).decode("utf-8", errors="replace")
+            }, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error fetching genome sequences: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_genome_fasta_export(genome_ids: str, sequence_type: Literal["protein", "dna", "contig"] = "protein",
+                                  merged_file: Optional[str] = None, width: int = 60) -> str:
+        """
+        Export the protein, gene or contig FASTA of many genomes to files.
+
+        Use it instead of one bvbrc_genome_feature_get_by_genome_id call
+        per genome: only feature IDs and sequences are fetched, genomes run in
+        parallel, and a sequence shared by several features is downloaded
+        once.
+
+        Args:
+            genome_ids: Comma-separated genome IDs (at most 1000)
+            sequence_type: "protein" (amino acids, .faa), "dna" (gene
+                nucleotides, .ffn) or "contig" (genome sequences, .fna)
+                (default "protein")
+            merged_file: Write every genome to this one file in the server's
+                FASTA directory, in the order given (optional; one
+                <genome_id> file per genome otherwise)
+            width: Residues per FASTA line (default 60)
+
+        Returns:
+            JSON string with, per genome, the sequences and residues written
+            and the file (or the error of a failed genome), and the merged
+            file. Files are given by path, or on a remote server by file
+            name, to read with bvbrc_fasta_page
+        """
+        try:
+            if width < 1:
+                raise ValueError("width must be at least 1")
+            result = _file_reference(export_genome_fasta(genome_ids.split(","), sequence_type, merged_file,
+                                                         width, base_url))
+            for genome in result["genomes"]:
+                _file_reference(genome)
+            return json.dumps(result, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error exporting genome FASTA: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_fasta_page(file: str, offset: int = 0, limit: Optional[int] = None) -> str:
+        """
+        Read a page of a FASTA file written by bvbrc_genome_fasta or
+        bvbrc_genome_fasta_export.
+
+        Args:
+            file: File name from the "file" field of a FASTA tool result
+            offset: Byte offset of the page (default 0; use next_offset of
+                the previous page)
+            limit: Most bytes of the page (optional, the server's inline
+                limit otherwise); pages end at a line break
+
+        Returns:
+            JSON string with the file size, offset, next_offset (null after
+            the last page) and the FASTA text of the page
+        """
+        try:
+            fasta, next_offset, size = read_fasta_page(file, offset, limit)
+            return json.dumps({
+                "file": file,
+                "size": size,
+                "offset": offset,
+                "next_offset": next_offset,
+                "fasta": fasta
+            }, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error reading FASTA file: {str(e)}"
+            }, indent=2)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Interval Tools
+
+This module contains the MCP tool answering position queries on the
+features of one protein from a local interval index.
+"""
+
+import json
+from typing import Literal, Optional
+
+from fastmcp import FastMCP
+
+from data_functions import interval_query, query_result_json
+
+
+def register_interval_tools(mcp: FastMCP, base_url: str):
+    """Register interval index MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_feature_intervals(core: Literal["protein_feature", "sequence_feature", "epitope", "epitope_assay"],
+                                sequence_id: str, start: int, end: Optional[int] = None,
+                                relation: Literal["overlap", "within", "nearest"] = "overlap") -> str:
+        """
+        Find the features of one protein by position: overlapping a range,
+        contained in it, or nearest to it.
+
+        Prefer this to the *_by_position_range tools when exploring one
+        protein: its features are indexed on the first call and later calls
+        are answered locally.
+
+        Args:
+            core: "protein_feature" (domains), "sequence_feature",
+                "epitope" or "epitope_assay"
+            sequence_id: The protein, as its feature_id for protein_feature
+                and sequence_feature (e.g., "PATRIC.83332.12.NC_000962.CDS.34.1524.fwd"),
+                or its protein_accession for epitope and epitope_assay
+            start: First position of the range (1-based)
+            end: Last position of the range, inclusive (optional, start)
+            relation: "overlap" (features overlapping the range), "within"
+                (features inside the range) or "nearest" (the closest
+                features, with their distance; 0 when overlapping)
+                (default "overlap")
+
+        Returns:
+            JSON string with count and results (identifier, start, end and a
+            few descriptive fields per feature, in start order)
+        """
+        try:
+            results, count = interval_query(core, sequence_id, start, end, relation, base_url)
+            return query_result_json(results, count)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error querying {core} intervals: {str(e)}"
+            }, indent=2)
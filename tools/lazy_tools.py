@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Lazy Tools
+
+This module registers every BV-BRC MCP tool from the precomputed tool catalog
+(tools/tool_catalog.json), a versioned artifact holding each tool's name,
+description and JSON schemas, without importing the tool modules or
+data_functions. A tool module (and the data_functions submodules it uses) is
+imported the first time one of its tools is called, and tools/list is served
+from a response computed once instead of on every request.
+
+The catalog is regenerated with build_tool_catalog.py; build_tool_catalog.py
+--check fails when it has drifted from the code.
+
+Tool functions are synchronous. Every registration path wraps them with
+thread_tool_function, so FastMCP awaits them on the event loop while the
+function itself runs in a worker thread.
+"""
+
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import anyio
+from fastmcp import FastMCP
+from fastmcp.tools import Tool
+from fastmcp.tools.tool import FunctionTool, ToolResult
+from mcp import types as mcp_types
+from pydantic import PrivateAttr
+
+from . import TOOL_MODULES
+
+CATALOG_FORMAT_VERSION = 1
+
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_FUNCTIONS_DIR = os.path.join(os.path.dirname(_TOOLS_DIR), "data_functions")
+DEFAULT_MANIFEST_PATH = os.getenv(
+    "BVBRC_TOOL_MANIFEST", os.path.join(_TOOLS_DIR, "tool_catalog.json")
+)
+
+# Module-level QUERY_SPECS declaration of a core module
+_QUERY_SPECS_LINE = re.compile(r"^QUERY_SPECS\s*=", re.MULTILINE)
+
+# Resolved tools per module: {module: {tool_name: FunctionTool}}
+_resolved_tools: Dict[str, Dict[str, FunctionTool]] = {}
+_resolve_lock = threading.Lock()
+
+
+class _ToolCollector:
+    """Stand-in for FastMCP that captures the functions passed to @mcp.tool()."""
+
+    def __init__(self):
+        self.functions: Dict[str, Callable[..., Any]] = {}
+
+    def tool(self, name: Optional[str] = None, **kwargs) -> Callable:
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.functions[name or fn.__name__] = fn
+            return fn
+        return decorator
+
+
+class _ThreadedToolRegistrar:
+    """Stand-in for FastMCP that registers the functions passed to @mcp.tool() to run in a worker thread."""
+
+    def __init__(self, mcp: FastMCP):
+        self.mcp = mcp
+
+    def tool(self, name: Optional[str] = None, **kwargs) -> Callable:
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.mcp.tool(name=name, **kwargs)(thread_tool_function(fn))
+            return fn
+        return decorator
+
+
+def thread_tool_function(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a synchronous tool function to run in a worker thread.
+
+    The wrapper is a coroutine function with the signature of fn, so the tool
+    and its schemas are unchanged; it runs fn with anyio.to_thread.run_sync in
+    a copy of the caller's context (the QueryProgress of the call included).
+    On cancellation the await returns at once and the thread finishes on its own.
+
+    Args:
+        fn: Tool function (coroutine functions are returned as they are)
+
+    Returns:
+        Coroutine function running fn in a worker thread
+    """
+    if inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def run(*args, **kwargs):
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs), abandon_on_cancel=True)
+
+    return run
+
+
+def threaded_tool_registrar(mcp: FastMCP) -> _ThreadedToolRegistrar:
+    """
+    Return a registrar passed to register functions in place of the FastMCP
+    server, registering each tool to run in a worker thread.
+
+    Args:
+        mcp: FastMCP server
+
+    Returns:
+        Registrar exposing tool() like FastMCP
+    """
+    return _ThreadedToolRegistrar(mcp)
+
+
+def _collect_module_functions(module: str, register: str, base_url: str) -> Dict[str, Callable[..., Any]]:
+    collector = _ToolCollector()
+    register_fn = getattr(importlib.import_module(f".{module}", __package__), register)
+    register_fn(collector, base_url)
+    return collector.functions
+
+
+def _catalog_sources() -> List[str]:
+    # Tool schemas depend on the tool modules and on the query function specs
+    # they wrap: query_spec_functions and the core modules declaring
+    # QUERY_SPECS. Other data_functions modules never change a schema.
+    sources = [
+        os.path.join(_TOOLS_DIR, filename)
+        for filename in sorted(os.listdir(_TOOLS_DIR))
+        if filename.endswith(".py")
+    ]
+    sources.append(os.path.join(_DATA_FUNCTIONS_DIR, "query_spec_functions.py"))
+    for filename in sorted(os.listdir(_DATA_FUNCTIONS_DIR)):
+        if not filename.endswith("_functions.py") or filename == "query_spec_functions.py":
+            continue
+        path = os.path.join(_DATA_FUNCTIONS_DIR, filename)
+        with open(path, "r", encoding="utf-8") as f:
+            if _QUERY_SPECS_LINE.search(f.read()):
+                sources.append(path)
+    return sources
+
+
+def tool_sources_fingerprint() -> str:
+    """
+    Compute a fingerprint of the sources that define the tool catalog.
+
+    Returns:
+        Hex digest over the registration order and the names and contents of
+        the tool modules and query spec modules
+    """
+    digest = hashlib.sha256()
+    digest.update("".join(f"{module}:{register}\n" for module, register in TOOL_MODULES).encode("utf-8"))
+    for path in _catalog_sources():
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_tool_manifest(base_url: str = None) -> Dict[str, Any]:
+    """
+    Build the tool catalog by importing every tool module once.
+
+    Args:
+        base_url: Base URL passed to the register functions (not stored)
+
+    Returns:
+        Catalog dictionary with the format version, the source fingerprint and
+        one entry per tool
+    """
+    tools = []
+    for module, register in TOOL_MODULES:
+        for name, fn in _collect_module_functions(module, register, base_url).items():
+            tool = Tool.from_function(fn, name=name)
+            tools.append({
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.parameters,
+                "output_schema": tool.output_schema,
+                "module": module,
+                "register": register,
+            })
+    return {
+        "format_version": CATALOG_FORMAT_VERSION,
+        "fingerprint": tool_sources_fingerprint(),
+        "tools": tools,
+    }
+
+
+def write_tool_manifest(manifest: Dict[str, Any], path: str = None) -> str:
+    """
+    Write the tool catalog artifact.
+
+    Args:
+        manifest: Catalog dictionary
+        path: Artifact path (optional, defaults to tools/tool_catalog.json)
+
+    Returns:
+        Path written
+    """
+    path = path or DEFAULT_MANIFEST_PATH
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1)
+        f.write("\n")
+    os.replace(tmp_path, path)
+    return path
+
+
+def _read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def load_tool_manifest(path: str = None, rebuild: bool = False) -> Dict[str, Any]:
+    """
+    Load the tool catalog artifact, rebuilding it in memory if it is stale.
+
+    Args:
+        path: Artifact path (optional, defaults to tools/tool_catalog.json)
+        rebuild: Ignore the artifact and build the catalog from the code
+
+    Returns:
+        Catalog dictionary
+    """
+    path = path or DEFAULT_MANIFEST_PATH
+    if not rebuild:
+        manifest = _read_manifest(path)
+        if (manifest and manifest.get("format_version") == CATALOG_FORMAT_VERSION
+                and manifest.get("fingerprint") == tool_sources_fingerprint()):
+            return manifest
+        print(f"Warning: tool catalog {path} is missing or stale, building it in memory "
+              f"(regenerate it with build_tool_catalog.py)", file=sys.stderr)
+    return build_tool_manifest()
+
+
+def check_tool_manifest(path: str = None) -> List[str]:
+    """
+    Compare the tool catalog artifact with the catalog built from the code.
+
+    Args:
+        path: Artifact path (optional, defaults to tools/tool_catalog.json)
+
+    Returns:
+        List of differences (empty when the artifact is current)
+    """
+    path = path or DEFAULT_MANIFEST_PATH
+    manifest = _read_manifest(path)
+    if manifest is None:
+        return [f"{path} is missing or not valid JSON"]
+
+    built = build_tool_manifest()
+    problems = []
+    if manifest.get("format_version") != built["format_version"]:
+        problems.append(f"format_version is {manifest.get('format_version')}, "
+                        f"expected {built['format_version']}")
+    if manifest.get("fingerprint") != built["fingerprint"]:
+        problems.append("fingerprint does not match the tool and query spec sources")
+
+    stored = {entry["name"]: entry for entry in manifest.get("tools", [])}
+    current = {entry["name"]: entry for entry in built["tools"]}
+    for name in current.keys() - stored.keys():
+        problems.append(f"tool {name} is missing")
+    for name in stored.keys() - current.keys():
+        problems.append(f"tool {name} no longer exists")
+    for name in current.keys() & stored.keys():
+        if stored[name] != current[name]:
+            problems.append(f"tool {name} differs")
+    if not problems and [e["name"] for e in manifest["tools"]] != list(current):
+        problems.append("tool order differs")
+    return sorted(problems)
+
+
+def _resolve_tool(module: str, register: str, base_url: str, name: str) -> FunctionTool:
+    tools = _resolved_tools.get(module)
+    if tools is None:
+        with _resolve_lock:
+            tools = _resolved_tools.get(module)
+            if tools is None:
+                functions = _collect_module_functions(module, register, base_url)
+                tools = {
+                    tool_name: Tool.from_function(thread_tool_function(fn), name=tool_name)
+                    for tool_name, fn in functions.items()
+                }
+                _resolved_tools[module] = tools
+    return tools[name]
+
+
+class LazyTool(Tool):
+    """Tool whose implementation is imported on first call."""
+
+    tool_module: str
+    register_name: str
+    base_url: Optional[str] = None
+
+    async def run(self, arguments: Dict[str, Any]) -> ToolResult:
+        tool = _resolve_tool(self.tool_module, self.register_name, self.base_url, self.name)
+        return await tool.run(arguments)
+
+
+def register_lazy_tools(mcp: FastMCP, base_url: str, manifest: Dict[str, Any] = None) -> List[str]:
+    """
+    Register all BV-BRC tools from the tool catalog without importing them.
+
+    Args:
+        mcp: FastMCP server
+        base_url: BV-BRC API base URL
+        manifest: Preloaded catalog (optional, loaded from tools/tool_catalog.json otherwise)
+
+    Returns:
+        List of registered tool names
+    """
+    manifest = manifest or load_tool_manifest()
+    names = []
+    for entry in manifest["tools"]:
+        mcp.add_tool(LazyTool(
+            name=entry["name"],
+            description=entry["description"],
+            parameters=entry["parameters"],
+            output_schema=entry["output_schema"],
+            tool_module=entry["module"],
+            register_name=entry["register"],
+            base_url=base_url,
+        ))
+        names.append(entry["name"])
+    return names
+
+
+class _PrecomputedListToolsResult(mcp_types.ServerResult):
+    """tools/list result whose serialized form is computed once."""
+
+    _dumped: Dict[Any, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        key = tuple(sorted(kwargs.items()))
+        if key not in self._dumped:
+            self._dumped[key] = super().model_dump(**kwargs)
+        return self._dumped[key]
+
+
+def serve_precomputed_tool_list(mcp: FastMCP) -> None:
+    """
+    Serve tools/list from a response computed on the first request.
+
+    FastMCP rebuilds every tool definition and serializes it again on each
+    tools/list request. Once registration is complete the catalog does not
+    change, so the first response is kept and replayed to every later client.
+    List middleware runs on the first request only.
+
+    Args:
+        mcp: FastMCP server whose tools are all registered
+    """
+    server = mcp._mcp_server
+    result: List[_PrecomputedListToolsResult] = []
+    lock = threading.Lock()
+
+    async def handler(request: Optional[mcp_types.ListToolsRequest]) -> mcp_types.ServerResult:
+        if not result:
+            tools = await mcp._mcp_list_tools()
+            with lock:
+                if not result:
+                    result.append(_PrecomputedListToolsResult(mcp_types.ListToolsResult(tools=tools)))
+                    server._tool_cache.clear()
+                    server._tool_cache.update({tool.name: tool for tool in tools})
+        return result[0]
+
+    server.request_handlers[mcp_types.ListToolsRequest] = handler
@@ -5,311 +5,86 @@ BV-BRC Miscellaneous NIAID SGC Tools
 This module contains MCP tools for querying miscellaneous NIAID SGC data from BV-BRC.
 """
 
-import json
-from typing import Optional
-
 from fastmcp import FastMCP
-# Global variables to store configuration
-_base_url = None
-
-from data_functions import (
-    query_misc_niaid_sgc_by_id,
-    query_misc_niaid_sgc_by_filters,
-    query_misc_niaid_sgc_by_genus,
-    query_misc_niaid_sgc_by_species,
-    query_misc_niaid_sgc_by_taxon_id,
-    query_misc_niaid_sgc_by_date_inserted_range,
-    query_misc_niaid_sgc_by_date_modified_range,
-    query_misc_niaid_sgc_by_keyword,
-    query_misc_niaid_sgc_all,
-    format_query_result
-)
-
-def register_misc_niaid_sgc_tools(mcp: FastMCP, base_url: str):
-    """Register all miscellaneous NIAID SGC-related MCP tools with the Flask app."""
-    global _base_url
-    _base_url = base_url
-    
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_id(target_id: str,
-                                       select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by target ID.
-        
-        Args:
-            target_id: The target ID to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_id(target_id, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by target ID: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_query_by_filters(filters_json: str,
-                                             select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Query miscellaneous NIAID SGC data by custom filters.
-        
-        Args:
-            filters_json: JSON string of filter criteria
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        try:
-            filters = json.loads(filters_json)
-        except json.JSONDecodeError as e:
-            return f"Error parsing filters JSON: {str(e)}"
-        
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_filters(filters, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by filters: {str(e)}"
-            }, indent=2)
 
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_genus(genus: str,
-                                          select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by genus.
-        
-        Args:
-            genus: The genus to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_genus(genus, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by genus: {str(e)}"
-            }, indent=2)
+from .spec_tools import tool_spec, register_spec_tools
 
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_species(species: str,
-                                            select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by species.
-        
-        Args:
-            species: The species to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_species(species, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by species: {str(e)}"
-            }, indent=2)
+TOOL_SPECS = [
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_id", "query_misc_niaid_sgc_by_id",
+        "Get miscellaneous NIAID SGC data by target ID.",
+        {
+            "target_id": "The target ID to query",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by target ID"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_query_by_filters", "query_misc_niaid_sgc_by_filters",
+        "Query miscellaneous NIAID SGC data by custom filters.",
+        {
+            "filters_json": "JSON string of filter criteria",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by filters"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_genus", "query_misc_niaid_sgc_by_genus",
+        "Get miscellaneous NIAID SGC data by genus.",
+        {
+            "genus": "The genus to query",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by genus"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_species", "query_misc_niaid_sgc_by_species",
+        "Get miscellaneous NIAID SGC data by species.",
+        {
+            "species": "The species to query",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by species"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_taxon_id", "query_misc_niaid_sgc_by_taxon_id",
+        "Get miscellaneous NIAID SGC data by taxon ID.",
+        {
+            "taxon_id": "The taxon ID to query",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by taxon ID"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_date_inserted_range", "query_misc_niaid_sgc_by_date_inserted_range",
+        "Get miscellaneous NIAID SGC data by date inserted range.",
+        {
+            "start_date": "Start date in YYYY-MM-DD format",
+            "end_date": "End date in YYYY-MM-DD format",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by date inserted range"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_by_date_modified_range", "query_misc_niaid_sgc_by_date_modified_range",
+        "Get miscellaneous NIAID SGC data by date modified range.",
+        {
+            "start_date": "Start date in YYYY-MM-DD format",
+            "end_date": "End date in YYYY-MM-DD format",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying miscellaneous NIAID SGC by date modified range"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_search_by_keyword", "query_misc_niaid_sgc_by_keyword",
+        "Search miscellaneous NIAID SGC data by keyword.",
+        {
+            "keyword": "The keyword to search for",
+        },
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error searching miscellaneous NIAID SGC by keyword"),
+    tool_spec(
+        "bvbrc_misc_niaid_sgc_get_all", "query_misc_niaid_sgc_all",
+        "Get all miscellaneous NIAID SGC data.",
+        {},
+        returns="Formatted miscellaneous NIAID SGC data",
+        error="Error querying all miscellaneous NIAID SGC data"),
+]
 
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_taxon_id(taxon_id: int,
-                                             select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by taxon ID.
-        
-        Args:
-            taxon_id: The taxon ID to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_taxon_id(taxon_id, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by taxon ID: {str(e)}"
-            }, indent=2)
 
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_date_inserted_range(start_date: str, end_date: str,
-                                                       select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by date inserted range.
-        
-        Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_date_inserted_range(start_date, end_date, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by date inserted range: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_by_date_modified_range(start_date: str, end_date: str,
-                                                        select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get miscellaneous NIAID SGC data by date modified range.
-        
-        Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_date_modified_range(start_date, end_date, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying miscellaneous NIAID SGC by date modified range: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_search_by_keyword(keyword: str,
-                                               select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Search miscellaneous NIAID SGC data by keyword.
-        
-        Args:
-            keyword: The keyword to search for
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_by_keyword(keyword, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error searching miscellaneous NIAID SGC by keyword: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_misc_niaid_sgc_get_all(select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get all miscellaneous NIAID SGC data.
-        
-        Args:
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted miscellaneous NIAID SGC data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_misc_niaid_sgc_all(options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying all miscellaneous NIAID SGC data: {str(e)}"
-            }, indent=2)
\ No newline at end of file
+def register_misc_niaid_sgc_tools(mcp: FastMCP, base_url: str):
+    """Register all miscellaneous NIAID SGC-related MCP tools with the Flask app."""
+    register_spec_tools(mcp, base_url, TOOL_SPECS)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+BV-BRC PPI Graph Tools
+
+This module contains the MCP tools answering neighborhood, path, degree and
+component queries on the protein-protein interaction graph of a genome or
+taxon, computed locally from a cached adjacency structure.
+"""
+
+import json
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from data_functions import (
+    ppi_components,
+    ppi_degree_ranking,
+    ppi_neighbors,
+    ppi_shortest_path,
+    query_result_json
+)
+
+
+def register_ppi_graph_tools(mcp: FastMCP, base_url: str):
+    """Register PPI graph MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_ppi_neighbors(protein: str, genome_id: Optional[str] = None, taxon_id: Optional[int] = None,
+                            hops: int = 1, limit: int = 1000) -> str:
+        """
+        Get the interaction partners of a protein, directly or within several hops.
+
+        Prefer this to chained bvbrc_ppi_get_by_interactor_a/_b calls: the
+        interactions of the genome or taxon are loaded once into a graph and
+        later calls are answered locally.
+
+        Args:
+            protein: The protein, as its interactor, feature ID or gene
+            genome_id: Genome whose interactions are searched (e.g., "83332.12")
+                (optional; give a genome_id or a taxon_id)
+            taxon_id: Taxon whose interactions are searched (optional)
+            hops: Most interactions between the protein and those returned
+                (default 1, direct partners)
+            limit: Most proteins returned, nearest first (default 1000)
+
+        Returns:
+            JSON string with count and results (interactor, feature_id, gene,
+            degree and distance of each protein; support, the number of
+            interaction records, for direct partners)
+        """
+        try:
+            results, count = ppi_neighbors(protein, hops, limit, genome_id, taxon_id, base_url)
+            return query_result_json(results, count)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error getting protein interaction neighbors: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_ppi_shortest_path(source: str, target: str, genome_id: Optional[str] = None,
+                                taxon_id: Optional[int] = None) -> str:
+        """
+        Get a shortest chain of interactions linking two proteins.
+
+        Args:
+            source: The first protein, as its interactor, feature ID or gene
+            target: The last protein, as its interactor, feature ID or gene
+            genome_id: Genome whose interactions are searched (e.g., "83332.12")
+                (optional; give a genome_id or a taxon_id)
+            taxon_id: Taxon whose interactions are searched (optional)
+
+        Returns:
+            JSON string with the length of the path (number of interactions)
+            and its proteins from source to target; path is null when the
+            proteins are not connected
+        """
+        try:
+            path = ppi_shortest_path(source, target, genome_id, taxon_id, base_url)
+            return json.dumps({
+                "length": len(path) - 1 if path is not None else None,
+                "path": path
+            }, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error finding protein interaction path: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_ppi_degree_ranking(genome_id: Optional[str] = None, taxon_id: Optional[int] = None,
+                                 limit: int = 20) -> str:
+        """
+        Rank the proteins of a genome or taxon by number of interaction partners.
+
+        Args:
+            genome_id: Genome whose interactions are ranked (e.g., "83332.12")
+                (optional; give a genome_id or a taxon_id)
+            taxon_id: Taxon whose interactions are ranked (optional)
+            limit: Most proteins returned (default 20)
+
+        Returns:
+            JSON string with count (proteins in the graph) and results
+            (interactor, feature_id, gene and degree, highest degree first)
+        """
+        try:
+            results, count = ppi_degree_ranking(limit, genome_id, taxon_id, base_url)
+            return query_result_json(results, count)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error ranking protein interactions: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_ppi_components(genome_id: Optional[str] = None, taxon_id: Optional[int] = None,
+                             protein: Optional[str] = None, limit: int = 20, members: int = 100) -> str:
+        """
+        Get the connected components of the interaction graph of a genome or taxon.
+
+        Args:
+            genome_id: Genome whose interactions are searched (e.g., "83332.12")
+                (optional; give a genome_id or a taxon_id)
+            taxon_id: Taxon whose interactions are searched (optional)
+            protein: Only the component of this protein, as its interactor,
+                feature ID or gene (optional)
+            limit: Most components returned, largest first (default 20)
+            members: Most proteins listed per component, by degree (default 100)
+
+        Returns:
+            JSON string with the counts of proteins, interactions and
+            components, and each component's size and members
+        """
+        try:
+            return json.dumps(ppi_components(protein, limit, members, genome_id, taxon_id, base_url), indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error getting protein interaction components: {str(e)}"
+            }, indent=2)
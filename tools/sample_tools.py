@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Sample Tools
+
+This module contains the MCP tool drawing random samples of large cores.
+"""
+
+import json
+import random
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from data_functions import (
+    sample_query,
+    filters_q_expr,
+    query_result_json,
+    UnknownFieldError
+)
+
+
+def register_sample_tools(mcp: FastMCP, base_url: str):
+    """Register random sample MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_sample(core: str, n: int = 100, filters_json: Optional[str] = None,
+                     q: Optional[str] = None, seed: Optional[int] = None,
+                     select: Optional[str] = None) -> str:
+        """
+        Get a random sample of the records matching a query, instead of all of them.
+
+        Use it to explore very large cores (genome_feature, protein_feature,
+        sequence_feature): the sample is drawn with one page fetch per shard,
+        never a full scan, and the same seed returns the same sample.
+
+        Args:
+            core: The core/collection name (e.g., "genome_feature")
+            n: Sample size, at most 10000 (default 100)
+            filters_json: JSON string of field filters combined with AND,
+                e.g. '{"genus": "Escherichia"}' (optional)
+            q: Solr query expression, instead of filters_json (optional, all
+                records if neither is given)
+            seed: Seed of the sample (optional, random if omitted; returned
+                with the sample to draw it again)
+            select: Comma-separated list of fields to select (optional)
+
+        Returns:
+            JSON string with count (records in the sample), total (records
+            matching the query), seed, method ("random_sort" for a uniform
+            sample, "shard_offsets" for an approximate sample of small pages
+            at random offsets of equal shards, in unique key order) and
+            results
+        """
+        try:
+            q_expr = q or "*:*"
+            if filters_json:
+                if q:
+                    raise ValueError("Give either filters_json or q, not both")
+                filters = json.loads(filters_json)
+                q_expr = filters_q_expr(filters) if filters else "*:*"
+        except (ValueError, json.JSONDecodeError) as e:
+            return json.dumps({
+                "error": f"Error parsing sample request: {str(e)}"
+            }, indent=2)
+
+        if seed is None:
+            seed = random.randrange(2 ** 31)
+        options = {"raw": True}
+        if select:
+            options["select"] = select.split(",")
+
+        try:
+            result, count, info = sample_query(core, q_expr, n, abs(seed), options, base_url)
+            return query_result_json(result, count, {"total": info["total"], "seed": abs(seed),
+                                                     "method": info["method"]})
+        except UnknownFieldError as e:
+            return json.dumps(e.payload(), indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error sampling {core}: {str(e)}"
+            }, indent=2)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Spec Tools
+
+This module generates MCP tools from declarative tool specs. Each spec names
+the tool, the generated query function it wraps, and the text of its
+docstring; the parameters and their types come from the query function spec,
+so a tool always matches the function it calls.
+"""
+
+import json
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from fastmcp import FastMCP
+
+import data_functions
+from data_functions.deadline_functions import tool_time_budget
+from data_functions.preflight_functions import QueryTooLargeError
+from data_functions.query_spec_functions import FILTERS, get_query_spec, specialize_function
+from data_functions.schema_functions import UnknownFieldError
+from data_functions.spill_functions import query_result_json
+
+_SELECT_DOC = "select: Comma-separated list of fields to select (optional)"
+_SORT_DOC = "sort: Field to sort by (optional)"
+_DESCENDANTS_DOC = ("include_descendants: Also match the records of every taxon below taxon_id, "
+                    "e.g. the species and strains of a genus (default false)")
+_TIME_BUDGET_DOC = ("time_budget: Seconds to spend fetching records before returning the records "
+                    "fetched so far with a continuation token (optional, server default if omitted)")
+
+_TOOL_ANNOTATIONS = {
+    "select": Optional[str],
+    "sort": Optional[str],
+    "time_budget": Optional[float],
+    "return": str,
+}
+_TOOL_DEFAULTS = {"include_descendants": False, "select": None, "sort": None, "time_budget": None}
+
+
+def tool_spec(name: str, function: str, summary: str, params: Dict[str, str],
+              returns: str, error: str) -> Dict[str, Any]:
+    """
+    Declare an MCP tool wrapping a generated query function.
+
+    Args:
+        name: Tool name (e.g., "bvbrc_genome_get_by_id")
+        function: Query function name (e.g., "query_genome_by_id")
+        summary: First line of the tool description
+        params: Description of each query parameter, in order
+        returns: Description of the return value
+        error: Prefix of the error message when the query fails
+
+    Returns:
+        Tool spec dictionary
+    """
+    return {
+        "name": name,
+        "function": function,
+        "summary": summary,
+        "params": params,
+        "returns": returns,
+        "error": error,
+    }
+
+
+def build_tool_options(select: Optional[str], sort: Optional[str],
+                       time_budget: Optional[float] = None, descendants: bool = False) -> Dict[str, Any]:
+    """
+    Build the query options of a tool call.
+
+    Args:
+        select: Comma-separated list of fields to select (optional)
+        sort: Field to sort by (optional)
+        time_budget: Seconds to spend fetching records (optional, the server
+            default otherwise)
+        descendants: Expand a taxon ID query to the descendant taxa
+
+    Returns:
+        Query options
+    """
+    # Tool results are only re-serialized, so the upstream docs can pass through raw
+    options = {"raw": True, "time_budget": tool_time_budget(time_budget)}
+    if select:
+        options["select"] = select.split(",")
+    if sort:
+        options["sort"] = sort
+    if descendants:
+        options["descendants"] = True
+    return options
+
+
+def run_query_tool(query_fn: Callable[..., Any], error: str, base_url: str,
+                   args: tuple, select: Optional[str], sort: Optional[str],
+                   time_budget: Optional[float] = None, descendants: bool = False) -> str:
+    """
+    Run a query function and format the MCP tool response.
+
+    Args:
+        query_fn: Query function to call
+        error: Prefix of the error message when the query fails
+        base_url: BV-BRC API base URL
+        args: Positional query arguments
+        select: Comma-separated list of fields to select (optional)
+        sort: Field to sort by (optional)
+        time_budget: Seconds to spend fetching records (optional)
+        descendants: Expand a taxon ID query to the descendant taxa
+
+    Returns:
+        JSON string with count and results (and the spill handle of a result
+        set too large to hold in memory, or partial and a continuation token
+        when the time budget ran out), or an error (with the estimated count
+        and suggested facets when the query is too large to run, or the
+        closest field names when it names unknown fields)
+    """
+    options = build_tool_options(select, sort, time_budget, descendants)
+
+    try:
+        result, count = query_fn(*args, options, base_url)
+        return query_result_json(result, count)
+    except (QueryTooLargeError, UnknownFieldError) as e:
+        return json.dumps(e.payload(), indent=2)
+    except Exception as e:
+        return json.dumps({
+            "error": f"{error}: {str(e)}"
+        }, indent=2)
+
+
+def run_filters_tool(query_fn: Callable[..., Any], error: str, base_url: str,
+                     args: tuple, select: Optional[str], sort: Optional[str],
+                     time_budget: Optional[float] = None) -> str:
+    """
+    Parse a filters JSON argument and run a filters query function.
+
+    Args:
+        query_fn: Filters query function to call
+        error: Prefix of the error message when the query fails
+        base_url: BV-BRC API base URL
+        args: Single-element tuple holding the filters JSON string
+        select: Comma-separated list of fields to select (optional)
+        sort: Field to sort by (optional)
+        time_budget: Seconds to spend fetching records (optional)
+
+    Returns:
+        JSON string with count and results, or an error
+    """
+    try:
+        filters = json.loads(args[0])
+    except json.JSONDecodeError as e:
+        return json.dumps({
+            "error": f"Error parsing filters JSON: {str(e)}"
+        }, indent=2)
+
+    return run_query_tool(query_fn, error, base_url, (filters,), select, sort, time_budget)
+
+
+def _tool_doc(spec: Dict[str, Any], taxon: bool = False) -> str:
+    lines = [spec["summary"], "", "Args:"]
+    lines += [f"    {param}: {description}" for param, description in spec["params"].items()]
+    if taxon:
+        lines.append(f"    {_DESCENDANTS_DOC}")
+    lines += [f"    {_SELECT_DOC}", f"    {_SORT_DOC}", f"    {_TIME_BUDGET_DOC}"]
+    lines += ["", "Returns:", f"    {spec['returns']}"]
+    return "\n".join(lines)
+
+
+def make_tool_function(spec: Dict[str, Any], base_url: str) -> Callable[..., str]:
+    """
+    Generate the MCP tool function for a tool spec.
+
+    Args:
+        spec: Tool spec
+        base_url: BV-BRC API base URL
+
+    Returns:
+        Tool function with a typed signature and docstring
+    """
+    query_fn = getattr(data_functions, spec["function"])
+    query_spec = get_query_spec(spec["function"])
+    if query_spec["kind"] == FILTERS:
+        params = [("filters_json", str)]
+        runner = run_filters_tool
+    else:
+        params = query_spec["params"]
+        runner = run_query_tool
+
+    names = [param for param, _ in params]
+    if names != list(spec["params"]):
+        raise ValueError(f"Tool {spec['name']} documents {list(spec['params'])}, "
+                         f"but {spec['function']} takes {names}")
+
+    run = partial(runner, query_fn, spec["error"], base_url)
+    count = len(params)
+    annotations = dict(params)
+    # Taxon ID tools can be expanded to the descendant taxa
+    taxon = bool(query_spec.get("taxon"))
+    if taxon:
+        annotations["include_descendants"] = bool
+
+        def impl(value, include_descendants, select, sort, time_budget):
+            return run((value,), select, sort, time_budget, include_descendants)
+    else:
+        def impl(*args):
+            return run(args[:count], *args[count:])
+    annotations.update(_TOOL_ANNOTATIONS)
+    return specialize_function(
+        impl,
+        spec["name"],
+        annotations,
+        _TOOL_DEFAULTS,
+        __name__,
+        _tool_doc(spec, taxon)
+    )
+
+
+def register_spec_tools(mcp: FastMCP, base_url: str, specs: List[Dict[str, Any]]) -> None:
+    """
+    Register the MCP tools declared by a list of tool specs.
+
+    Args:
+        mcp: FastMCP server
+        base_url: BV-BRC API base URL
+        specs: Tool specs
+    """
+    for spec in specs:
+        mcp.tool()(make_tool_function(spec, base_url))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Spill Tools
+
+This module contains MCP tools for reading result sets that were too large to
+hold in memory and were spilled to disk.
+"""
+
+import json
+
+from fastmcp import FastMCP
+
+from data_functions import read_spill_page, release_spill
+
+
+def register_spill_tools(mcp: FastMCP, base_url: str):
+    """Register spilled result MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_spill_page(handle: str, offset: int = 0, limit: int = 100) -> str:
+        """
+        Read a page of records from a spilled result set.
+
+        Args:
+            handle: Spill handle from the "spilled" field of a query result
+            offset: Index of the first record to return (default 0)
+            limit: Maximum number of records to return (default 100)
+
+        Returns:
+            JSON string with count, offset and results
+        """
+        try:
+            result, count = read_spill_page(handle, offset, limit)
+            return json.dumps({
+                "count": count,
+                "offset": offset,
+                "results": result
+            }, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error reading spilled results: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_spill_release(handle: str) -> str:
+        """
+        Delete a spilled result set once it is no longer needed.
+
+        Args:
+            handle: Spill handle from the "spilled" field of a query result
+
+        Returns:
+            JSON string with the handle and whether it was released
+        """
+        try:
+            return json.dumps({
+                "handle": handle,
+                "released": release_spill(handle)
+            }, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error releasing spilled results: {str(e)}"
+            }, indent=2)
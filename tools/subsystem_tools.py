@@ -5,389 +5,101 @@ BV-BRC Subsystem Tools
 This module contains MCP tools for querying subsystem data from BV-BRC.
 """
 
-import json
-from typing import Optional
-
 from fastmcp import FastMCP
-# Global variables to store configuration
-_base_url = None
-
-from data_functions import (
-    query_subsystem_by_id,
-    query_subsystem_by_filters,
-    query_subsystem_by_active,
-    query_subsystem_by_class,
-    query_subsystem_by_feature_id,
-    query_subsystem_by_gene,
-    query_subsystem_by_genome_id,
-    query_subsystem_by_genome_name,
-    query_subsystem_by_owner,
-    query_subsystem_by_patric_id,
-    query_subsystem_by_product,
-    query_subsystem_by_public_status,
-    query_subsystem_by_refseq_locus_tag,
-    query_subsystem_by_role_id,
-    query_subsystem_by_role_name,
-    query_subsystem_by_subclass,
-    query_subsystem_by_subsystem_id,
-    query_subsystem_by_subsystem_name,
-    query_subsystem_by_superclass,
-    query_subsystem_by_taxon_id,
-    query_subsystem_by_user_read,
-    query_subsystem_by_user_write,
-    query_subsystem_by_date_inserted_range,
-    query_subsystem_by_date_modified_range,
-    query_subsystem_by_keyword,
-    query_subsystem_all,
-    format_query_result
-)
-
-def register_subsystem_tools(mcp: FastMCP, base_url: str):
-    """Register all subsystem-related MCP tools with the Flask app."""
-    global _base_url
-    _base_url = base_url
-    
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_id(id: str,
-                                 select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by ID.
-        
-        Args:
-            id: The ID to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_id(id, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by ID: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_query_by_filters(filters_json: str,
-                                        select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Query subsystem data by custom filters.
-        
-        Args:
-            filters_json: JSON string of filter criteria
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        try:
-            filters = json.loads(filters_json)
-        except json.JSONDecodeError as e:
-            return f"Error parsing filters JSON: {str(e)}"
-        
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_filters(filters, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by filters: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_subsystem_name(subsystem_name: str,
-                                             select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by subsystem name.
-        
-        Args:
-            subsystem_name: The subsystem name to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_subsystem_name(subsystem_name, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by subsystem name: {str(e)}"
-            }, indent=2)
 
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_genome_id(genome_id: str,
-                                         select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by genome ID.
-        
-        Args:
-            genome_id: The genome ID to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_genome_id(genome_id, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by genome ID: {str(e)}"
-            }, indent=2)
+from .spec_tools import tool_spec, register_spec_tools
 
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_gene(gene: str,
-                                    select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by gene.
-        
-        Args:
-            gene: The gene to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_gene(gene, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by gene: {str(e)}"
-            }, indent=2)
+TOOL_SPECS = [
+    tool_spec(
+        "bvbrc_subsystem_get_by_id", "query_subsystem_by_id",
+        "Get subsystem data by ID.",
+        {
+            "id": "The ID to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by ID"),
+    tool_spec(
+        "bvbrc_subsystem_query_by_filters", "query_subsystem_by_filters",
+        "Query subsystem data by custom filters.",
+        {
+            "filters_json": "JSON string of filter criteria",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by filters"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_subsystem_name", "query_subsystem_by_subsystem_name",
+        "Get subsystem data by subsystem name.",
+        {
+            "subsystem_name": "The subsystem name to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by subsystem name"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_genome_id", "query_subsystem_by_genome_id",
+        "Get subsystem data by genome ID.",
+        {
+            "genome_id": "The genome ID to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by genome ID"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_gene", "query_subsystem_by_gene",
+        "Get subsystem data by gene.",
+        {
+            "gene": "The gene to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by gene"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_role_name", "query_subsystem_by_role_name",
+        "Get subsystem data by role name.",
+        {
+            "role_name": "The role name to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by role name"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_class", "query_subsystem_by_class",
+        "Get subsystem data by class.",
+        {
+            "class_name": "The class to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by class"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_superclass", "query_subsystem_by_superclass",
+        "Get subsystem data by superclass.",
+        {
+            "superclass": "The superclass to query",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by superclass"),
+    tool_spec(
+        "bvbrc_subsystem_get_by_date_inserted_range", "query_subsystem_by_date_inserted_range",
+        "Get subsystem data by date inserted range.",
+        {
+            "start_date": "Start date in YYYY-MM-DD format",
+            "end_date": "End date in YYYY-MM-DD format",
+        },
+        returns="Formatted subsystem data",
+        error="Error querying subsystem by date inserted range"),
+    tool_spec(
+        "bvbrc_subsystem_search_by_keyword", "query_subsystem_by_keyword",
+        "Search subsystem data by keyword.",
+        {
+            "keyword": "The keyword to search for",
+        },
+        returns="Formatted subsystem data",
+        error="Error searching subsystem by keyword"),
+    tool_spec(
+        "bvbrc_subsystem_get_all", "query_subsystem_all",
+        "Get all subsystem data.",
+        {},
+        returns="Formatted subsystem data",
+        error="Error querying all subsystem data"),
+]
 
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_role_name(role_name: str,
-                                         select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by role name.
-        
-        Args:
-            role_name: The role name to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_role_name(role_name, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by role name: {str(e)}"
-            }, indent=2)
 
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_class(class_name: str,
-                                    select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by class.
-        
-        Args:
-            class_name: The class to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_class(class_name, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by class: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_superclass(superclass: str,
-                                         select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by superclass.
-        
-        Args:
-            superclass: The superclass to query
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_superclass(superclass, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by superclass: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_get_by_date_inserted_range(start_date: str, end_date: str,
-                                                   select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get subsystem data by date inserted range.
-        
-        Args:
-            start_date: Start date in YYYY-MM-DD format
-            end_date: End date in YYYY-MM-DD format
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_date_inserted_range(start_date, end_date, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying subsystem by date inserted range: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_search_by_keyword(keyword: str,
-                                          select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Search subsystem data by keyword.
-        
-        Args:
-            keyword: The keyword to search for
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_by_keyword(keyword, options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error searching subsystem by keyword: {str(e)}"
-            }, indent=2)
-
-    @mcp.tool()
-    def bvbrc_subsystem_get_all(select: Optional[str] = None, sort: Optional[str] = None) -> str:
-        """
-        Get all subsystem data.
-        
-        Args:
-            select: Comma-separated list of fields to select (optional)
-            sort: Field to sort by (optional)
-        
-        Returns:
-            Formatted subsystem data
-        """
-        options = {}
-        if select:
-            options["select"] = select.split(",")
-        if sort:
-            options["sort"] = sort
-        
-        try:
-            result, count = query_subsystem_all(options, _base_url)
-            return json.dumps({
-                "count": count,
-                "results": result
-            }, indent=2)
-        except Exception as e:
-            return json.dumps({
-                "error": f"Error querying all subsystem data: {str(e)}"
-            }, indent=2)
\ No newline at end of file
+def register_subsystem_tools(mcp: FastMCP, base_url: str):
+    """Register all subsystem-related MCP tools with the Flask app."""
+    register_spec_tools(mcp, base_url, TOOL_SPECS)
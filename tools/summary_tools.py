@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Summary Tools
+
+This module contains the MCP tool summarizing the fields of large result
+sets with streaming sketches.
+"""
+
+import json
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from data_functions import (
+    summarize_query,
+    filters_q_expr,
+    tool_time_budget,
+    QueryTooLargeError,
+    UnknownFieldError
+)
+
+
+def register_summary_tools(mcp: FastMCP, base_url: str):
+    """Register result summary MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_summarize(core: str, fields: str, filters_json: Optional[str] = None,
+                        q: Optional[str] = None, top: int = 10, quantiles: Optional[str] = None,
+                        time_budget: Optional[float] = None) -> str:
+        """
+        Summarize fields of all records matching a query, without returning the records.
+
+        Streams every matching record through sketches in bounded memory, so it
+        answers questions such as "how many distinct genomes have this product"
+        or "the distribution of fpkm in an experiment" over millions of records.
+
+        Args:
+            core: The core/collection name (e.g., "genome_feature", "bioset_result")
+            fields: Comma-separated fields to summarize (e.g., "genome_id,fpkm")
+            filters_json: JSON string of field filters combined with AND,
+                e.g. '{"product": "Beta-lactamase"}' (optional)
+            q: Solr query expression, instead of filters_json (optional, all
+                records if neither is given)
+            top: Number of most frequent values per field (default 10)
+            quantiles: Comma-separated quantiles of numeric fields, between 0
+                and 1 (optional, default "0.01,0.05,0.25,0.5,0.75,0.95,0.99")
+            time_budget: Seconds to spend streaming records before summarizing
+                the records seen so far, marked partial (optional, no limit
+                if omitted)
+
+        Returns:
+            JSON string with the count of records summarized and, per field,
+            the distinct count (approximate), the most frequent values, and
+            the min, max, mean and quantiles (approximate) of numeric values
+        """
+        try:
+            q_expr = q or "*:*"
+            if filters_json:
+                if q:
+                    raise ValueError("Give either filters_json or q, not both")
+                filters = json.loads(filters_json)
+                q_expr = filters_q_expr(filters) if filters else "*:*"
+            # Summaries hold no records, so only a budget the caller asks for applies
+            options = {"top": top}
+            if time_budget is not None:
+                options["time_budget"] = tool_time_budget(time_budget)
+            if quantiles:
+                options["quantiles"] = [float(value) for value in quantiles.split(",")]
+                if not all(0 <= value <= 1 for value in options["quantiles"]):
+                    raise ValueError("Quantiles must be between 0 and 1")
+        except (ValueError, json.JSONDecodeError) as e:
+            return json.dumps({
+                "error": f"Error parsing summary request: {str(e)}"
+            }, indent=2)
+
+        try:
+            summary, count = summarize_query(core, q_expr, [field.strip() for field in fields.split(",")],
+                                             options, base_url)
+            del summary["records"]
+            return json.dumps(dict({"count": count}, **summary), indent=2, default=str)
+        except (QueryTooLargeError, UnknownFieldError) as e:
+            return json.dumps(e.payload(), indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error summarizing {core}: {str(e)}"
+            }, indent=2)
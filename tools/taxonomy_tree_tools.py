@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Taxonomy Tree Tools
+
+This module contains the MCP tools answering lineage, descendant, ancestor
+and lowest common ancestor questions from the in-memory taxonomy tree.
+"""
+
+import json
+from typing import Optional
+
+from fastmcp import FastMCP
+
+from data_functions import (
+    query_result_json,
+    taxonomy_descendants,
+    taxonomy_is_ancestor,
+    taxonomy_lca,
+    taxonomy_lineage
+)
+
+
+def _taxon_ids(taxon_ids: str):
+    return [int(taxon_id) for taxon_id in taxon_ids.split(",") if taxon_id.strip()]
+
+
+def register_taxonomy_tree_tools(mcp: FastMCP, base_url: str):
+    """Register taxonomy tree MCP tools with the Flask app."""
+
+    @mcp.tool()
+    def bvbrc_taxonomy_tree_lineage(taxon_id: int) -> str:
+        """
+        Get the lineage of a taxon, from the root down to the taxon.
+
+        Answered from the local taxonomy tree, which is built from the
+        taxonomy core on first use.
+
+        Args:
+            taxon_id: Taxon ID (e.g., 1773)
+
+        Returns:
+            JSON string with count and results (taxon_id, taxon_name,
+            taxon_rank and depth of each taxon of the lineage)
+        """
+        try:
+            results = taxonomy_lineage(taxon_id, base_url)
+            return query_result_json(results, len(results))
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error getting taxonomy lineage: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_taxonomy_tree_descendants(taxon_id: int, rank: Optional[str] = None,
+                                        limit: int = 1000, offset: int = 0) -> str:
+        """
+        Get the descendants of a taxon, optionally of one rank only.
+
+        Prefer this to repeated bvbrc_taxonomy_get_by_parent_id calls: the
+        whole subtree is answered from the local taxonomy tree.
+
+        Args:
+            taxon_id: Taxon ID (e.g., 1763)
+            rank: Only descendants of this rank, e.g. "species" or "strain" (optional)
+            limit: Most descendants returned (default 1000)
+            offset: Descendants skipped before the first returned (default 0)
+
+        Returns:
+            JSON string with count (all matching descendants) and results
+            (taxon_id, taxon_name, taxon_rank and depth, depth-first)
+        """
+        try:
+            results, count = taxonomy_descendants(taxon_id, rank, limit, offset, base_url)
+            return query_result_json(results, count)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error getting taxonomy descendants: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_taxonomy_tree_lca(taxon_ids: str) -> str:
+        """
+        Get the lowest common ancestor of taxa.
+
+        Args:
+            taxon_ids: Comma-separated taxon IDs (e.g., "1773,1765")
+
+        Returns:
+            JSON string with the lowest common ancestor (taxon_id,
+            taxon_name, taxon_rank and depth; null when the taxa share no root)
+        """
+        try:
+            return json.dumps({"lca": taxonomy_lca(_taxon_ids(taxon_ids), base_url)}, indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error getting taxonomy lowest common ancestor: {str(e)}"
+            }, indent=2)
+
+    @mcp.tool()
+    def bvbrc_taxonomy_tree_is_ancestor(ancestor_id: int, taxon_ids: str) -> str:
+        """
+        Check whether a taxon is an ancestor of other taxa.
+
+        Args:
+            ancestor_id: Taxon ID of the candidate ancestor (e.g., 1763)
+            taxon_ids: Comma-separated taxon IDs checked (e.g., "1773,562")
+
+        Returns:
+            JSON string mapping each taxon ID to true when ancestor_id is the
+            taxon itself or one of its ancestors
+        """
+        try:
+            return json.dumps(taxonomy_is_ancestor(ancestor_id, _taxon_ids(taxon_ids), base_url), indent=2)
+        except Exception as e:
+            return json.dumps({
+                "error": f"Error checking taxonomy ancestors: {str(e)}"
+            }, indent=2)
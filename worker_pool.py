@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+BV-BRC Worker Pool
+
+Runs the HTTP MCP server as N worker processes behind one port. Each worker
+is a full server listening on a private loopback port; a small front proxy on
+the public port forwards requests to them. New MCP sessions are spread across
+the workers round-robin, and every later request of a session (identified by
+its Mcp-Session-Id header) is sent to the worker that created it, so
+per-session state such as cursor continuations stays on one process.
+Sessions idle for longer than the session TTL, or beyond the session cap,
+are forgotten, and a worker that dies is restarted with its sessions dropped.
+
+Workers share upstream responses through the shared cache
+(data_functions.shared_cache_functions).
+"""
+
+import itertools
+import multiprocessing
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+SESSION_HEADER = "mcp-session-id"
+
+# Hop-by-hop headers are not forwarded by the proxy
+_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "host",
+}
+
+
+class SessionRouter:
+    """
+    Assigns MCP sessions to workers and remembers the assignment.
+
+    Sessions are kept least recently used last: a session idle for ttl
+    seconds, or the oldest beyond max_sessions, is forgotten, so clients that
+    disconnect without a DELETE do not grow the map without bound.
+    """
+
+    def __init__(self, workers: int, ttl: float = 3600.0, max_sessions: int = 10000):
+        self.workers = workers
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._next = itertools.cycle(range(workers))
+        # {session_id: (worker, last use)}, least recently used first
+        self._sessions: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            session_id, (_, last_use) = next(iter(self._sessions.items()))
+            if now - last_use < self.ttl and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[session_id]
+
+    def route(self, session_id: str = None) -> int:
+        """Return the worker of a session, or the next worker for a new one."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._sessions.get(session_id) if session_id else None
+            if entry is not None:
+                self._sessions[session_id] = (entry[0], now)
+                self._sessions.move_to_end(session_id)
+                return entry[0]
+            return next(self._next)
+
+    def bind(self, session_id: str, worker: int) -> None:
+        """Pin a session to the worker that created it."""
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = (worker, now)
+            self._sessions.move_to_end(session_id)
+            self._expire(now)
+
+    def release(self, session_id: str) -> None:
+        """Forget a terminated session."""
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def drop_worker(self, worker: int) -> None:
+        """Forget the sessions of a worker, whose state was lost when it restarted."""
+        with self._lock:
+            for session_id in [sid for sid, (w, _) in self._sessions.items() if w == worker]:
+                del self._sessions[session_id]
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of sessions pinned to each worker."""
+        counts = {str(worker): 0 for worker in range(self.workers)}
+        with self._lock:
+            self._expire(time.monotonic())
+            for worker, _ in self._sessions.values():
+                counts[str(worker)] += 1
+        return counts
+
+
+def create_proxy_app(worker_urls: List[str], router: SessionRouter = None) -> Starlette:
+    """
+    Create the front proxy application.
+
+    Args:
+        worker_urls: Base URLs of the workers (e.g., "http://127.0.0.1:9001")
+        router: Session router shared with the worker supervisor (optional)
+
+    Returns:
+        Starlette application forwarding every request to a worker
+    """
+    router = router or SessionRouter(len(worker_urls))
+    client = httpx.AsyncClient(timeout=None)
+
+    async def proxy(request: Request) -> Response:
+        session_id = request.headers.get(SESSION_HEADER)
+        worker = router.route(session_id)
+        url = httpx.URL(worker_urls[worker]).copy_with(
+            path=request.url.path,
+            query=request.url.query.encode("utf-8")
+        )
+        headers = [
+            (name, value) for name, value in request.headers.raw
+            if name.decode("latin-1").lower() not in _HOP_HEADERS
+        ]
+        upstream = await client.send(
+            client.build_request(request.method, url, headers=headers, content=request.stream()),
+            stream=True
+        )
+
+        new_session = upstream.headers.get(SESSION_HEADER)
+        if new_session:
+            router.bind(new_session, worker)
+        if request.method == "DELETE" and session_id:
+            router.release(session_id)
+
+        response = StreamingResponse(
+            upstream.aiter_raw(),
+            status_code=upstream.status_code,
+            background=BackgroundTask(upstream.aclose)
+        )
+        # Raw pairs keep repeated headers such as set-cookie
+        response.raw_headers = [
+            (name.lower(), value) for name, value in upstream.headers.raw
+            if name.decode("latin-1").lower() not in _HOP_HEADERS
+        ]
+        return response
+
+    async def pool_status(request: Request) -> Response:
+        return JSONResponse({"workers": worker_urls, "sessions": router.stats()})
+
+    methods = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "HEAD"]
+    return Starlette(
+        routes=[
+            Route("/pool/status", pool_status, methods=["GET"]),
+            Route("/{path:path}", proxy, methods=methods),
+        ],
+        on_shutdown=[client.aclose]
+    )
+
+
+def _supervise(start_worker: Callable[[int], multiprocessing.Process], processes: List[multiprocessing.Process],
+               router: SessionRouter, stop: threading.Event) -> None:
+    # Restart dead workers; the sessions they held are gone with their state
+    while not stop.wait(1.0):
+        for i, process in enumerate(processes):
+            if process.is_alive() or stop.is_set():
+                continue
+            print(f"Worker {i} exited with code {process.exitcode}; restarting it", file=sys.stderr)
+            router.drop_worker(i)
+            processes[i] = start_worker(i)
+
+
+def run_worker_pool(run_worker: Callable[[int], None], host: str, port: int,
+                    workers: int, worker_base_port: int = None, session_ttl: float = None,
+                    max_sessions: int = None) -> int:
+    """
+    Start the worker processes and serve the front proxy until interrupted.
+
+    Args:
+        run_worker: Picklable function that serves one worker on the given port
+        host: Public host of the front proxy
+        port: Public port of the front proxy
+        workers: Number of worker processes
+        worker_base_port: First loopback port used by the workers (default port + 1)
+        session_ttl: Seconds an idle session stays pinned to its worker (default 3600)
+        max_sessions: Most sessions pinned at once (default 10000)
+
+    Returns:
+        Process exit code
+    """
+    worker_base_port = worker_base_port or port + 1
+    worker_ports = [worker_base_port + i for i in range(workers)]
+
+    # spawn gives every worker a fresh interpreter (no forked sockets or threads)
+    context = multiprocessing.get_context("spawn")
+
+    def start_worker(i: int) -> multiprocessing.Process:
+        process = context.Process(target=run_worker, args=(worker_ports[i],), name=f"bvbrc-worker-{i}", daemon=True)
+        process.start()
+        return process
+
+    processes = [start_worker(i) for i in range(workers)]
+    print(f"Started {workers} workers on ports {worker_ports[0]}-{worker_ports[-1]}", file=sys.stderr)
+
+    router = SessionRouter(
+        workers,
+        ttl=3600.0 if session_ttl is None else float(session_ttl),
+        max_sessions=10000 if max_sessions is None else int(max_sessions)
+    )
+    stop = threading.Event()
+    supervisor = threading.Thread(target=_supervise, args=(start_worker, processes, router, stop),
+                                  name="bvbrc-worker-supervisor", daemon=True)
+    supervisor.start()
+    try:
+        app = create_proxy_app([f"http://127.0.0.1:{worker_port}" for worker_port in worker_ports], router)
+        uvicorn.run(app, host=host, port=port, log_level="warning")
+    finally:
+        stop.set()
+        supervisor.join(timeout=5)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=10)
+    return 0